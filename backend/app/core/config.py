@@ -1,5 +1,8 @@
+import os
+import tempfile
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "SlideGenie AI"
@@ -15,8 +18,99 @@ class Settings(BaseSettings):
     
     # AI Config
     OPENAI_API_KEY: str | None = None
+    OPENAI_BASE_URL: str | None = None  # any OpenAI-compatible endpoint, e.g. the local benchmark server
     MOCK_AI: bool = False
 
+    # Outbound OpenAI Scheduling (shared by every service; 0 disables a rate limit)
+    SCHEDULER_ENABLED: bool = True
+    OPENAI_MAX_IN_FLIGHT: int = 16
+    OPENAI_REQUESTS_PER_MINUTE: int = 500
+    OPENAI_TOKENS_PER_MINUTE: int = 200000
+    OPENAI_MAX_RETRIES: int = 4  # on 429 / transient errors, with jittered exponential backoff
+    OPENAI_BACKOFF_BASE: float = 1.0
+
+    # Outbound HTTP (pooled clients shared by every service, closed on shutdown)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 32  # keep >= OPENAI_MAX_IN_FLIGHT so bursts reuse warm connections
+    HTTP_KEEPALIVE_EXPIRY: float = 60.0  # seconds an idle connection stays in the pool
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_READ_TIMEOUT: float = 60.0
+    HTTP2_ENABLED: bool = True  # takes effect when the h2 package is installed (pip install h2)
+
+    # Quality Gate
+    SCORE_THRESHOLD: int = 75  # minimum confidence score for a slide to pass
+    DOMAIN_SCORE_THRESHOLDS: dict[str, int] = {}  # per-domain overrides, e.g. {"medicine": 85}
+    SLIDE_MAX_ATTEMPTS: int = 3
+    LOCAL_PRESCORE_ENABLED: bool = True  # decide clearly good/bad slides locally, score only borderline ones remotely
+    PRESCORE_PASS: int = 90  # local score at/above which a slide passes without a remote score
+    PRESCORE_FAIL: int = 40  # local score at/below which a slide fails without a remote score
+    DECK_RETRY_BUDGET: float = 1.0  # retries shared by the whole deck: ceil(slide count x this)
+    DECK_TIME_BUDGET_SECONDS: float = 60.0  # unfinished slides fall back once the deck deadline passes
+    SCORING_MODE: Literal["per_slide", "batched"] = "per_slide"  # batched: one scoring call per deck round
+    WRITER_CANDIDATES: int = 1  # drafts requested per writer call; the best passing one is kept
+
+    # Coalesce identical in-flight generations/renders into one shared computation
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    # LLM Response Cache (identical model/messages/temperature/response_format are served locally)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    LLM_CACHE_DB_PATH: str | None = None  # e.g. "llm_cache.sqlite3" to persist across restarts/processes
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.35  # hotter calls (writer retries) are never cached
+
+    # Background Jobs (/jobs)
+    JOB_WORKERS: int = 2
+    JOB_STORE: Literal["memory", "sqlite"] = "memory"
+    JOB_DB_PATH: str = os.path.join(tempfile.gettempdir(), "slidegenie-jobs.sqlite3")  # opened on first use
+    JOB_MAX_RETAINED: int = 500
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0  # shared (sqlite) store: how often idle workers look for jobs from other processes
+    JOB_HEARTBEAT_SECONDS: float = 10.0
+    JOB_STALE_SECONDS: float = 60.0  # running jobs without a heartbeat for this long are marked failed
+
+    # Batch Generation (/generate/batch)
+    BATCH_MAX_ITEMS: int = 50
+    BATCH_CONCURRENCY: int = 4  # decks of one batch generated at once (LLM calls still share the scheduler)
+
+    # Slide Image Fetching ({query} is replaced with the URL-encoded slide title)
+    IMAGE_SOURCE_URL: str = "https://source.unsplash.com/featured/?{query}"
+    IMAGE_FETCH_WORKERS: int = 8
+    IMAGE_FETCH_TIMEOUT: float = 5.0  # per image, seconds
+    IMAGE_FETCH_DEADLINE: float = 10.0  # whole deck, seconds
+
+    # Slide Image Cache (shared by the PPTX and PDF builders, holds normalized images)
+    IMAGE_CACHE_ENABLED: bool = True
+    IMAGE_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "slidegenie-images")  # created on first write
+    IMAGE_CACHE_MAX_BYTES: int = 200 * 1024 * 1024
+    IMAGE_CACHE_MEMORY_BYTES: int = 32 * 1024 * 1024
+    IMAGE_DPI: int = 150  # images are downsampled to their on-slide box at this DPI
+    IMAGE_JPEG_QUALITY: int = 85
+
+    # Diagrams (charts planned per deck with concrete data, drawn in place of the slide image)
+    DIAGRAMS_ENABLED: bool = True
+    DIAGRAMS_PER_DECK: int = 2
+    DIAGRAM_RENDER_WORKERS: int = 4
+    DIAGRAM_DPI: int = 150
+    DIAGRAM_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # rendered PNG/SVG bytes, in memory
+
+    # PPTX Rendering
+    PPT_TEMPLATE_PATH: str | None = None  # custom branded .pptx; python-pptx default template when unset
+
+    # Rendering Backend ("thread": asyncio.to_thread, "process": worker processes)
+    RENDER_BACKEND: Literal["thread", "process"] = "thread"
+    RENDER_WORKERS: int = 2
+    RENDER_MAX_TASKS_PER_CHILD: int | None = 50
+    RENDER_WARMUP: bool = True  # start render workers at app startup instead of on first request
+    # openai, python-pptx, ReportLab and matplotlib load on first use (fast cold start for scale-to-zero);
+    # STARTUP_WARMUP loads them during startup instead: slower boot, no first-request penalty
+    STARTUP_WARMUP: bool = False
+
+    # Deck Store (rendered decks by content hash: instant re-downloads via /decks/{id}, no duplicate renders)
+    DECK_STORE_ENABLED: bool = True
+    DECK_STORE_PATH: str = os.path.join(tempfile.gettempdir(), "slidegenie-decks.sqlite3")  # opened on first use
+    DECK_STORE_MAX_BYTES: int = 500 * 1024 * 1024  # least recently used decks are evicted beyond this
+    DECK_STORE_MAX_DECK_BYTES: int = 50 * 1024 * 1024  # larger files are served but not stored
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,90 @@
+import importlib.util
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict
+from app.core.config import settings
+from app.core.metrics import OUTBOUND_CONNECTIONS, OUTBOUND_REQUESTS
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientRegistry:
+    """
+    Named httpx.AsyncClient instances, one connection pool per upstream, shared by every
+    service. Clients are built on first use and closed by the app lifespan; requests and
+    newly opened connections are counted, so connection reuse is visible in /metrics.
+    """
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 32, keepalive_expiry: float = 60.0,
+                 connect_timeout: float = 5.0, read_timeout: float = 60.0, http2: bool = True):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.http2 = http2 and h2_available()
+        self._clients: Dict[str, "httpx.AsyncClient"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> "httpx.AsyncClient":
+        """The shared client for `name`, (re)built if missing or already closed."""
+        with self._lock:
+            client = self._clients.get(name)
+            if client is None or client.is_closed:
+                client = self._build(name)
+                self._clients[name] = client
+            return client
+
+    def _build(self, name: str) -> "httpx.AsyncClient":
+        import httpx
+
+        async def trace(event: str, info: dict) -> None:
+            if event == "connection.connect_tcp.complete":
+                OUTBOUND_CONNECTIONS.inc(client=name)
+
+        async def on_request(request: "httpx.Request") -> None:
+            OUTBOUND_REQUESTS.inc(client=name)
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            event_hooks={"request": [on_request]},
+        )
+
+    async def aclose(self) -> None:
+        """Closes every pooled connection; later get() calls start fresh clients."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Failed to close HTTP client: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"clients": len(self._clients), "http2": int(self.http2)}
+
+
+http_clients = HTTPClientRegistry(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+    read_timeout=settings.HTTP_READ_TIMEOUT,
+    http2=settings.HTTP2_ENABLED,
+)
@@ -0,0 +1,198 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Set by callers that want a new answer to a repeated request (e.g. slide regeneration)
+cache_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+class LLMCache:
+    """
+    Content-addressed cache for chat completions.
+    Tier 1: in-process LRU with TTL. Tier 2 (optional): SQLite file shared across processes.
+    Values are the serialized completion (JSON string), keys a hash of the request.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._memory: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.available = db_path is not None
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        """
+        Opens the SQLite tier on first use rather than at import. If the path cannot be opened
+        the tier turns itself off and the cache is memory-only.
+        """
+        # Caller holds the lock
+        if self._db is None and self.available:
+            try:
+                db = sqlite3.connect(self.db_path, check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache database at {self.db_path} unavailable, caching in memory only: {e}")
+                self.available = False
+            else:
+                self._db = db
+        return self._db
+
+    @staticmethod
+    def make_key(model: str, messages: list, temperature: Optional[float], response_format: Optional[dict]) -> str:
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature, "response_format": response_format},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._memory[key]
+
+            db = self._conn()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            db = self._conn()
+            if db is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+                db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = self.disk_hits = 0
+            db = self._conn()
+            if db is not None:
+                db.execute("DELETE FROM llm_cache")
+                db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "entries": len(self._memory),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remember(self, key: str, value: str, expires_at: float) -> None:
+        # Caller holds the lock
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+class _CachedCompletions:
+    def __init__(self, completions, cache: LLMCache, max_temperature: float):
+        self._completions = completions
+        self._cache = cache
+        self._max_temperature = max_temperature
+
+    async def create(self, **kwargs) -> Any:
+        temperature = kwargs.get("temperature")
+        # Higher-temperature calls (e.g. writer retries) are meant to vary, so they always go upstream
+        cacheable = (
+            not cache_bypass.get()
+            and not kwargs.get("stream")
+            and kwargs.get("n", 1) == 1
+            and (temperature is None or temperature <= self._max_temperature)
+        )
+        if not cacheable:
+            return await self._completions.create(**kwargs)
+
+        key = LLMCache.make_key(
+            kwargs.get("model"), kwargs.get("messages"), temperature, kwargs.get("response_format")
+        )
+        cached = await self._call(self._cache.get, key)
+        if cached is not None:
+            from openai.types.chat import ChatCompletion
+            logger.debug(f"LLM cache hit {key[:12]}")
+            return ChatCompletion.model_validate_json(cached)
+
+        response = await self._completions.create(**kwargs)
+        try:
+            await self._call(self._cache.set, key, response.model_dump_json())
+        except Exception as e:
+            logger.warning(f"LLM cache write skipped: {e}")
+        return response
+
+
+    async def _call(self, method, *args):
+        # The SQLite tier does file I/O: keep it off the event loop (memory-only lookups stay inline)
+        if self._cache.db_path:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+
+class _CachedChat:
+    def __init__(self, chat, cache: LLMCache, max_temperature: float):
+        self.completions = _CachedCompletions(chat.completions, cache, max_temperature)
+
+
+class CachedClient:
+    """
+    Drop-in wrapper around an AsyncOpenAI client: services keep calling
+    client.chat.completions.create(...) and identical requests are served from the cache.
+    """
+
+    def __init__(self, client, cache: LLMCache, max_temperature: float = 0.35):
+        self._client = client
+        self.chat = _CachedChat(client.chat, cache, max_temperature)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+llm_cache = LLMCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    db_path=settings.LLM_CACHE_DB_PATH,
+)
@@ -0,0 +1,204 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{str(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], list] = {}  # key -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        series = self._series.get(key)
+        return series[-1] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, series):
+                    cumulative += bucket_count
+                    labels = _format_labels(self.labelnames, key, 'le="%s"' % bound)
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {series[-2]}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {series[-1]}")
+        return lines
+
+
+class GaugeCallback:
+    """Gauge whose samples are read at scrape time, e.g. from a cache's stats() dict."""
+
+    def __init__(self, name: str, documentation: str, fn: Callable[[], Dict[str, float]], labelname: str = "field"):
+        self.name = name
+        self.documentation = documentation
+        self.fn = fn
+        self.labelname = labelname
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for field, value in sorted(self.fn().items()):
+            lines.append(f'{self.name}{{{self.labelname}="{field}"}} {float(value)}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name: str, documentation: str, fn: Callable[[], Dict[str, float]]) -> GaugeCallback:
+        return self.register(GaugeCallback(name, documentation, fn))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# --- PIPELINE METRICS ---
+
+STAGE_LATENCY = registry.histogram(
+    "slidegenie_stage_duration_seconds",
+    "Latency of each pipeline stage (improve, plan, write, score, image_fetch, render, ...)",
+    ["stage"],
+)
+SLIDE_RETRIES = registry.counter(
+    "slidegenie_slide_retries_total", "Slide write attempts that had to be retried", ["reason"]
+)
+SLIDE_FALLBACKS = registry.counter(
+    "slidegenie_slide_fallbacks_total", "Slides that exhausted their retries and used fallback content"
+)
+PRESCORE_DECISIONS = registry.counter(
+    "slidegenie_prescore_decisions_total", "Slide drafts decided by the local pre-scorer vs. escalated to remote scoring", ["outcome"]
+)
+LLM_REQUESTS = registry.counter(
+    "slidegenie_llm_requests_total", "Chat completion requests sent upstream", ["model", "outcome"]
+)
+LLM_TOKENS = registry.counter(
+    "slidegenie_llm_tokens_total", "Tokens reported by upstream responses", ["model", "kind"]
+)
+HTTP_REQUESTS = registry.counter(
+    "slidegenie_http_requests_total", "API requests by endpoint and status", ["endpoint", "status"]
+)
+HTTP_LATENCY = registry.histogram(
+    "slidegenie_http_request_duration_seconds", "API request latency", ["endpoint"]
+)
+OUTBOUND_REQUESTS = registry.counter(
+    "slidegenie_outbound_requests_total", "Requests sent through the shared outbound HTTP clients", ["client"]
+)
+OUTBOUND_CONNECTIONS = registry.counter(
+    "slidegenie_outbound_connections_total", "New TCP connections opened by the shared outbound HTTP clients", ["client"]
+)
+
+
+class _InstrumentedCompletions:
+    def __init__(self, completions):
+        self._completions = completions
+
+    async def create(self, **kwargs) -> Any:
+        from app.utils.logger import log_ai_usage
+        model = kwargs.get("model", "")
+        with STAGE_LATENCY.time(stage="llm_call"):
+            try:
+                response = await self._completions.create(**kwargs)
+            except Exception:
+                LLM_REQUESTS.inc(model=model, outcome="error")
+                raise
+        LLM_REQUESTS.inc(model=model, outcome="ok")
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            LLM_TOKENS.inc(usage.prompt_tokens or 0, model=model, kind="prompt")
+            LLM_TOKENS.inc(usage.completion_tokens or 0, model=model, kind="completion")
+            log_ai_usage(model, usage.total_tokens or 0)
+        return response
+
+
+class _InstrumentedChat:
+    def __init__(self, chat):
+        self.completions = _InstrumentedCompletions(chat.completions)
+
+
+class InstrumentedClient:
+    """Innermost client wrapper: counts real upstream calls, their latency and token usage."""
+
+    def __init__(self, client):
+        self._client = client
+        self.chat = _InstrumentedChat(client.chat)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -54,6 +54,68 @@ OUTPUT FORMAT (JSON ONLY):
 }}
 """
 
+FULL_DECK_PROMPT = """You are an expert educator and presentation writer.
+
+Plan AND write a complete PowerPoint deck in one pass.
+
+RULES:
+- Create EXACTLY {slide_count} slides
+- Each slide must cover a DIFFERENT concept, in a logical learning order
+- Use clear, specific slide titles
+- 3 to 5 bullet points per slide, max 12 words per bullet
+- Clear, factual, no repetition, no generic phrases
+- Avoid generic terms like "overview", "phase", "strategy"
+{domain_rules}
+
+TOPIC:
+{user_topic}
+
+OUTPUT FORMAT (JSON ONLY):
+{{
+  "topic": "Deck title",
+  "slides": [
+    {{
+      "title": "Slide title",
+      "focus": "What this slide explains",
+      "bullet_points": ["string", "string", "string"]
+    }}
+  ]
+}}
+"""
+
+DIAGRAM_PLANNER_PROMPT = """You are a presentation strategist.
+
+Pick the slides of this deck that a chart or diagram would make clearer, and give each one concrete data.
+
+RULES:
+- Suggest at most {max_diagrams} diagrams, only where a visual adds information
+- Types: bar_chart, line_chart, pie_chart (numbers), timeline, flowchart (ordered steps)
+- 2 to 8 labels per diagram, max 4 words per label
+- bar_chart, line_chart, pie_chart: one number per label in "values" (pie values are shares of a whole)
+- timeline, flowchart: labels in order; "values" may be empty (timeline: years)
+- Use well-established, approximate figures; put the unit in the title
+- Refer to slides by their number
+
+TOPIC:
+{user_topic}
+
+SLIDES:
+{slide_list}
+
+OUTPUT FORMAT (JSON ONLY):
+{{
+  "diagrams": [
+    {{
+      "slide_number": 1,
+      "type": "bar_chart",
+      "title": "Short chart title (unit)",
+      "labels": ["string", "string"],
+      "values": [10, 20]
+    }}
+  ]
+}}
+"""
+
 # --- DOMAIN SPECIFIC RULES ---
 
 DOMAIN_RULES = {
@@ -86,6 +148,27 @@ Title: {title}
 Content: {points}
 """
 
+SLIDE_BATCH_SCORER_PROMPT = """You are a senior presentation quality evaluator.
+
+TASK:
+Evaluate EACH of the following slides independently for relevance, specificity, and factual depth.
+
+Score each slide from 0 to 100 base on:
+- Relevance to the overall topic (0-40)
+- Specificity of the content (No generic filler like "Key Aspect") (0-40)
+- Conciseness and Professionalism (0-20)
+
+OUTPUT FORMAT (STRICT JSON, one entry per slide id):
+{{
+  "scores": [
+    {{"id": integer, "confidence_score": integer}}
+  ]
+}}
+
+SLIDES:
+{slides}
+"""
+
 # --- UTILITY PROMPTS ---
 
 PROMPT_IMPROVER_PROMPT = """You are an expert prompt engineer.
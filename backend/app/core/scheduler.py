@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Which deck an outbound call belongs to; queued calls are served round-robin across decks
+current_deck: ContextVar[str] = ContextVar("current_deck", default="default")
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at rate_per_minute. A rate of 0 disables it."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = rate_per_minute
+        self.tokens = rate_per_minute
+        self._rate_per_second = rate_per_minute / 60
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self._rate_per_second)
+        self._updated = now
+
+    async def consume(self, amount: float) -> None:
+        if self.capacity <= 0:
+            return
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self._rate_per_second)
+
+    def charge(self, amount: float) -> None:
+        """Books extra usage discovered after the fact (may push the bucket into debt)."""
+        if self.capacity > 0:
+            self._refill()
+            self.tokens -= amount
+
+
+@lru_cache(maxsize=None)
+def _retryable_errors() -> tuple:
+    """Transient provider errors; openai is imported on the first failure, not at startup."""
+    import openai
+    return (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+class OutboundScheduler:
+    """
+    Gate for every outbound LLM call:
+    - at most max_in_flight concurrent requests, handed out round-robin across decks
+    - requests/minute and tokens/minute token buckets
+    - jittered exponential backoff on 429s and transient provider errors
+    """
+
+    def __init__(self, max_in_flight: int = 16, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_retries: int = 4, backoff_base: float = 1.0, backoff_max: float = 30.0):
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.in_flight = 0
+        self.retries = 0
+        self._waiters: "OrderedDict[str, deque]" = OrderedDict()
+
+    @property
+    def queued(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def _acquire(self, key: str) -> None:
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()  # slot was granted just as we were cancelled
+            else:
+                waiters = self._waiters.get(key)
+                if waiters and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiters[key]
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        while self.in_flight < self.max_in_flight and self._waiters:
+            # Oldest deck with waiters goes first, then rotates to the back of the line
+            key, waiters = next(iter(self._waiters.items()))
+            future = waiters.popleft()
+            if waiters:
+                self._waiters.move_to_end(key)
+            else:
+                del self._waiters[key]
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        retry_after = None
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        delay *= random.uniform(0.5, 1.5)  # jitter so retries from many decks don't re-synchronize
+        return max(delay, retry_after or 0)
+
+    async def run(self, call: Callable[[], Awaitable[Any]], estimated_tokens: int = 0, key: Optional[str] = None) -> Any:
+        key = key or current_deck.get()
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(key)
+            try:
+                await self.request_bucket.consume(1)
+                await self.token_bucket.consume(estimated_tokens)
+                response = await call()
+            except _retryable_errors() as e:
+                # A 429 for an exhausted quota won't clear by waiting
+                if attempt == self.max_retries or getattr(e, "code", None) == "insufficient_quota":
+                    raise
+                delay = self._backoff(attempt, e)
+                self.retries += 1
+                logger.warning(f"Outbound call failed ({type(e).__name__}), retry {attempt + 1} in {delay:.1f}s")
+            else:
+                usage = getattr(response, "usage", None)
+                if usage is not None and getattr(usage, "total_tokens", None):
+                    self.token_bucket.charge(usage.total_tokens - estimated_tokens)
+                return response
+            finally:
+                self._release()
+            # Back off without holding a slot so other decks keep flowing
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {"in_flight": self.in_flight, "queued": self.queued, "retries": self.retries}
+
+
+def estimate_tokens(kwargs: dict) -> int:
+    """Rough pre-flight token estimate (~4 chars per token) plus the completion budget."""
+    prompt_chars = sum(len(str(message.get("content", ""))) for message in kwargs.get("messages", []))
+    completion = kwargs.get("max_tokens") or 400
+    return prompt_chars // 4 + completion * kwargs.get("n", 1)
+
+
+class _ScheduledCompletions:
+    def __init__(self, completions, scheduler: OutboundScheduler):
+        self._completions = completions
+        self._scheduler = scheduler
+
+    async def create(self, **kwargs) -> Any:
+        return await self._scheduler.run(
+            lambda: self._completions.create(**kwargs),
+            estimated_tokens=estimate_tokens(kwargs),
+        )
+
+
+class _ScheduledChat:
+    def __init__(self, chat, scheduler: OutboundScheduler):
+        self.completions = _ScheduledCompletions(chat.completions, scheduler)
+
+
+class ScheduledClient:
+    """Drop-in wrapper around an AsyncOpenAI client that routes completions through the scheduler."""
+
+    def __init__(self, client, scheduler: OutboundScheduler):
+        self._client = client
+        self.chat = _ScheduledChat(client.chat, scheduler)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+outbound_scheduler = OutboundScheduler(
+    max_in_flight=settings.OPENAI_MAX_IN_FLIGHT,
+    requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+    max_retries=settings.OPENAI_MAX_RETRIES,
+    backoff_base=settings.OPENAI_BACKOFF_BASE,
+)
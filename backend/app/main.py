@@ -1,15 +1,42 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.routes import health, generation
+from app.core.http_clients import http_clients
+from app.routes import health, generation, batch, jobs, decks, metrics
+from app.services.content_engine import content_engine
+from app.services.job_queue import job_queue
+from app.services.renderer import process_renderer, warm_up_builders
 from app.core.limiter import limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: optionally load the AI client and in-process builders before traffic arrives
+    if settings.STARTUP_WARMUP:
+        content_engine.warm_up()
+        if process_renderer is None:
+            await asyncio.to_thread(warm_up_builders)
+    # Startup: spin up render worker processes before traffic arrives
+    if process_renderer is not None and settings.RENDER_WARMUP:
+        await asyncio.to_thread(process_renderer.warm_up)
+    # Startup: job workers pick up jobs left queued (or orphaned) by processes that are gone
+    job_queue.start()
+    yield
+    # Shutdown
+    await job_queue.stop()
+    if process_renderer is not None:
+        process_renderer.shutdown()
+    content_engine.release_client()
+    await http_clients.aclose()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # Set Limiter State
@@ -25,10 +52,16 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Download responses carry these; browsers hide non-safelisted headers from cross-origin JS otherwise
+        expose_headers=["Content-Disposition", "X-Presentation-Structure", "X-Deck-Id"],
     )
 
 app.include_router(health.router, prefix=settings.API_V1_STR)
 app.include_router(generation.router, prefix=settings.API_V1_STR)
+app.include_router(batch.router, prefix=settings.API_V1_STR)
+app.include_router(jobs.router, prefix=settings.API_V1_STR)
+app.include_router(decks.router, prefix=settings.API_V1_STR)
+app.include_router(metrics.router, prefix=settings.API_V1_STR)
 
 @app.get("/")
 def root():
@@ -0,0 +1,136 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import AsyncIterator, List, Literal, Tuple
+import asyncio
+import base64
+import json
+import re
+import time
+import zipfile
+from contextlib import aclosing
+from app.core.config import settings
+from app.core.limiter import limiter
+from app.routes.generation import GenerateRequest, _classify_error
+from app.services.content_engine import content_engine
+from app.services.renderer import render_deck, file_info
+
+router = APIRouter()
+
+
+class BatchGenerateRequest(BaseModel):
+    items: List[GenerateRequest] = Field(min_length=1, max_length=settings.BATCH_MAX_ITEMS)
+    format: Literal["zip", "json"] = "zip"
+
+
+def _item_filename(index: int, item: GenerateRequest) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", item.text[:40].lower()).strip("-") or "presentation"
+    return f"{index + 1:02d}-{slug}.{item.type}"
+
+async def _run_item(index: int, item: GenerateRequest, semaphore: asyncio.Semaphore) -> Tuple[int, dict, bytes]:
+    """Generates + renders one deck; failures become an error entry instead of failing the batch."""
+    async with semaphore:
+        try:
+            structure = await content_engine.generate_structure(
+                item.text, item.slideCount, item.audience, item.domain, item.mode
+            )
+            file_buffer, stored_id = await render_deck(structure, item.type)
+        except Exception as e:
+            status_code, error_msg = _classify_error(e)
+            return index, {"index": index, "status": "failed", "error": {"status": status_code, "detail": error_msg}}, b""
+
+    _, content_type = file_info(item.type)
+    return index, {
+        "index": index,
+        "status": "succeeded",
+        "filename": _item_filename(index, item),
+        "contentType": content_type,
+        "deckId": stored_id,
+        "structure": structure.model_dump()
+    }, file_buffer.getvalue()
+
+async def _run_batch(items: List[GenerateRequest]) -> AsyncIterator[Tuple[int, dict, bytes]]:
+    """
+    Runs every item through the shared engine (LLM cache, single-flight, outbound scheduler,
+    deck store) with at most BATCH_CONCURRENCY decks in flight; yields in completion order.
+    """
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    tasks = [asyncio.create_task(_run_item(i, item, semaphore)) for i, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+class _ChunkSink:
+    """Write-only, non-seekable target for ZipFile: collects output until the response drains it."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+async def _zip_stream(items: List[GenerateRequest], start_time: float) -> AsyncIterator[bytes]:
+    """Streams a ZIP entry per finished deck (stored, decks are already compressed) plus manifest.json."""
+    from app.utils.logger import log_request
+    sink = _ChunkSink()
+    results = []
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:
+        # aclosing: a client that disconnects mid-download cancels the remaining decks
+        async with aclosing(_run_batch(items)) as finished:
+            async for index, result, data in finished:
+                results.append(result)
+                if data:
+                    archive.writestr(result["filename"], data)
+                    yield sink.drain()
+        manifest = [{k: v for k, v in r.items() if k != "structure"} for r in sorted(results, key=lambda r: r["index"])]
+        archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+    yield sink.drain()
+    log_request("/generate/batch", "success", (time.time() - start_time) * 1000)
+
+@router.post("/generate/batch", tags=["generation"])
+@limiter.limit("2/minute")
+async def generate_batch(request: Request, payload: BatchGenerateRequest):
+    """
+    Generates many decks in one request (e.g. one per lesson).
+    - format="zip": a streamed ZIP with one file per successful deck and a manifest.json
+      listing every item's status, deckId or error
+    - format="json": per-item results with base64 files, once every item has finished
+    A failing item does not fail the batch.
+    Rate Limit: 2 requests per minute per IP.
+    """
+    from app.utils.logger import log_request
+
+    start_time = time.time()
+    for i, item in enumerate(payload.items):
+        if len(item.text) > 2000:
+            log_request("/generate/batch", "rejected_too_long", 0)
+            raise HTTPException(status_code=400, detail=f"Item {i}: text too long (max 2000 chars)")
+
+    if payload.format == "zip":
+        return StreamingResponse(
+            _zip_stream(payload.items, start_time),
+            media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="presentations.zip"'}
+        )
+
+    results = [None] * len(payload.items)
+    async for index, result, data in _run_batch(payload.items):
+        if data:
+            result["fileBase64"] = base64.b64encode(data).decode("utf-8")
+        results[index] = result
+    log_request("/generate/batch", "success", (time.time() - start_time) * 1000)
+    return {"status": "success", "data": {"items": results}}
@@ -0,0 +1,45 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Response
+from app.services.deck_store import deck_store
+from app.services.renderer import file_info
+
+router = APIRouter()
+
+
+async def _get_deck(deck_id: str):
+    # SQLite I/O: keep it off the event loop
+    deck = await asyncio.to_thread(deck_store.get, deck_id) if deck_store is not None else None
+    if deck is None:
+        raise HTTPException(status_code=404, detail="Deck not found")
+    return deck
+
+@router.get("/decks/{deck_id}", tags=["decks"])
+async def get_deck(deck_id: str):
+    deck = await _get_deck(deck_id)
+    filename, content_type = file_info(deck.output_type)
+    return {
+        "status": "success",
+        "data": {
+            "deckId": deck.id,
+            "type": deck.output_type,
+            "filename": filename,
+            "contentType": content_type,
+            "size": deck.size,
+            "structure": deck.structure.model_dump(),
+            "createdAt": deck.created_at
+        }
+    }
+
+@router.get("/decks/{deck_id}/file", tags=["decks"])
+async def get_deck_file(deck_id: str):
+    """Re-downloads a previously generated deck without regenerating or re-rendering it."""
+    deck = await _get_deck(deck_id)
+    data = await asyncio.to_thread(deck_store.get_file, deck_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Deck not found")
+    filename, content_type = file_info(deck.output_type)
+    return Response(
+        content=data,
+        media_type=content_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
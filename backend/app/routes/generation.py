@@ -1,11 +1,17 @@
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel, Field
-from typing import Literal
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+from typing import Iterator, Literal, Optional, Tuple
+import asyncio
 import base64
-from app.services.content_engine import content_engine
-from app.services.ppt_builder import ppt_generator as ppt_builder
-from app.services.pdf_builder import pdf_generator as pdf_builder
+import io
+import json
+from app.services.content_engine import content_engine, slide_image_url
+from app.services.renderer import render_deck, render_slide_update, file_info
+from app.services.job_queue import job_queue
+from app.services.deck_store import deck_store
 from app.core.limiter import limiter
+from app.schemas.presentation import PresentationStructure
 
 router = APIRouter()
 
@@ -16,10 +22,79 @@ class GenerateRequest(BaseModel):
     type: Literal["pptx", "pdf"] = "pptx"
     audience: Literal["general", "technical"] = "general"
     domain: Literal["general", "technical", "mathematics", "law", "medicine"] = "general"
+    mode: Literal["quality", "fast"] = "quality"  # fast: one whole-deck completion, lower latency
+
+class RegenerateSlideRequest(BaseModel):
+    """One slide of an existing deck, given inline (structure), as a finished job (jobId) or a stored deck (deckId)."""
+    structure: Optional[PresentationStructure] = None
+    jobId: Optional[str] = None
+    deckId: Optional[str] = None
+    slideIndex: int = Field(ge=0)
+    type: Literal["pptx", "pdf"] = "pptx"
+    domain: Literal["general", "technical", "mathematics", "law", "medicine"] = "general"
+
+    @model_validator(mode="after")
+    def _one_source(self):
+        if sum(source is not None for source in (self.structure, self.jobId, self.deckId)) != 1:
+            raise ValueError("Provide exactly one of structure, jobId or deckId")
+        return self
+
+    @model_validator(mode="after")
+    def _server_image_urls(self):
+        # The renderer fetches image_url server-side: never take it from the client (SSRF), rebuild it from the title
+        if self.structure is not None:
+            self.structure = self.structure.model_copy(update={"slides": [
+                slide.model_copy(update={"image_url": slide_image_url(slide.title)}) if slide.image_url else slide
+                for slide in self.structure.slides
+            ]})
+        return self
 
 class ImprovePromptRequest(BaseModel):
     text: str
 
+
+def _classify_error(e: Exception) -> Tuple[int, str]:
+    """Determine status code and message for a pipeline failure"""
+    status_code = 500
+    error_msg = str(e)
+    
+    # Better error messages for OpenAI
+    if "insufficient_quota" in error_msg:
+        status_code = 402 # Payment Required or just 429
+        error_msg = "OpenAI API Quota exceeded. Please check your billing/usage."
+    elif "rate_limit" in error_msg.lower():
+        status_code = 429
+        error_msg = "OpenAI Rate limit reached. Try again in a moment."
+    elif "api_key" in error_msg.lower():
+        status_code = 401
+        error_msg = "Invalid or missing OpenAI API Key."
+    return status_code, error_msg
+
+def _iter_buffer(buffer: io.BytesIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    buffer.seek(0)
+    while chunk := buffer.read(chunk_size):
+        yield chunk
+
+def file_response(
+    buffer: io.BytesIO,
+    filename: str,
+    content_type: str,
+    structure: Optional[PresentationStructure] = None,
+    stored_id: Optional[str] = None
+) -> StreamingResponse:
+    """Streams a rendered file straight from its buffer as a binary download."""
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Content-Length": str(buffer.getbuffer().nbytes)
+    }
+    if stored_id is not None:
+        headers["X-Deck-Id"] = stored_id
+    if structure is not None:
+        headers["X-Presentation-Structure"] = base64.urlsafe_b64encode(
+            structure.model_dump_json().encode("utf-8")
+        ).decode("ascii")
+    return StreamingResponse(_iter_buffer(buffer), media_type=content_type, headers=headers)
+
 @router.post("/improve-prompt", tags=["generation"])
 async def improve_prompt_endpoint(payload: ImprovePromptRequest):
     """
@@ -30,9 +105,14 @@ async def improve_prompt_endpoint(payload: ImprovePromptRequest):
 
 @router.post("/generate", tags=["generation"])
 @limiter.limit("5/minute")
-async def generate_presentation(request: Request, payload: GenerateRequest):
+async def generate_presentation(request: Request, payload: GenerateRequest, download: bool = False):
     """
     Accepts text and generates the presentation structure + output file.
+    With ?download=true the file is streamed as raw bytes instead of base64 JSON,
+    and the structure is sent base64url-encoded in the X-Presentation-Structure header.
+    That header grows with the deck (a 15-slide structure can pass the 4-8 KB header
+    buffers of proxies such as nginx); clients behind one should use the JSON response,
+    or read X-Deck-Id and fetch the structure from GET /decks/{id}.
     Rate Limit: 5 requests per minute per IP.
     """
     from app.utils.logger import log_request, log_error
@@ -50,32 +130,22 @@ async def generate_presentation(request: Request, payload: GenerateRequest):
             payload.text, 
             payload.slideCount, 
             payload.audience,
-            payload.domain
+            payload.domain,
+            payload.mode
         )
         
         # Step 2: Generate File
-        # Offload CPU-bound work to threadpool to avoid blocking async event loop
-        import asyncio
-        
-        file_buffer = None
-        filename = "presentation.pptx"
-        content_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-
-        if payload.type == "pdf":
-            filename = "presentation.pdf"
-            content_type = "application/pdf"
-            file_buffer = await asyncio.to_thread(pdf_builder.generate, structure)
-        else:
-            # Default to PPTX
-            filename = "presentation.pptx"
-            content_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-            file_buffer = await asyncio.to_thread(ppt_builder.generate, structure)
-        
-        # Step 3: Encode to Base64
-        file_base64 = base64.b64encode(file_buffer.getvalue()).decode('utf-8')
+        filename, content_type = file_info(payload.type)
+        file_buffer, stored_id = await render_deck(structure, payload.type)
         
         duration_ms = (time.time() - start_time) * 1000
         log_request("/generate", "success", duration_ms)
+
+        if download:
+            return file_response(file_buffer, filename, content_type, structure, stored_id)
+
+        # Step 3: Encode to Base64
+        file_base64 = base64.b64encode(file_buffer.getbuffer()).decode('utf-8')
         
         return {
             "status": "success", 
@@ -83,7 +153,8 @@ async def generate_presentation(request: Request, payload: GenerateRequest):
                 "fileBase64": file_base64,
                 "filename": filename,
                 "contentType": content_type,
-                "structure": structure.dict()
+                "structure": structure.dict(),
+                "deckId": stored_id
             }
         }
         
@@ -91,22 +162,152 @@ async def generate_presentation(request: Request, payload: GenerateRequest):
         import traceback
         traceback.print_exc()
         
-        # Determine status code and message
-        status_code = 500
-        error_msg = str(e)
-        
-        # Better error messages for OpenAI
-        if "insufficient_quota" in error_msg:
-            status_code = 402 # Payment Required or just 429
-            error_msg = "OpenAI API Quota exceeded. Please check your billing/usage."
-        elif "rate_limit" in error_msg.lower():
-            status_code = 429
-            error_msg = "OpenAI Rate limit reached. Try again in a moment."
-        elif "api_key" in error_msg.lower():
-            status_code = 401
-            error_msg = "Invalid or missing OpenAI API Key."
-            
+        status_code, error_msg = _classify_error(e)
         log_error(e, "generate_presentation")
         duration_ms = (time.time() - start_time) * 1000
         log_request("/generate", "error", duration_ms)
         raise HTTPException(status_code=status_code, detail=error_msg)
+
+
+def _resolve_deck(payload: RegenerateSlideRequest) -> Tuple[PresentationStructure, Optional[bytes]]:
+    """The deck to edit and, when already known, its rendered file in the requested type."""
+    if payload.structure is not None:
+        return payload.structure, None
+
+    if payload.deckId is not None:
+        deck = deck_store.get(payload.deckId) if deck_store is not None else None
+        if deck is None:
+            raise HTTPException(status_code=404, detail="Deck not found")
+        base_file = deck_store.get_file(deck.id) if deck.output_type == payload.type else None
+        return deck.structure, base_file
+
+    job = job_queue.store.get(payload.jobId)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "succeeded" or job.structure is None:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}, deck not available")
+    base_file = None
+    if job.content_type == file_info(payload.type)[1]:
+        base_file = job_queue.store.get_file(job.id)
+    return job.structure, base_file
+
+@router.post("/generate/slide", tags=["generation"])
+@limiter.limit("10/minute")
+async def regenerate_slide(request: Request, payload: RegenerateSlideRequest, download: bool = False):
+    """
+    Regenerates a single slide of an existing deck (writer + quality gate for that slide only)
+    and re-renders the file; PPTX files are patched in place when the previous file is known.
+    Responds like /generate, including ?download=true.
+    Rate Limit: 10 requests per minute per IP.
+    """
+    from app.utils.logger import log_request, log_error
+    import time
+
+    start_time = time.time()
+    # Deck store / job store reads (SQLite, file BLOBs) stay off the event loop
+    base, base_file = await asyncio.to_thread(_resolve_deck, payload)
+    if payload.slideIndex >= len(base.slides):
+        raise HTTPException(status_code=400, detail=f"slideIndex must be below {len(base.slides)}")
+
+    try:
+        slide = await content_engine.regenerate_slide(base, payload.slideIndex, payload.domain)
+        if slide is None:
+            log_request("/generate/slide", "rejected_quality", (time.time() - start_time) * 1000)
+            raise HTTPException(status_code=422, detail="No new version of this slide passed the quality gate. Try again.")
+
+        slides = list(base.slides)
+        slides[payload.slideIndex] = slide
+        structure = PresentationStructure(topic=base.topic, slides=slides)
+
+        filename, content_type = file_info(payload.type)
+        file_buffer, stored_id = await render_slide_update(base, structure, payload.slideIndex, payload.type, base_file)
+        log_request("/generate/slide", "success", (time.time() - start_time) * 1000)
+
+        if download:
+            return file_response(file_buffer, filename, content_type, structure, stored_id)
+        return {
+            "status": "success",
+            "data": {
+                "fileBase64": base64.b64encode(file_buffer.getbuffer()).decode('utf-8'),
+                "filename": filename,
+                "contentType": content_type,
+                "structure": structure.model_dump(),
+                "deckId": stored_id
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        status_code, error_msg = _classify_error(e)
+        log_error(e, "regenerate_slide")
+        log_request("/generate/slide", "error", (time.time() - start_time) * 1000)
+        raise HTTPException(status_code=status_code, detail=error_msg)
+
+
+def _ndjson(event: str, data: dict) -> str:
+    return json.dumps({"event": event, "data": data}) + "\n"
+
+@router.post("/generate/stream", tags=["generation"])
+@limiter.limit("5/minute")
+async def generate_presentation_stream(request: Request, payload: GenerateRequest):
+    """
+    Streaming variant of /generate (NDJSON, one JSON event per line):
+    - "outline": topic + planned slides, as soon as the planner returns
+    - "slide": {index, slide} each time a slide passes the quality gate
+    - "diagram": {index, diagram} for a slide sent before its diagram was planned
+    - "file": the rendered file (same shape as the /generate response data)
+    - "error": {status, detail} if the pipeline fails mid-stream
+    Rate Limit: 5 requests per minute per IP.
+    """
+    from app.utils.logger import log_request, log_error
+    import time
+
+    start_time = time.time()
+
+    if len(payload.text) > 2000:
+        log_request("/generate/stream", "rejected_too_long", 0)
+        raise HTTPException(status_code=400, detail="Text too long (max 2000 chars)")
+
+    async def event_stream():
+        topic = payload.text
+        slides = []
+        try:
+            async for event, data in content_engine.stream_structure(
+                payload.text,
+                payload.slideCount,
+                payload.audience,
+                payload.domain,
+                payload.mode
+            ):
+                if event == "outline":
+                    topic = data["topic"]
+                    slides = [None] * len(data["plan"].slides)
+                    yield _ndjson("outline", {"topic": topic, "slides": [plan.model_dump() for plan in data["plan"].slides]})
+                elif event == "slide":
+                    slides[data["index"]] = data["slide"]
+                    yield _ndjson("slide", {"index": data["index"], "slide": data["slide"].model_dump()})
+                elif event == "diagram":
+                    slides[data["index"]] = slides[data["index"]].model_copy(update={"diagram": data["diagram"]})
+                    yield _ndjson("diagram", {"index": data["index"], "diagram": data["diagram"].model_dump()})
+
+            structure = PresentationStructure(topic=topic, slides=slides)
+            filename, content_type = file_info(payload.type)
+            file_buffer, stored_id = await render_deck(structure, payload.type)
+
+            yield _ndjson("file", {
+                "fileBase64": base64.b64encode(file_buffer.getbuffer()).decode('utf-8'),
+                "filename": filename,
+                "contentType": content_type,
+                "structure": structure.model_dump(),
+                "deckId": stored_id
+            })
+            log_request("/generate/stream", "success", (time.time() - start_time) * 1000)
+
+        except Exception as e:
+            status_code, error_msg = _classify_error(e)
+            log_error(e, "generate_presentation_stream")
+            log_request("/generate/stream", "error", (time.time() - start_time) * 1000)
+            yield _ndjson("error", {"status": status_code, "detail": error_msg})
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
@@ -0,0 +1,59 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.core.limiter import limiter
+from app.routes.generation import GenerateRequest
+from app.schemas.job import Job
+from app.services.job_queue import job_queue
+
+router = APIRouter()
+
+
+def _job_payload(job: Job) -> dict:
+    return {
+        "jobId": job.id,
+        "status": job.status,
+        "error": job.error,
+        "filename": job.filename,
+        "contentType": job.content_type,
+        "structure": job.structure.model_dump() if job.structure else None,
+        "createdAt": job.created_at,
+        "updatedAt": job.updated_at
+    }
+
+@router.post("/jobs", tags=["jobs"], status_code=202)
+@limiter.limit("5/minute")
+async def create_job(request: Request, payload: GenerateRequest):
+    """
+    Queues a presentation generation and returns immediately with a job id.
+    Poll GET /jobs/{id} for status, then download from GET /jobs/{id}/file.
+    Rate Limit: 5 requests per minute per IP.
+    """
+    if len(payload.text) > 2000:
+        raise HTTPException(status_code=400, detail="Text too long (max 2000 chars)")
+
+    job = await job_queue.submit(payload.model_dump())
+    return {"status": "success", "data": _job_payload(job)}
+
+@router.get("/jobs/{job_id}", tags=["jobs"])
+async def get_job(job_id: str):
+    job = await asyncio.to_thread(job_queue.store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"status": "success", "data": _job_payload(job)}
+
+@router.get("/jobs/{job_id}/file", tags=["jobs"])
+async def get_job_file(job_id: str):
+    job = await asyncio.to_thread(job_queue.store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}, file not available")
+
+    data = await asyncio.to_thread(job_queue.store.get_file, job_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    return Response(
+        content=data,
+        media_type=job.content_type,
+        headers={"Content-Disposition": f'attachment; filename="{job.filename}"'}
+    )
@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.metrics import registry
+from app.core.llm_cache import llm_cache
+from app.core.http_clients import http_clients
+from app.core.scheduler import outbound_scheduler
+from app.services.image_cache import image_cache
+from app.services.deck_store import deck_store
+from app.services.diagram_renderer import diagram_renderer
+from app.services import renderer
+
+router = APIRouter()
+
+registry.gauge_callback("slidegenie_llm_cache", "LLM response cache statistics", llm_cache.stats)
+registry.gauge_callback("slidegenie_image_cache", "Image cache statistics", image_cache.stats)
+registry.gauge_callback("slidegenie_outbound_scheduler", "Outbound LLM scheduler state", outbound_scheduler.stats)
+registry.gauge_callback("slidegenie_http_clients", "Shared outbound HTTP clients", http_clients.stats)
+registry.gauge_callback("slidegenie_diagram_cache", "Rendered diagram cache statistics", diagram_renderer.stats)
+registry.gauge_callback("slidegenie_render_single_flight", "Coalesced render statistics", renderer._render_flights.stats)
+if deck_store is not None:
+    registry.gauge_callback("slidegenie_deck_store", "Rendered deck store statistics", deck_store.stats)
+
+
+@router.get("/metrics", tags=["metrics"], response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
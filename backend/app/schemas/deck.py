@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import Literal
+from app.schemas.presentation import PresentationStructure
+
+class Deck(BaseModel):
+    id: str = Field(description="Content hash of the normalized structure + output type")
+    output_type: Literal["pptx", "pdf"]
+    structure: PresentationStructure
+    size: int = Field(description="Rendered file size in bytes")
+    created_at: float
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from app.schemas.presentation import PresentationStructure
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+class Job(BaseModel):
+    id: str = Field(description="Opaque job identifier")
+    status: JobStatus = "queued"
+    request: dict = Field(description="The original generation request payload")
+    created_at: float
+    updated_at: float
+    error: Optional[str] = None
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    structure: Optional[PresentationStructure] = None
@@ -1,10 +1,32 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Optional
+
+# bar/line/pie charts plot one value per label; timeline and flowchart lay the labels out in order
+DiagramType = Literal["bar_chart", "line_chart", "pie_chart", "timeline", "flowchart"]
+# Series colours shared by the native PPTX diagrams and the raster (PDF) renderer
+DIAGRAM_PALETTE = ["#ef0d50", "#eb3a70", "#e5bace", "#10b981", "#3b82f6", "#f59e0b", "#8b5cf6", "#64748b"]
+
+class Diagram(BaseModel):
+    type: DiagramType
+    title: str = Field(default="", description="Short chart title, including the unit if any")
+    labels: List[str] = Field(min_length=2, max_length=8)
+    values: List[float] = Field(default_factory=list, description="One value per label; optional for timeline/flowchart")
+
+    @model_validator(mode="after")
+    def _check_values(self):
+        if self.values and len(self.values) != len(self.labels):
+            raise ValueError("values must have one entry per label")
+        if self.type in ("bar_chart", "line_chart", "pie_chart") and not self.values:
+            raise ValueError(f"{self.type} needs values")
+        if self.type == "pie_chart" and (min(self.values) < 0 or sum(self.values) <= 0):
+            raise ValueError("pie_chart values must be non-negative shares")
+        return self
 
 class Slide(BaseModel):
     title: str = Field(description="The title of the slide")
     points: List[str] = Field(description="List of bullet points for the slide", max_length=5)
     image_url: Optional[str] = Field(default=None, description="Optional URL for a slide image")
+    diagram: Optional[Diagram] = Field(default=None, description="Optional chart, drawn in place of the image")
 
 class SlidePlan(BaseModel):
     slide_number: int
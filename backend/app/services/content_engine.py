@@ -1,24 +1,45 @@
 import json
 import logging
-from typing import Optional, List, Literal
+from typing import AsyncIterator, Dict, Optional, List, Literal, Tuple
 import asyncio
 import io
-from openai import AsyncOpenAI
+import time
+import uuid
+from contextlib import aclosing
+from pydantic import ValidationError
 from app.core.config import settings
+from app.core.http_clients import http_clients
+from app.core.llm_cache import CachedClient, cache_bypass, llm_cache
+from app.core.single_flight import SingleFlight
+from app.core.metrics import InstrumentedClient, STAGE_LATENCY, SLIDE_RETRIES, SLIDE_FALLBACKS, PRESCORE_DECISIONS
+from app.core.scheduler import ScheduledClient, current_deck, outbound_scheduler
 from app.core.prompts import (
     DOMAIN_RULES
 )
-from app.schemas.presentation import PresentationStructure, ConceptPlan, Slide
+from app.schemas.presentation import PresentationStructure, ConceptPlan, Diagram, Slide, SlidePlan
 from app.services.planner import Planner
 from app.services.slide_writer import SlideWriter
 from app.services.validator import Validator
+from app.services.deck_budget import DeckBudget
 from app.services.prompt_improver import PromptImprover
 from app.services.diagram_planner import DiagramPlanner
-from app.services.diagram_renderer import DiagramRenderer
+from app.services.deck_writer import DeckWriter
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# "quality": improve -> plan -> write/score per slide; "fast": one whole-deck completion
+PipelineMode = Literal["quality", "fast"]
+
+def slide_image_url(title: str) -> str:
+    """
+    The picture URL for a slide title. Images are fetched server-side, so this is the only
+    place an image_url may come from: Unsplash source by default (IMAGE_SOURCE_URL).
+    """
+    image_query = title.replace(" ", "%20")
+    return settings.IMAGE_SOURCE_URL.format(query=image_query)
+
+
 class ContentEngine:
     def __init__(self):
         self.client = None
@@ -26,21 +47,51 @@ class ContentEngine:
         self.writer = None
         self.improver = None
         self.diag_planner = None
-        
-        if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-            self.planner = Planner(self.client)
-            self.writer = SlideWriter(self.client)
-            self.improver = PromptImprover(self.client)
-            self.diag_planner = DiagramPlanner(self.client)
-        else:
+        self.deck_writer = None
+        self._inflight = SingleFlight()
+
+        if not settings.OPENAI_API_KEY:
             logger.warning("OPENAI_API_KEY not found. AI features will fail or use mock data.")
 
+    def warm_up(self) -> None:
+        """
+        Builds the OpenAI client stack on the shared, pooled "openai" HTTP client. Deferred
+        until the first AI request (or an explicit startup warm-up) because importing openai
+        dominates cold start; no-op once built.
+        """
+        if self.client is not None or not settings.OPENAI_API_KEY:
+            return
+        from openai import AsyncOpenAI
+
+        http_client = http_clients.get("openai")
+        if settings.SCHEDULER_ENABLED:
+            # Retries are owned by the scheduler (backoff without holding a slot)
+            client = ScheduledClient(
+                InstrumentedClient(AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL, max_retries=0, http_client=http_client)),
+                outbound_scheduler
+            )
+        else:
+            client = InstrumentedClient(AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL, http_client=http_client))
+        # Cache sits in front of the scheduler so hits never queue
+        if settings.LLM_CACHE_ENABLED:
+            client = CachedClient(client, llm_cache, settings.LLM_CACHE_MAX_TEMPERATURE)
+        self.planner = Planner(client)
+        self.writer = SlideWriter(client)
+        self.improver = PromptImprover(client)
+        self.diag_planner = DiagramPlanner(client)
+        self.deck_writer = DeckWriter(client)
+        self.client = client
+
+    def release_client(self) -> None:
+        """Drops the client stack at shutdown (its HTTP pool is closed by the registry); the next warm_up rebuilds it."""
+        self.client = self.planner = self.writer = self.improver = self.diag_planner = self.deck_writer = None
+
     async def improve_user_prompt(self, user_input: str) -> str:
         """UX Power Feature: Silently fixes / Improves user prompt."""
+        self.warm_up()
         return await self.improver.improve_prompt(user_input)
 
-    async def generate_structure(self, text: str, slide_count: int = 5, audience: str = "general", domain: str = "general") -> PresentationStructure:
+    async def generate_structure(self, text: str, slide_count: int = 5, audience: str = "general", domain: str = "general", mode: PipelineMode = "quality") -> PresentationStructure:
         """
         THE ULTIMATE GAMMA-LEVEL ORCHESTRATOR:
         1. Prompt Refinement (Silent Improvement)
@@ -48,80 +99,464 @@ class ContentEngine:
         3. Topic Planning (Planner)
         4. Parallel Slide Expansion (Writer)
         5. Quality Gating (Validator + AI Scoring + Retry)
-        6. Visual Planning (Diagram Suggestions)
+        6. Visual Planning (Diagram Suggestions with data points, concurrent with 4-5)
+        mode="fast" replaces 1-5 with a single whole-deck completion and skips 6 (see stream_structure).
         """
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return await self._collect_structure(text, slide_count, audience, domain, mode)
+
+        # Identical requests arriving while one is in flight share its result
+        key = (text, slide_count, audience, domain, mode, settings.SCORING_MODE, settings.WRITER_CANDIDATES)
+        structure = await self._inflight.do(
+            key, lambda: self._collect_structure(text, slide_count, audience, domain, mode)
+        )
+        return structure.model_copy(deep=True)
+
+    async def _collect_structure(self, text: str, slide_count: int, audience: str, domain: str, mode: PipelineMode) -> PresentationStructure:
+        topic = text
+        slides: List[Optional[Slide]] = []
+        async for event, data in self.stream_structure(text, slide_count, audience, domain, mode):
+            if event == "outline":
+                topic = data["topic"]
+                slides = [None] * len(data["plan"].slides)
+            elif event == "slide":
+                slides[data["index"]] = data["slide"]
+            elif event == "diagram":
+                slides[data["index"]] = slides[data["index"]].model_copy(update={"diagram": data["diagram"]})
+
+        return PresentationStructure(topic=topic, slides=slides)
+
+    async def stream_structure(self, text: str, slide_count: int = 5, audience: str = "general", domain: str = "general", mode: PipelineMode = "quality") -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Runs the same pipeline as generate_structure but yields events as soon as they are ready:
+        - ("outline", {"topic", "plan"}) once the planner returns
+        - ("slide", {"index", "slide"}) each time a slide passes the quality gate (completion order)
+        - ("diagram", {"index", "diagram"}) for slides sent before the diagram planner finished
+        In fast mode the outline and every valid slide come from one completion; only slides
+        that fail validation go through the per-slide write/score loop.
+        """
+        # Tag every outbound call of this deck so the scheduler can queue fairly across decks
+        current_deck.set(uuid.uuid4().hex)
+        deck_started = time.monotonic()
+        self.warm_up()
+
         if not self.client or settings.MOCK_AI:
             logger.info("Using MOCK AI response")
             await asyncio.sleep(1.5)
-            return self._get_mock_response(slide_count, text)
+            mock = self._get_mock_response(slide_count, text)
+            plan = ConceptPlan(slides=[
+                SlidePlan(slide_number=i + 1, title=slide.title, focus=slide.title)
+                for i, slide in enumerate(mock.slides)
+            ])
+            yield "outline", {"topic": mock.topic, "plan": plan}
+            for i, slide in enumerate(mock.slides):
+                yield "slide", {"index": i, "slide": slide}
+            return
+
+        # Domain & Audience Rules
+        domain_rules = DOMAIN_RULES.get(domain, DOMAIN_RULES["general"])
+        if audience == "technical" and domain == "general":
+            domain_rules = DOMAIN_RULES["technical"]
+        threshold = Validator.score_threshold(domain)
+
+        if mode == "fast":
+            fast_deck = await self._write_fast_deck(text, slide_count, domain_rules)
+            if fast_deck is not None:
+                async with aclosing(self._stream_fast_deck(*fast_deck, deck_started, threshold)) as events:
+                    async for event in events:
+                        yield event
+                return
+            logger.warning("Fast deck unusable, falling back to the full pipeline")
 
         # 1. Silently improve the prompt if it's too short / basic
         enhanced_text = text
         if len(text) < 50:
             logger.info("Short prompt detected. Improving internally...")
-            enhanced_text = await self.improver.improve_prompt(text)
-
-        # 2. Domain & Audience Rules
-        domain_rules = DOMAIN_RULES.get(domain, DOMAIN_RULES["general"])
-        if audience == "technical" and domain == "general":
-            domain_rules = DOMAIN_RULES["technical"]
+            with STAGE_LATENCY.time(stage="improve"):
+                enhanced_text = await self.improver.improve_prompt(text)
 
         try:
             # 3. Topic Planner Phase
-            plan_content = await self.planner.generate_outline(enhanced_text, slide_count)
+            with STAGE_LATENCY.time(stage="plan"):
+                plan_content = await self.planner.generate_outline(enhanced_text, slide_count)
             concept_plan = ConceptPlan(**json.loads(plan_content))
             logger.info(f"Planned Topic: {enhanced_text}")
 
-            # 4. Slide Expansion + 5. Validation/Scoring (Parallel)
-            tasks = [self._write_with_ai_scoring(slide_plan) for slide_plan in concept_plan.slides]
-            slides = await asyncio.gather(*tasks)
-            
-            presentation = PresentationStructure(
-                topic=enhanced_text,
-                slides=slides
-            )
+            # 6. Visual Planning runs alongside the slide writers, off the critical path
+            diagram_task = self._plan_diagrams(enhanced_text, concept_plan.slides)
+            try:
+                yield "outline", {"topic": enhanced_text, "plan": concept_plan}
+
+                # 4. Slide Expansion + 5. Validation/Scoring (emitted as slides pass the gate)
+                budget = DeckBudget.for_deck(
+                    len(concept_plan.slides),
+                    settings.DECK_RETRY_BUDGET,
+                    settings.DECK_TIME_BUDGET_SECONDS,
+                    started=deck_started
+                )
+                # Slides never wait for the planner: those sent before it finishes get a "diagram" event later
+                sent_early = []
+                async with aclosing(self._iter_slides(concept_plan.slides, budget, threshold)) as slides:
+                    async for index, slide in slides:
+                        if diagram_task is not None and diagram_task.done():
+                            diagram = self._planned_diagrams(diagram_task).get(index)
+                            if diagram is not None:
+                                slide = slide.model_copy(update={"diagram": diagram})
+                        elif diagram_task is not None:
+                            sent_early.append(index)
+                        yield "slide", {"index": index, "slide": slide}
 
-            return presentation
+                if sent_early:
+                    diagrams = await self._await_diagrams(diagram_task, budget)
+                    for index in sent_early:
+                        if index in diagrams:
+                            yield "diagram", {"index": index, "diagram": diagrams[index]}
+            finally:
+                if diagram_task is not None and not diagram_task.done():
+                    diagram_task.cancel()
 
         except Exception as e:
             logger.error(f"Ultimate Pipeline Orchestration Error: {e}")
             raise e
 
-    async def _write_with_ai_scoring(self, slide_plan, max_retries=3) -> Slide:
-        """The expansion loop with Validator + Confidence Scoring"""
-        for i in range(max_retries):
+    def _plan_diagrams(self, topic: str, slide_plans: List[SlidePlan]) -> Optional["asyncio.Task[Dict[int, Diagram]]"]:
+        """Starts the diagram planner for the outlined deck (None when diagrams are off)."""
+        if not settings.DIAGRAMS_ENABLED or settings.DIAGRAMS_PER_DECK <= 0:
+            return None
+
+        async def plan() -> Dict[int, Diagram]:
+            with STAGE_LATENCY.time(stage="diagram_plan"):
+                return await self.diag_planner.suggest_diagrams(topic, slide_plans, settings.DIAGRAMS_PER_DECK)
+        return asyncio.create_task(plan())
+
+    async def _await_diagrams(self, diagram_task: "asyncio.Task[Dict[int, Diagram]]", budget: DeckBudget) -> Dict[int, Diagram]:
+        """Waits for the planner while the deck deadline allows; a planner still running then yields no diagrams."""
+        try:
+            await asyncio.wait_for(diagram_task, timeout=budget.remaining())
+        except asyncio.TimeoutError:
+            logger.warning("Diagram planner still running at the deck deadline, deck sent without diagrams")
+            return {}
+        except Exception:
+            pass
+        return self._planned_diagrams(diagram_task)
+
+    @staticmethod
+    def _planned_diagrams(diagram_task: "asyncio.Task[Dict[int, Diagram]]") -> Dict[int, Diagram]:
+        """Diagrams of a finished planner task, by slide index ({} if it failed)."""
+        if diagram_task.cancelled() or diagram_task.exception() is not None:
+            return {}
+        return diagram_task.result()
+
+    async def _write_fast_deck(self, text: str, slide_count: int, domain_rules: str) -> Optional[Tuple[str, List[SlidePlan], List[Optional[Slide]]]]:
+        """
+        One completion for the whole deck. Returns (topic, plans, slides) where slides[i] is
+        None if that slide failed validation, or None overall if the response is unusable
+        (including fewer slides than slide_count).
+        """
+        try:
+            with STAGE_LATENCY.time(stage="fast_deck"):
+                content = await self.deck_writer.generate_deck(text, slide_count, domain_rules)
+            data = json.loads(content)
+            entries = data["slides"][:slide_count]
+        except Exception as e:
+            logger.error(f"Fast deck generation failed: {e}")
+            return None
+        if len(entries) < slide_count:
+            # A short deck would silently ship fewer slides than asked for
+            logger.warning(f"Fast deck returned {len(entries)} of {slide_count} slides")
+            return None
+
+        plans, slides = [], []
+        for i, entry in enumerate(entries):
+            entry = entry if isinstance(entry, dict) else {}
+            title = str(entry.get("title") or f"Slide {i + 1}")
+            focus = str(entry.get("focus") or title)
+            plans.append(SlidePlan(slide_number=i + 1, title=title, focus=focus))
+            slides.append(self._validate_fast_slide(entry, focus))
+        return str(data.get("topic") or text), plans, slides
+
+    def _validate_fast_slide(self, entry: dict, focus: str) -> Optional[Slide]:
+        """Schema + keyword filter + local pre-score; no remote scoring in fast mode."""
+        try:
+            slide = self._make_slide(entry["title"], entry["bullet_points"])
+        except (KeyError, TypeError, ValidationError):
+            return None
+        if not slide.points or not Validator.is_valid_slide_text(slide.title, slide.points):
+            return None
+        if settings.LOCAL_PRESCORE_ENABLED and Validator.local_score(slide.title, slide.points, focus) <= settings.PRESCORE_FAIL:
+            return None
+        return slide
+
+    async def _stream_fast_deck(self, topic: str, plans: List[SlidePlan], slides: List[Optional[Slide]], deck_started: float, threshold: int) -> AsyncIterator[Tuple[str, dict]]:
+        yield "outline", {"topic": topic, "plan": ConceptPlan(slides=plans)}
+        rewrite = []
+        for index, slide in enumerate(slides):
+            if slide is None:
+                rewrite.append(index)
+            else:
+                yield "slide", {"index": index, "slide": slide}
+        if not rewrite:
+            return
+
+        logger.info(f"Fast deck: rewriting {len(rewrite)} slide(s) that failed validation")
+        budget = DeckBudget.for_deck(
+            len(rewrite),
+            settings.DECK_RETRY_BUDGET,
+            settings.DECK_TIME_BUDGET_SECONDS,
+            started=deck_started
+        )
+        async with aclosing(self._iter_slides([plans[i] for i in rewrite], budget, threshold)) as rewritten:
+            async for position, slide in rewritten:
+                yield "slide", {"index": rewrite[position], "slide": slide}
+
+    async def regenerate_slide(self, structure: PresentationStructure, index: int, domain: str = "general") -> Optional[Slide]:
+        """
+        Rewrites slide `index` of an existing deck through the writer + quality gate, leaving
+        the plan and every other slide alone. None if no new draft passed the gate.
+        """
+        current = structure.slides[index]
+        self.warm_up()
+        if not self.client or settings.MOCK_AI:
+            return Slide(title=current.title, points=self._get_mock_response(1, structure.topic).slides[0].points, diagram=current.diagram)
+
+        current_deck.set(uuid.uuid4().hex)
+        slide_plan = SlidePlan(
+            slide_number=index + 1,
+            title=current.title,
+            focus=f"{current.title}, one slide of a presentation on: {structure.topic}"
+        )
+        budget = DeckBudget.for_deck(1, settings.DECK_RETRY_BUDGET, settings.DECK_TIME_BUDGET_SECONDS)
+        # The prompt is the same on every regeneration of this slide, so skip the LLM cache to get a new draft
+        bypass = cache_bypass.set(True)
+        try:
+            slide = await self._write_with_ai_scoring(
+                slide_plan,
+                budget,
+                Validator.score_threshold(domain),
+                settings.SLIDE_MAX_ATTEMPTS,
+                fallback=False
+            )
+        finally:
+            cache_bypass.reset(bypass)
+        # New wording, same chart
+        if slide is not None and current.diagram is not None:
+            slide = slide.model_copy(update={"diagram": current.diagram})
+        return slide
+
+    def _iter_slides(self, slide_plans: List[SlidePlan], budget: DeckBudget, threshold: int) -> AsyncIterator[Tuple[int, Slide]]:
+        if settings.SCORING_MODE == "batched":
+            return self._iter_slides_batched(slide_plans, budget, threshold, settings.SLIDE_MAX_ATTEMPTS)
+        return self._iter_slides_parallel(slide_plans, budget, threshold)
+
+    async def _iter_slides_parallel(self, slide_plans: List[SlidePlan], budget: DeckBudget, threshold: int) -> AsyncIterator[Tuple[int, Slide]]:
+        """One write -> score -> retry loop per slide (retries drawn from the deck budget), yielded in completion order."""
+        tasks = [
+            asyncio.create_task(self._write_indexed(i, slide_plan, budget, threshold))
+            for i, slide_plan in enumerate(slide_plans)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer went away (e.g. client disconnected) - don't leave writers running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _iter_slides_batched(self, slide_plans: List[SlidePlan], budget: DeckBudget, threshold: int, max_attempts=3) -> AsyncIterator[Tuple[int, Slide]]:
+        """
+        Deck-wide rounds: write every pending slide in parallel, then score ALL candidates
+        of the round in a single scoring call. Critical path is 2 round trips per round
+        instead of 2 per slide attempt.
+        """
+        pending = dict(enumerate(slide_plans))
+        for attempt in range(max_attempts):
+            if not pending:
+                return
+            if attempt > 0:
+                # Slides the budget can't cover get their fallback now, not after further rounds
+                granted = budget.acquire_retries(len(pending))
+                for index in list(pending)[granted:]:
+                    yield index, self._fallback_slide(pending.pop(index))
+                if not pending:
+                    return
+
+            started = time.monotonic()
             try:
-                content = await self.writer.generate_slide(
-                    slide_plan.title, 
-                    slide_plan.focus, 
-                    is_retry=(i > 0)
+                passed = await asyncio.wait_for(
+                    self._score_round(pending, threshold, is_retry=(attempt > 0)),
+                    timeout=budget.remaining()
                 )
+            except asyncio.TimeoutError:
+                logger.warning(f"Deck deadline reached, {len(pending)} slide(s) fall back")
+                break
+            budget.record_attempt(time.monotonic() - started)
+
+            for index, slide in passed.items():
+                del pending[index]
+                yield index, slide
+            if pending:
+                SLIDE_RETRIES.inc(len(pending), reason="quality_gate")
+                logger.warning(f"{len(pending)} slide(s) FAILED quality gate, retrying {attempt+1}...")
+
+        for index, slide_plan in pending.items():
+            yield index, self._fallback_slide(slide_plan)
+
+    async def _score_round(self, pending: dict, threshold: int, is_retry: bool) -> dict:
+        """Writes every pending slide, scores all candidates in one call; returns index -> passing slide."""
+        written = await asyncio.gather(*[
+            self._write_candidates(slide_plan, is_retry=is_retry)
+            for slide_plan in pending.values()
+        ])
+        candidates = [
+            (index, title, points)
+            for index, slide_candidates in zip(pending, written)
+            for title, points in slide_candidates
+        ]
+        if not candidates:
+            return {}
+
+        with STAGE_LATENCY.time(stage="score_batch"):
+            scores = await self._score_candidates(
+                [(title, points, pending[index].focus) for index, title, points in candidates],
+                threshold,
+                batch=True
+            )
+        best = {}
+        for (index, title, points), score in zip(candidates, scores):
+            if score >= threshold and (index not in best or score > best[index][0]):
+                best[index] = (score, title, points)
+
+        passed = {}
+        for index, (score, title, points) in best.items():
+            logger.info(f"Slide '{title}' PASSED with score {score}")
+            passed[index] = self._make_slide(title, points)
+        return passed
+
+    async def _write_indexed(self, index: int, slide_plan: SlidePlan, budget: DeckBudget, threshold: int) -> Tuple[int, Slide]:
+        return index, await self._write_with_ai_scoring(slide_plan, budget, threshold, settings.SLIDE_MAX_ATTEMPTS)
+
+    async def _write_candidates(self, slide_plan: SlidePlan, is_retry: bool) -> List[Tuple[str, List[str]]]:
+        """Writes WRITER_CANDIDATES drafts in one request; returns those that pass the keyword filter."""
+        try:
+            with STAGE_LATENCY.time(stage="write"):
+                if settings.WRITER_CANDIDATES > 1:
+                    contents = await self.writer.generate_candidates(
+                        slide_plan.title,
+                        slide_plan.focus,
+                        settings.WRITER_CANDIDATES,
+                        is_retry=is_retry
+                    )
+                else:
+                    contents = [await self.writer.generate_slide(slide_plan.title, slide_plan.focus, is_retry=is_retry)]
+        except Exception as e:
+            logger.error(f"Expansion loop failed: {e}")
+            return []
+
+        candidates = []
+        for content in contents:
+            try:
                 slide_json = json.loads(content)
                 title = slide_json["title"]
                 points = slide_json["bullet_points"]
+                # Same schema the slide is built with, so a passing draft can always become a Slide
+                Slide(title=title, points=points)
+            except Exception as e:
+                logger.error(f"Unparseable slide candidate: {e}")
+                continue
+
+            # Keyword Filter
+            if not Validator.is_valid_slide_text(title, points):
+                logger.warning(f"Keyword block for '{title}'")
+                continue
+            candidates.append((title, points))
+        return candidates
 
-                # Keyword Filter
-                if not Validator.is_valid_slide_text(title, points):
-                    logger.warning(f"Keyword block for '{title}', retrying {i+1}...")
-                    continue
-
-                # AI Quality Score
-                score = await Validator.get_confidence_score(self.client, title, points)
-                if score >= 75:
-                    logger.info(f"Slide '{title}' PASSED with score {score}")
-                    
-                    # FETCH DYNAMIC IMAGE (Silent Power Feature)
-                    image_query = title.replace(" ", "%20")
-                    # Using Unsplash source for dynamic, topic-specific high-quality photos
-                    image_url = f"https://source.unsplash.com/featured/?{image_query}"
-                    
-                    return Slide(title=title, points=points, image_url=image_url)
-                
-                logger.warning(f"Slide '{title}' FAILED quality gate ({score}), retrying {i+1}...")
+    async def _write_with_ai_scoring(self, slide_plan, budget: DeckBudget, threshold: int, max_attempts=3, fallback: bool = True) -> Optional[Slide]:
+        """
+        The expansion loop with Validator + Confidence Scoring; retries come out of the deck budget.
+        Returns the fallback slide (or None with fallback=False) if no draft passes.
+        """
+        for i in range(max_attempts):
+            if i > 0 and not budget.acquire_retries():
+                logger.warning(f"Retry budget exhausted for '{slide_plan.title}', using fallback")
+                break
+            started = time.monotonic()
+            try:
+                slide = await asyncio.wait_for(
+                    self._attempt_slide(slide_plan, threshold, is_retry=(i > 0)),
+                    timeout=budget.remaining()
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Deck deadline reached while writing '{slide_plan.title}'")
+                break
             except Exception as e:
                 logger.error(f"Expansion loop failed: {e}")
-                
+                slide = None
+            budget.record_attempt(time.monotonic() - started)
+            if slide is not None:
+                return slide
+
+        return self._fallback_slide(slide_plan) if fallback else None
+
+    async def _attempt_slide(self, slide_plan: SlidePlan, threshold: int, is_retry: bool) -> Optional[Slide]:
+        """One write + score attempt; None when no draft passes the quality gate"""
+        candidates = await self._write_candidates(slide_plan, is_retry=is_retry)
+        if not candidates:
+            SLIDE_RETRIES.inc(reason="no_usable_draft")
+            logger.warning(f"No usable draft for '{slide_plan.title}'")
+            return None
+
+        # Local pre-score, then AI Quality Score for borderline drafts (scored together in one call)
+        with STAGE_LATENCY.time(stage="score"):
+            scores = await self._score_candidates(
+                [(title, points, slide_plan.focus) for title, points in candidates],
+                threshold
+            )
+
+        score, (title, points) = max(zip(scores, candidates), key=lambda pair: pair[0])
+        if score >= threshold:
+            logger.info(f"Slide '{title}' PASSED with score {score}")
+            return self._make_slide(title, points)
+
+        SLIDE_RETRIES.inc(reason="quality_gate")
+        logger.warning(f"Slide '{title}' FAILED quality gate ({score} < {threshold})")
+        return None
+
+    async def _score_candidates(self, candidates: List[Tuple[str, List[str], str]], threshold: int, batch: bool = False) -> List[int]:
+        """
+        Scores (title, points, focus) drafts: clear passes/fails are decided by the local
+        heuristic, only the borderline rest goes to the remote scorer (in a single call;
+        batch=True always uses the batch prompt, even for one draft).
+        """
+        scores: List[Optional[int]] = [None] * len(candidates)
+        if settings.LOCAL_PRESCORE_ENABLED:
+            for i, (title, points, focus) in enumerate(candidates):
+                scores[i] = Validator.prescore(title, points, focus, threshold)
+                if scores[i] is not None:
+                    PRESCORE_DECISIONS.inc(outcome="pass" if scores[i] >= threshold else "fail")
+
+        remote = [i for i, score in enumerate(scores) if score is None]
+        if remote:
+            PRESCORE_DECISIONS.inc(len(remote), outcome="escalated")
+            if len(remote) == 1 and not batch:
+                title, points, _ = candidates[remote[0]]
+                remote_scores = [await Validator.get_confidence_score(self.client, title, points)]
+            else:
+                remote_scores = await Validator.get_confidence_scores(
+                    self.client, [(candidates[i][0], candidates[i][1]) for i in remote]
+                )
+            for i, score in zip(remote, remote_scores):
+                scores[i] = score
+        return scores
+
+    def _make_slide(self, title: str, points: List[str]) -> Slide:
+        # FETCH DYNAMIC IMAGE (Silent Power Feature)
+        return Slide(title=title, points=points, image_url=slide_image_url(title))
+
+    def _fallback_slide(self, slide_plan: SlidePlan) -> Slide:
         # Safe Fallback (Enterprise-ready)
+        SLIDE_FALLBACKS.inc()
         return Slide(
             title=slide_plan.title, 
             points=[
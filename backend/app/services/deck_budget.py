@@ -0,0 +1,41 @@
+import math
+import time
+from typing import Optional
+
+
+class DeckBudget:
+    """
+    Per-deck retry pool and deadline shared by every slide of the deck.
+    Retries are granted only while the pool lasts and while there is still time
+    for another write + score attempt (estimated from attempts seen so far).
+    """
+
+    def __init__(self, retries: int, deadline_seconds: float, started: Optional[float] = None, smoothing: float = 0.3):
+        self.retries_left = retries
+        self.deadline = (started if started is not None else time.monotonic()) + deadline_seconds
+        self.smoothing = smoothing
+        self.attempt_estimate = 0.0  # EWMA of one write + score attempt, seconds
+        self.retries_denied = 0
+
+    @classmethod
+    def for_deck(cls, slide_count: int, retries_per_slide: float, deadline_seconds: float, started: Optional[float] = None) -> "DeckBudget":
+        return cls(math.ceil(slide_count * retries_per_slide), deadline_seconds, started)
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def record_attempt(self, duration: float) -> None:
+        if self.attempt_estimate == 0.0:
+            self.attempt_estimate = duration
+        else:
+            self.attempt_estimate += self.smoothing * (duration - self.attempt_estimate)
+
+    def acquire_retries(self, wanted: int = 1) -> int:
+        """Returns how many of the wanted retries may run now (0 once the pool or the clock runs out)."""
+        if self.remaining() <= self.attempt_estimate:
+            granted = 0
+        else:
+            granted = min(wanted, self.retries_left)
+        self.retries_left -= granted
+        self.retries_denied += wanted - granted
+        return granted
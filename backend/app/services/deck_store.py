@@ -0,0 +1,146 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+from app.core.config import settings
+from app.schemas.deck import Deck
+from app.schemas.presentation import PresentationStructure
+
+logger = logging.getLogger(__name__)
+
+
+def deck_id(structure: PresentationStructure, output_type: str) -> str:
+    """
+    Content address of a rendered deck: sha256 over the normalized structure
+    (sorted keys, no insignificant whitespace) and the output type.
+    """
+    normalized = json.dumps(structure.model_dump(mode="json"), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{output_type}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+class DeckStore:
+    """
+    SQLite-backed store of rendered decks (structure JSON + file bytes), deduplicated by deck_id.
+    Files above max_deck_bytes are not stored; least recently used decks are evicted
+    once the total exceeds max_bytes.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 500 * 1024 * 1024, max_deck_bytes: int = 50 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.max_deck_bytes = max_deck_bytes
+        self.available = True
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        """
+        Opens the database on first use rather than at import. If the path cannot be opened
+        (e.g. a read-only filesystem) the store turns itself off and decks are just not kept.
+        """
+        # Caller holds the lock
+        if self._db is None and self.available:
+            try:
+                db = sqlite3.connect(self.db_path, check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS decks ("
+                    "id TEXT PRIMARY KEY, output_type TEXT NOT NULL, structure TEXT NOT NULL, file BLOB NOT NULL, "
+                    "size INTEGER NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                db.execute("CREATE INDEX IF NOT EXISTS decks_accessed ON decks (accessed_at)")
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Deck store at {self.db_path} unavailable, decks will not be stored: {e}")
+                self.available = False
+            else:
+                self._db = db
+        return self._db
+
+    def put(self, structure: PresentationStructure, output_type: str, data: bytes) -> Optional[str]:
+        """Stores a rendered deck; returns its id (None if it is too large to keep)."""
+        if len(data) > self.max_deck_bytes:
+            logger.warning(f"Deck of {len(data)} bytes exceeds the per-deck limit, not stored")
+            return None
+        key = deck_id(structure, output_type)
+        now = time.time()
+        with self._lock:
+            if self._conn() is None:
+                return None
+            self._db.execute(
+                "INSERT INTO decks (id, output_type, structure, file, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET accessed_at = excluded.accessed_at",
+                (key, output_type, structure.model_dump_json(), data, len(data), now, now),
+            )
+            self._evict()
+            self._db.commit()
+        return key
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM decks").fetchone()[0]
+        while total > self.max_bytes:
+            row = self._db.execute("SELECT id, size FROM decks ORDER BY accessed_at LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM decks WHERE id = ?", (row[0],))
+            total -= row[1]
+
+    def get(self, key: str) -> Optional[Deck]:
+        with self._lock:
+            if self._conn() is None:
+                return None
+            row = self._db.execute(
+                "SELECT id, output_type, structure, size, created_at FROM decks WHERE id = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return Deck(
+            id=row[0],
+            output_type=row[1],
+            structure=PresentationStructure.model_validate_json(row[2]),
+            size=row[3],
+            created_at=row[4],
+        )
+
+    def get_file(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = None
+            if self._conn() is not None:
+                row = self._db.execute("SELECT file FROM decks WHERE id = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute("UPDATE decks SET accessed_at = ? WHERE id = ?", (time.time(), key))
+            self._db.commit()
+        return row[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._conn() is not None:
+                self._db.execute("DELETE FROM decks")
+                self._db.commit()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, total = 0, 0
+            if self._conn() is not None:
+                entries, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM decks").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "bytes": total,
+            }
+
+
+deck_store: Optional[DeckStore] = None
+if settings.DECK_STORE_ENABLED:
+    deck_store = DeckStore(settings.DECK_STORE_PATH, settings.DECK_STORE_MAX_BYTES, settings.DECK_STORE_MAX_DECK_BYTES)
@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING
+from app.core.prompts import FULL_DECK_PROMPT
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+class DeckWriter:
+    """Fast mode: outline and bullets for the whole deck from a single completion."""
+
+    def __init__(self, client: "AsyncOpenAI"):
+        self.client = client
+
+    async def generate_deck(self, user_prompt: str, slide_count: int, domain_rules: str) -> str:
+        prompt = FULL_DECK_PROMPT.format(
+            slide_count=slide_count,
+            user_topic=user_prompt,
+            domain_rules=f"- {domain_rules}"
+        )
+
+        response = await self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are a senior presentation architect. Output valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+        )
+
+        return response.choices[0].message.content
@@ -1,41 +1,30 @@
 import json
 import logging
-from openai import AsyncOpenAI
-from typing import List, Dict
+from pydantic import ValidationError
+from typing import TYPE_CHECKING, Dict, List
+from app.core.prompts import DIAGRAM_PLANNER_PROMPT
+from app.schemas.presentation import Diagram, SlidePlan
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
 class DiagramPlanner:
-    def __init__(self, client: AsyncOpenAI):
+    def __init__(self, client: "AsyncOpenAI"):
         self.client = client
 
-    async def suggest_diagrams(self, topic: str) -> List[Dict]:
-        """
-        AI decides WHAT diagrams are needed for the presentation.
+    async def suggest_diagrams(self, topic: str, slides: List[SlidePlan], max_diagrams: int = 2) -> Dict[int, Diagram]:
         """
-        prompt = f"""
-        You are a presentation strategist.
-        Suggest specific diagrams for the following presentation topic to make it professional and visual.
-
-        RULES:
-        - Return ONLY valid JSON.
-        - Diagrams can be: flowchart, bar_chart, pie_chart, timeline.
-        - Only suggest 1-2 most critical diagrams.
-
-        TOPIC:
-        {topic}
-
-        OUTPUT FORMAT (STRICT JSON):
-        {{
-          "diagrams": [
-            {{
-              "slide_title": "string",
-              "type": "flowchart | bar_chart | pie_chart | timeline",
-              "description": "Short technical description of what the visual should represent"
-            }}
-          ]
-        }}
+        AI decides WHICH planned slides get a chart and with WHAT data points.
+        Returns slide index (0-based) -> diagram; invalid suggestions are dropped and any
+        failure yields no diagrams, since they are optional.
         """
+        prompt = DIAGRAM_PLANNER_PROMPT.format(
+            max_diagrams=max_diagrams,
+            user_topic=topic,
+            slide_list="\n".join(f"{i + 1}. {plan.title}: {plan.focus}" for i, plan in enumerate(slides))
+        )
 
         try:
             response = await self.client.chat.completions.create(
@@ -44,8 +33,21 @@ class DiagramPlanner:
                 response_format={"type": "json_object"},
                 temperature=0.2
             )
-            data = json.loads(response.choices[0].message.content)
-            return data.get("diagrams", [])
+            suggestions = json.loads(response.choices[0].message.content).get("diagrams", [])
         except Exception as e:
             logger.error(f"Diagram planning error: {e}")
-            return []
+            return {}
+
+        diagrams: Dict[int, Diagram] = {}
+        for suggestion in suggestions:
+            try:
+                index = int(suggestion["slide_number"]) - 1
+                diagram = Diagram.model_validate(suggestion)
+            except (KeyError, TypeError, ValueError, ValidationError) as e:
+                logger.warning(f"Dropping unusable diagram suggestion: {e}")
+                continue
+            if 0 <= index < len(slides) and index not in diagrams:
+                diagrams[index] = diagram
+            if len(diagrams) >= max_diagrams:
+                break
+        return diagrams
@@ -1,42 +1,196 @@
-import matplotlib.pyplot as plt
+import hashlib
 import io
 import logging
+import textwrap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional
+from app.core.config import settings
+from app.core.metrics import STAGE_LATENCY
+from app.schemas.presentation import DIAGRAM_PALETTE as PALETTE, Diagram
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 logger = logging.getLogger(__name__)
 
+DiagramFormat = Literal["png", "svg"]
+
+
+def _wrap(label: str, width: int = 14) -> str:
+    return "\n".join(textwrap.wrap(label, width)) or label
+
+
+def _draw_bar(fig: "Figure", diagram: Diagram) -> None:
+    ax = fig.add_subplot()
+    bars = ax.bar([_wrap(label) for label in diagram.labels], diagram.values, color=PALETTE[:len(diagram.labels)])
+    ax.bar_label(bars, fmt="%g", padding=2, fontsize=9)
+    ax.spines[["top", "right"]].set_visible(False)
+    ax.tick_params(axis="x", labelsize=9)
+
+def _draw_line(fig: "Figure", diagram: Diagram) -> None:
+    ax = fig.add_subplot()
+    ax.plot([_wrap(label) for label in diagram.labels], diagram.values, marker="o", color=PALETTE[0], linewidth=2)
+    ax.spines[["top", "right"]].set_visible(False)
+    ax.grid(axis="y", alpha=0.3)
+    ax.tick_params(axis="x", labelsize=9)
+
+def _draw_pie(fig: "Figure", diagram: Diagram) -> None:
+    ax = fig.add_subplot()
+    ax.pie(
+        diagram.values,
+        labels=[_wrap(label) for label in diagram.labels],
+        autopct="%1.0f%%",
+        colors=PALETTE[:len(diagram.labels)],
+        textprops={"fontsize": 9}
+    )
+    ax.axis("equal")
+
+def _draw_timeline(fig: "Figure", diagram: Diagram) -> None:
+    ax = fig.add_subplot()
+    positions = diagram.values or list(range(len(diagram.labels)))
+    ax.axhline(0, color="#64748b", linewidth=2, zorder=1)
+    ax.scatter(positions, [0] * len(positions), s=60, color=PALETTE[0], zorder=2)
+    for i, (x, label) in enumerate(zip(positions, diagram.labels)):
+        offset = 1 if i % 2 == 0 else -1
+        text = f"{x:g}\n{_wrap(label)}" if diagram.values else _wrap(label)
+        ax.annotate(text, (x, 0), xytext=(0, 28 * offset), textcoords="offset points",
+                    ha="center", va="bottom" if offset > 0 else "top", fontsize=9)
+    ax.set_ylim(-1, 1)
+    ax.axis("off")
+
+def _draw_flowchart(fig: "Figure", diagram: Diagram) -> None:
+    ax = fig.add_subplot()
+    steps = len(diagram.labels)
+    for i, label in enumerate(diagram.labels):
+        ax.text(i, 0, _wrap(label, 12), ha="center", va="center", fontsize=9, color="white",
+                bbox={"boxstyle": "round,pad=0.5", "facecolor": PALETTE[i % len(PALETTE)], "edgecolor": "none"})
+        if i < steps - 1:
+            ax.annotate("", xy=(i + 0.62, 0), xytext=(i + 0.38, 0),
+                        arrowprops={"arrowstyle": "->", "color": "#64748b", "linewidth": 1.5})
+    ax.set_xlim(-0.6, steps - 0.4)
+    ax.set_ylim(-1, 1)
+    ax.axis("off")
+
+_DRAWERS = {
+    "bar_chart": _draw_bar,
+    "line_chart": _draw_line,
+    "pie_chart": _draw_pie,
+    "timeline": _draw_timeline,
+    "flowchart": _draw_flowchart,
+}
+
+
 class DiagramRenderer:
-    @classmethod
-    def render_chart(cls, chart_type: str, description: str) -> io.BytesIO:
-        """
-        Backend renders basic charts using matplotlib based on AI description.
-        In a real prod app, you might use specialized libraries for flowcharts (Graphviz).
-        """
+    """
+    Renders slide diagrams with matplotlib's object-oriented API on an Agg canvas. No pyplot
+    state is shared, so renders run side by side in the worker pool; output bytes are cached
+    in memory by (diagram data, box size, format, dpi). matplotlib is imported on first draw.
+    """
+
+    def __init__(self, max_workers: int = 4, dpi: int = 150, max_cache_bytes: int = 32 * 1024 * 1024):
+        self.dpi = dpi
+        self.max_cache_bytes = max_cache_bytes
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="diagram-render")
+
+    def _key(self, diagram: Diagram, width_in: float, height_in: float, fmt: DiagramFormat) -> str:
+        payload = f"{diagram.model_dump_json()}#{width_in:g}x{height_in:g}@{self.dpi}.{fmt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def warm_up(self) -> None:
+        """Imports matplotlib and loads its font cache now instead of on the first chart."""
+        self.draw(Diagram(type="bar_chart", labels=["a", "b"], values=[1, 2]), 1, 1)
+
+    def draw(self, diagram: Diagram, width_in: float, height_in: float, fmt: DiagramFormat = "png") -> Optional[bytes]:
+        """Renders one diagram, uncached. None if matplotlib fails on the data."""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
         try:
-            # Simple heuristic for mock data in charts based on description
-            # In a full PROD version, another AI call would extract data points
-            plt.figure(figsize=(8, 5))
-            
-            if chart_type == "bar_chart":
-                labels = ['Category A', 'Category B', 'Category C', 'Category D']
-                values = [45, 70, 55, 90]
-                plt.bar(labels, values, color=['#ef0d50', '#eb3a70', '#e5bace', '#10b981'])
-                plt.title("Comparative Analysis")
-            elif chart_type == "pie_chart":
-                labels = ['Share A', 'Share B', 'Share C']
-                values = [40, 35, 25]
-                plt.pie(values, labels=labels, autopct='%1.1f%%', colors=['#ef0d50', '#eb3a70', '#e5bace'])
-                plt.title("Distribution")
-            else:
-                # Default placeholder for flowchart/timeline if not using graphviz
-                plt.text(0.5, 0.5, f"Diagram: {chart_type}\n{description}", 
-                         ha='center', va='center', wrap=True)
-                plt.axis('off')
-
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', bbox_inches='tight', dpi=150)
-            plt.close()
-            buf.seek(0)
-            return buf
+            with STAGE_LATENCY.time(stage="render_diagram"):
+                fig = Figure(figsize=(width_in, height_in), dpi=self.dpi, layout="constrained")
+                FigureCanvasAgg(fig)
+                _DRAWERS[diagram.type](fig, diagram)
+                if diagram.title:
+                    fig.suptitle(diagram.title, fontsize=12)
+                out = io.BytesIO()
+                fig.savefig(out, format=fmt, dpi=self.dpi)
+                return out.getvalue()
         except Exception as e:
-            logger.error(f"Rendering error: {e}")
+            logger.error(f"Rendering error for {diagram.type}: {e}")
             return None
+
+    def render(self, diagram: Diagram, width_in: float, height_in: float, fmt: DiagramFormat = "png") -> Optional[bytes]:
+        key = self._key(diagram, width_in, height_in, fmt)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        data = self.draw(diagram, width_in, height_in, fmt)
+        if data is not None:
+            self._put(key, data)
+        return data
+
+    def prepare(self, diagrams: Iterable[Optional[Diagram]], width_in: float, height_in: float, fmt: DiagramFormat = "png") -> List[Optional[bytes]]:
+        """Renders every diagram of a deck concurrently; results line up with the input (None: no diagram / failed)."""
+        diagrams = list(diagrams)
+        keys = [self._key(d, width_in, height_in, fmt) if d is not None else None for d in diagrams]
+        results: Dict[str, Optional[bytes]] = {}
+        pending = {}
+        for key, diagram in zip(keys, diagrams):
+            if key is None or key in results or key in pending:
+                continue
+            cached = self._get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = self._executor.submit(self.draw, diagram, width_in, height_in, fmt)
+
+        for key, future in pending.items():
+            data = future.result()
+            if data is not None:
+                self._put(key, data)
+            results[key] = data
+        return [results[key] if key is not None else None for key in keys]
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._cache.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def _put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_cache_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = data
+            self._cache_bytes += len(data)
+            while self._cache_bytes > self.max_cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._cache), "bytes": self._cache_bytes, "hits": self.hits, "misses": self.misses}
+
+
+diagram_renderer = DiagramRenderer(
+    max_workers=settings.DIAGRAM_RENDER_WORKERS,
+    dpi=settings.DIAGRAM_DPI,
+    max_cache_bytes=settings.DIAGRAM_CACHE_MAX_BYTES
+)
@@ -0,0 +1,161 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ImageCache:
+    """
+    Two-tier byte cache for slide pictures, keyed by URL (or any string key).
+    Hot tier: in-memory LRU bounded by max_memory_bytes.
+    Cold tier: one file per entry under directory, LRU-evicted once max_disk_bytes is exceeded.
+    """
+
+    def __init__(self, directory: Optional[str], max_disk_bytes: int = 200 * 1024 * 1024, max_memory_bytes: int = 32 * 1024 * 1024):
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # filename -> size, oldest access first
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self._indexed = False
+
+    def _disk_dir(self, create: bool = False) -> Optional[str]:
+        """
+        The cold-tier directory, indexed on first access and only created by the first write,
+        so importing the app never touches the filesystem. Unusable: memory-only from then on.
+        """
+        # Caller holds the lock
+        if self.directory and not self._indexed:
+            try:
+                if create:
+                    os.makedirs(self.directory, exist_ok=True)
+                elif not os.path.isdir(self.directory):
+                    return None
+                self._load_index()
+                self._indexed = True
+            except OSError as e:
+                logger.warning(f"Image cache directory {self.directory} unusable, caching in memory only: {e}")
+                self.directory = None
+                self._disk.clear()
+                self._disk_bytes = 0
+        return self.directory
+
+    def _load_index(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path) and not name.endswith(".tmp"):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._disk[name] = size
+            self._disk_bytes += size
+
+    @staticmethod
+    def _filename(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+
+            name = self._filename(key)
+            if self._disk_dir() and name in self._disk:
+                path = os.path.join(self.directory, name)
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    os.utime(path)
+                except OSError:
+                    self._forget_disk(name)
+                else:
+                    self._disk.move_to_end(name)
+                    self._remember(key, data)
+                    self.disk_hits += 1
+                    return data
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._remember(key, data)
+            if len(data) > self.max_disk_bytes or not self._disk_dir(create=True):
+                return
+            name = self._filename(key)
+            path = os.path.join(self.directory, name)
+            try:
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Image cache write failed: {e}")
+                return
+            self._forget_disk(name, unlink=False)
+            self._disk[name] = len(data)
+            self._disk_bytes += len(data)
+            while self._disk_bytes > self.max_disk_bytes and self._disk:
+                oldest = next(iter(self._disk))
+                self._forget_disk(oldest)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, data: bytes) -> None:
+        # Caller holds the lock
+        if len(data) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _forget_disk(self, name: str, unlink: bool = True) -> None:
+        # Caller holds the lock
+        size = self._disk.pop(name, None)
+        if size is not None:
+            self._disk_bytes -= size
+        if unlink:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+image_cache = ImageCache(
+    settings.IMAGE_CACHE_DIR if settings.IMAGE_CACHE_ENABLED else None,
+    max_disk_bytes=settings.IMAGE_CACHE_MAX_BYTES,
+    max_memory_bytes=settings.IMAGE_CACHE_MEMORY_BYTES if settings.IMAGE_CACHE_ENABLED else 0,
+)
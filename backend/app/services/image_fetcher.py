@@ -0,0 +1,89 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from app.core.config import settings
+from app.services.image_cache import ImageCache
+
+logger = logging.getLogger(__name__)
+
+
+class ImageFetcher:
+    """
+    Downloads slide images concurrently over one pooled HTTP session.
+    Each request has its own timeout and the whole prefetch has a deadline;
+    anything not back in time is reported as None so builders fall back to text-only slides.
+    Images already in the cache are returned without touching the network.
+    """
+
+    def __init__(self, max_workers: int = 8, timeout: float = 5.0, deadline: float = 10.0, max_bytes: int = 10 * 1024 * 1024, cache: Optional[ImageCache] = None):
+        self.cache = cache
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_bytes = max_bytes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-fetch")
+
+    def fetch(self, url: str) -> Optional[bytes]:
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+        return self._download_and_store(url)
+
+    def _download_and_store(self, url: str) -> Optional[bytes]:
+        data = self._download(url)
+        if data is not None and self.cache is not None:
+            self.cache.put(url, data)
+        return data
+
+    def _download(self, url: str) -> Optional[bytes]:
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    logger.warning(f"Image fetch returned {response.status_code} for {url}")
+                    return None
+                data = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    data.extend(chunk)
+                    if len(data) > self.max_bytes:
+                        logger.warning(f"Image too large, skipping {url}")
+                        return None
+                return bytes(data)
+        except Exception as e:
+            logger.error(f"Image fetch failed for {url}: {e}")
+            return None
+
+    def prefetch(self, urls: Iterable[Optional[str]]) -> Dict[str, Optional[bytes]]:
+        """Fetches every distinct URL in parallel; returns url -> bytes (None on failure/timeout)."""
+        unique = list(dict.fromkeys(url for url in urls if url))
+        results: Dict[str, Optional[bytes]] = {}
+        if self.cache is not None:
+            for url in unique:
+                cached = self.cache.get(url)
+                if cached is not None:
+                    results[url] = cached
+        missing = [url for url in unique if url not in results]
+        if not missing:
+            return results
+
+        futures = {self._executor.submit(self._download_and_store, url): url for url in missing}
+        done, not_done = wait(futures, timeout=self.deadline)
+        for future in not_done:
+            future.cancel()
+            logger.warning(f"Image prefetch deadline hit for {futures[future]}")
+
+        for future, url in futures.items():
+            results[url] = future.result() if future in done else None
+        return results
+
+
+image_fetcher = ImageFetcher(
+    max_workers=settings.IMAGE_FETCH_WORKERS,
+    timeout=settings.IMAGE_FETCH_TIMEOUT,
+    deadline=settings.IMAGE_FETCH_DEADLINE,
+)
@@ -0,0 +1,81 @@
+import io
+import logging
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional
+from PIL import Image, ImageOps
+from app.core.config import settings
+from app.core.metrics import STAGE_LATENCY
+from app.services.image_cache import ImageCache, image_cache
+from app.services.image_fetcher import ImageFetcher, image_fetcher
+
+logger = logging.getLogger(__name__)
+
+# When a render sets this to a list, URLs that could not be embedded are appended to it
+image_failures: ContextVar[Optional[List[str]]] = ContextVar("image_failures", default=None)
+
+
+def normalize_image(data: bytes, width_in: float, height_in: float, dpi: int = 150, quality: int = 85) -> Optional[bytes]:
+    """
+    Crops/downsamples an image to exactly fill a width_in x height_in box at the given DPI
+    and re-encodes it (JPEG, or PNG when it has transparency). Returns None if it can't be decoded.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img = ImageOps.exif_transpose(img)
+            size = (max(1, round(width_in * dpi)), max(1, round(height_in * dpi)))
+            has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+            img = img.convert("RGBA" if has_alpha else "RGB")
+            img = ImageOps.fit(img, size, method=Image.Resampling.LANCZOS)
+
+            out = io.BytesIO()
+            if has_alpha:
+                img.save(out, format="PNG", optimize=True, dpi=(dpi, dpi))
+            else:
+                img.save(out, format="JPEG", quality=quality, optimize=True, dpi=(dpi, dpi))
+            return out.getvalue()
+    except Exception as e:
+        logger.error(f"Image normalization failed: {e}")
+        return None
+
+
+class ImagePipeline:
+    """
+    Fetch -> normalize -> cache. Results are cached by (url, target box, dpi),
+    so repeat builds skip both the network and the decode/resize.
+    """
+
+    def __init__(self, fetcher: ImageFetcher = image_fetcher, cache: Optional[ImageCache] = image_cache, dpi: int = 150, quality: int = 85):
+        self.fetcher = fetcher
+        self.cache = cache
+        self.dpi = dpi
+        self.quality = quality
+
+    def _key(self, url: str, width_in: float, height_in: float) -> str:
+        return f"{url}#{width_in:g}x{height_in:g}@{self.dpi}"
+
+    def prepare(self, urls: Iterable[Optional[str]], width_in: float, height_in: float) -> Dict[str, Optional[bytes]]:
+        """Returns url -> embeddable bytes sized for the box (None when unavailable)."""
+        unique = list(dict.fromkeys(url for url in urls if url))
+        results: Dict[str, Optional[bytes]] = {}
+        if self.cache is not None:
+            for url in unique:
+                cached = self.cache.get(self._key(url, width_in, height_in))
+                if cached is not None:
+                    results[url] = cached
+
+        missing = [url for url in unique if url not in results]
+        if missing:
+            with STAGE_LATENCY.time(stage="image_fetch"):
+                fetched = self.fetcher.prefetch(missing)
+            for url, raw in fetched.items():
+                with STAGE_LATENCY.time(stage="image_normalize"):
+                    data = normalize_image(raw, width_in, height_in, self.dpi, self.quality) if raw else None
+                if data is not None and self.cache is not None:
+                    self.cache.put(self._key(url, width_in, height_in), data)
+                if data is None and image_failures.get() is not None:
+                    image_failures.get().append(url)
+                results[url] = data
+        return results
+
+
+image_pipeline = ImagePipeline(dpi=settings.IMAGE_DPI, quality=settings.IMAGE_JPEG_QUALITY)
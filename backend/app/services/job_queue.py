@@ -0,0 +1,348 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.schemas.job import Job
+from app.services.content_engine import content_engine
+from app.services.renderer import render_presentation, file_info
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore(ABC):
+    """Storage interface for generation jobs and their rendered files."""
+
+    # Whether other processes see the same jobs (their workers may then claim jobs queued here)
+    shared: bool = False
+
+    @abstractmethod
+    def create(self, job: Job) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        ...
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> Optional[Job]:
+        """Applies fields and bumps updated_at (with no fields: a heartbeat)."""
+
+    @abstractmethod
+    def save_file(self, job_id: str, data: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def get_file(self, job_id: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def claim_next(self) -> Optional[Job]:
+        """Atomically moves the oldest queued job to running and returns it (None if nothing is queued)."""
+
+    @abstractmethod
+    def fail_stale(self, before: float) -> int:
+        """Marks running jobs last updated before `before` as failed; returns how many."""
+
+
+_INTERRUPTED = "Interrupted: the worker running this job stopped"
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local store. Oldest jobs are dropped once max_jobs is exceeded."""
+
+    def __init__(self, max_jobs: int = 500):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._files: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                old_id, _ = self._jobs.popitem(last=False)
+                self._files.pop(old_id, None)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def update(self, job_id: str, **fields) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job = job.model_copy(update={**fields, "updated_at": time.time()})
+            self._jobs[job_id] = job
+            return job
+
+    def save_file(self, job_id: str, data: bytes) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._files[job_id] = data
+
+    def get_file(self, job_id: str) -> Optional[bytes]:
+        with self._lock:
+            return self._files.get(job_id)
+
+    def claim_next(self) -> Optional[Job]:
+        with self._lock:
+            job = next((job for job in self._jobs.values() if job.status == "queued"), None)
+            if job is None:
+                return None
+            job = job.model_copy(update={"status": "running", "updated_at": time.time()})
+            self._jobs[job.id] = job
+            return job
+
+    def fail_stale(self, before: float) -> int:
+        with self._lock:
+            stale = [job for job in self._jobs.values() if job.status == "running" and job.updated_at < before]
+            for job in stale:
+                self._jobs[job.id] = job.model_copy(update={"status": "failed", "error": _INTERRUPTED, "updated_at": time.time()})
+            return len(stale)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    File-backed store shared by every API process on the host: any process answers polls,
+    and queued jobs are claimed by whichever process's workers are free.
+    """
+
+    shared = True
+
+    def __init__(self, db_path: str, max_jobs: int = 500):
+        self.db_path = db_path
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _conn(self) -> sqlite3.Connection:
+        """Opens the database on first use rather than at import."""
+        # Caller holds the lock
+        if self._db is None:
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, data TEXT NOT NULL, file BLOB, created_at REAL NOT NULL)"
+            )
+            db.commit()
+            self._db = db
+        return self._db
+
+    def create(self, job: Job) -> None:
+        with self._lock:
+            db = self._conn()
+            db.execute(
+                "INSERT INTO jobs (id, data, created_at) VALUES (?, ?, ?)",
+                (job.id, job.model_dump_json(), job.created_at),
+            )
+            db.execute(
+                "DELETE FROM jobs WHERE id NOT IN (SELECT id FROM jobs ORDER BY created_at DESC LIMIT ?)",
+                (self.max_jobs,),
+            )
+            db.commit()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            db = self._conn()
+            row = db.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.model_validate_json(row[0]) if row else None
+
+    def update(self, job_id: str, **fields) -> Optional[Job]:
+        with self._lock:
+            db = self._conn()
+            row = db.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            job = Job.model_validate_json(row[0]).model_copy(update={**fields, "updated_at": time.time()})
+            db.execute("UPDATE jobs SET data = ? WHERE id = ?", (job.model_dump_json(), job_id))
+            db.commit()
+            return job
+
+    def save_file(self, job_id: str, data: bytes) -> None:
+        with self._lock:
+            db = self._conn()
+            db.execute("UPDATE jobs SET file = ? WHERE id = ?", (data, job_id))
+            db.commit()
+
+    def get_file(self, job_id: str) -> Optional[bytes]:
+        with self._lock:
+            db = self._conn()
+            row = db.execute("SELECT file FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    def claim_next(self) -> Optional[Job]:
+        with self._lock:
+            db = self._conn()
+            # IMMEDIATE takes the write lock up front, so two processes can't claim the same row
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute(
+                    "SELECT data FROM jobs WHERE json_extract(data, '$.status') = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                job = None
+                if row is not None:
+                    job = Job.model_validate_json(row[0]).model_copy(update={"status": "running", "updated_at": time.time()})
+                    db.execute("UPDATE jobs SET data = ? WHERE id = ?", (job.model_dump_json(), job.id))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        return job
+
+    def fail_stale(self, before: float) -> int:
+        with self._lock:
+            db = self._conn()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = db.execute(
+                    "SELECT data FROM jobs WHERE json_extract(data, '$.status') = 'running' "
+                    "AND json_extract(data, '$.updated_at') < ?",
+                    (before,),
+                ).fetchall()
+                for (data,) in rows:
+                    job = Job.model_validate_json(data).model_copy(
+                        update={"status": "failed", "error": _INTERRUPTED, "updated_at": time.time()}
+                    )
+                    db.execute("UPDATE jobs SET data = ? WHERE id = ?", (job.model_dump_json(), job.id))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        return len(rows)
+
+
+class JobQueue:
+    """
+    Runs generation jobs in the background. Submitting only records a queued job; each process
+    runs max_workers worker tasks that claim queued jobs from the store. With a shared store
+    (SQLite) workers also poll for jobs queued by other processes, so worker capacity scales
+    with the number of processes rather than with where a job was submitted. Running jobs
+    heartbeat; jobs whose heartbeat stopped (their process died) are marked failed.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int = 2, poll_interval: float = 1.0,
+                 heartbeat_interval: float = 10.0, stale_after: float = 60.0):
+        self.store = store
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._last_sweep = 0.0
+
+    def start(self) -> None:
+        """Starts this process's workers on the running loop; also happens on the first submit."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            # Replace any worker that died anyway
+            self._workers = [task if not task.done() else loop.create_task(self._worker()) for task in self._workers]
+            return
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._last_sweep = 0.0
+        self._workers = [loop.create_task(self._worker()) for _ in range(self.max_workers)]
+
+    async def stop(self) -> None:
+        """Stops the workers; jobs they were running go back to the queue."""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def submit(self, request: dict) -> Job:
+        now = time.time()
+        job = Job(id=uuid.uuid4().hex, request=request, created_at=now, updated_at=now)
+        await asyncio.to_thread(self.store.create, job)
+        self.start()
+        self._wake.set()
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                await self._sweep_stale()
+                # Cleared before claiming, so a submit that lands meanwhile still wakes us
+                self._wake.clear()
+                job = await asyncio.to_thread(self.store.claim_next)
+                if job is not None:
+                    await self._run(job)
+                    continue
+                try:
+                    # Local submits wake us directly; other processes' jobs are only seen by polling
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval if self.store.shared else None)
+                except asyncio.TimeoutError:
+                    pass
+            except Exception as e:
+                # e.g. a locked or unreachable store: keep the worker alive and try again shortly
+                logger.error(f"Job worker error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _sweep_stale(self) -> None:
+        now = time.time()
+        if now - self._last_sweep < self.stale_after:
+            return
+        self._last_sweep = now
+        failed = await asyncio.to_thread(self.store.fail_stale, now - self.stale_after)
+        if failed:
+            logger.warning(f"Marked {failed} orphaned job(s) as failed")
+
+    async def _heartbeat(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await asyncio.to_thread(self.store.update, job_id)
+
+    async def _run(self, job: Job) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+        request = job.request
+        output_type = request.get("type", "pptx")
+        try:
+            structure = await content_engine.generate_structure(
+                request["text"],
+                request.get("slideCount", 5),
+                request.get("audience", "general"),
+                request.get("domain", "general"),
+                request.get("mode", "quality")
+            )
+            file_buffer = await render_presentation(structure, output_type)
+            filename, content_type = file_info(output_type)
+
+            await asyncio.to_thread(self.store.save_file, job.id, file_buffer.getvalue())
+            await asyncio.to_thread(
+                self.store.update,
+                job.id,
+                status="succeeded",
+                structure=structure,
+                filename=filename,
+                content_type=content_type
+            )
+            logger.info(f"Job {job.id} succeeded")
+        except asyncio.CancelledError:
+            await asyncio.to_thread(self.store.update, job.id, status="queued")
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            await asyncio.to_thread(self.store.update, job.id, status="failed", error=str(e))
+        finally:
+            heartbeat.cancel()
+
+
+def _build_store() -> JobStore:
+    if settings.JOB_STORE == "sqlite":
+        return SQLiteJobStore(settings.JOB_DB_PATH, settings.JOB_MAX_RETAINED)
+    return InMemoryJobStore(settings.JOB_MAX_RETAINED)
+
+job_queue = JobQueue(
+    _build_store(),
+    settings.JOB_WORKERS,
+    poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+    heartbeat_interval=settings.JOB_HEARTBEAT_SECONDS,
+    stale_after=settings.JOB_STALE_SECONDS
+)
@@ -7,44 +7,64 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from app.schemas.presentation import PresentationStructure
+from app.services.image_processor import ImagePipeline, image_pipeline
+from app.services.diagram_renderer import DiagramRenderer, diagram_renderer
 import io
 
+# Built once per process and shared by every document instead of per generator instance
+SAMPLE_STYLES = getSampleStyleSheet()
+# Main Title Style
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=SAMPLE_STYLES['Title'],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=colors.darkblue
+)
+# Slide Title Style
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=SAMPLE_STYLES['Heading2'],
+    fontSize=18,
+    spaceBefore=20,
+    spaceAfter=15,
+    textColor=colors.black
+)
+# Bullet Point Style
+BULLET_STYLE = ParagraphStyle(
+    'CustomBullet',
+    parent=SAMPLE_STYLES['BodyText'],
+    fontSize=12,
+    leading=16, # Line height
+    spaceAfter=5
+)
+
 class PDFGenerator:
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+    IMAGE_WIDTH_IN = 4
+    IMAGE_HEIGHT_IN = 2.5
+    DIAGRAM_WIDTH_IN = 5
+    DIAGRAM_HEIGHT_IN = 3
 
-    def _setup_custom_styles(self):
-        # Main Title Style
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.darkblue
-        )
-        # Slide Title Style
-        self.heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=18,
-            spaceBefore=20,
-            spaceAfter=15,
-            textColor=colors.black
-        )
-        # Bullet Point Style
-        self.bullet_style = ParagraphStyle(
-            'CustomBullet',
-            parent=self.styles['BodyText'],
-            fontSize=12,
-            leading=16, # Line height
-            spaceAfter=5
-        )
+    def __init__(self, images: ImagePipeline = image_pipeline, diagrams: DiagramRenderer = diagram_renderer):
+        self.images = images
+        self.diagrams = diagrams
 
     def generate(self, structure: PresentationStructure) -> io.BytesIO:
         """
         Converts the structured JSON into a PDF file in memory.
         """
+        # Same shared prefetch + cache as the PPTX builder, so ReportLab never fetches URLs itself
+        images = self.images.prepare(
+            (slide.image_url for slide in structure.slides if slide.diagram is None),
+            self.IMAGE_WIDTH_IN,
+            self.IMAGE_HEIGHT_IN
+        )
+        charts = self.diagrams.prepare(
+            (slide.diagram for slide in structure.slides),
+            self.DIAGRAM_WIDTH_IN,
+            self.DIAGRAM_HEIGHT_IN
+        )
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
@@ -58,14 +78,14 @@ class PDFGenerator:
         story = []
 
         # 1. Main Title
-        story.append(Paragraph(structure.topic, self.title_style))
-        story.append(Paragraph(f"Generated by SlideGenie AI", self.styles['Italic']))
+        story.append(Paragraph(structure.topic, TITLE_STYLE))
+        story.append(Paragraph(f"Generated by SlideGenie AI", SAMPLE_STYLES['Italic']))
         story.append(Spacer(1, 0.5 * inch))
 
         # 2. Iterate Slides/Sections
-        for slide in structure.slides:
+        for slide, chart_bytes in zip(structure.slides, charts):
             # Section Title
-            story.append(Paragraph(slide.title, self.heading_style))
+            story.append(Paragraph(slide.title, HEADING_STYLE))
             
             # Content Container (Table for Image + Text)
             # If image exists, we'll use a table to put them side-by-side
@@ -73,7 +93,7 @@ class PDFGenerator:
             # Bullet Points
             list_items = []
             for point in slide.points:
-                item = ListItem(Paragraph(point, self.bullet_style), bulletColor=colors.black)
+                item = ListItem(Paragraph(point, BULLET_STYLE), bulletColor=colors.black)
                 list_items.append(item)
             
             bullets = ListFlowable(
@@ -85,13 +105,22 @@ class PDFGenerator:
 
             story.append(bullets)
             
-            # Add Image if present (simplified: just below text in PDF)
-            if slide.image_url:
+            # Add Chart, else Image if present (simplified: just below text in PDF)
+            if chart_bytes:
+                try:
+                    from reportlab.platypus import Image as RLImage
+                    story.append(Spacer(1, 0.2 * inch))
+                    story.append(RLImage(io.BytesIO(chart_bytes), width=self.DIAGRAM_WIDTH_IN*inch, height=self.DIAGRAM_HEIGHT_IN*inch))
+                except Exception as e:
+                    logger.error(f"Failed to add chart to PDF: {e}")
+
+            image_bytes = images.get(slide.image_url) if slide.image_url and not chart_bytes else None
+            if image_bytes:
                 try:
                     from reportlab.platypus import Image as RLImage
                     story.append(Spacer(1, 0.2 * inch))
                     # Use a standard width to prevent overflow
-                    img = RLImage(slide.image_url, width=4*inch, height=2.5*inch)
+                    img = RLImage(io.BytesIO(image_bytes), width=self.IMAGE_WIDTH_IN*inch, height=self.IMAGE_HEIGHT_IN*inch)
                     story.append(img)
                 except Exception as e:
                     logger.error(f"Failed to add image to PDF: {e}")
@@ -100,8 +129,8 @@ class PDFGenerator:
 
         # 3. Final Closing
         story.append(Spacer(1, 0.5 * inch))
-        story.append(Paragraph("Thank You for using SlideGenie AI!", self.styles['Heading2']))
-        story.append(Paragraph("Innovating your presentation workflow with AI.", self.styles['Italic']))
+        story.append(Paragraph("Thank You for using SlideGenie AI!", SAMPLE_STYLES['Heading2']))
+        story.append(Paragraph("Innovating your presentation workflow with AI.", SAMPLE_STYLES['Italic']))
 
         # 4. Build PDF
         doc.build(story)
@@ -1,10 +1,13 @@
 import json
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING
 from app.core.config import settings
 from app.core.prompts import CONCEPT_PLANNER_PROMPT
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 class Planner:
-    def __init__(self, client: AsyncOpenAI):
+    def __init__(self, client: "AsyncOpenAI"):
         self.client = client
 
     async def generate_outline(self, user_prompt: str, slide_count: int):
@@ -1,90 +1,65 @@
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
-from app.schemas.presentation import PresentationStructure
+from app.core.config import settings
+from app.schemas.presentation import PresentationStructure, Slide
+from app.services.image_processor import ImagePipeline, image_pipeline
+from app.services.pptx_diagrams import add_diagram
+from typing import Optional
 import io
-import requests
 import logging
+import zipfile
 
 logger = logging.getLogger(__name__)
 
 class PPTGenerator:
-    def __init__(self):
+    IMAGE_WIDTH_IN = 3.5
+    IMAGE_HEIGHT_IN = 2.625
+    DIAGRAM_WIDTH_IN = 4.5
+    DIAGRAM_HEIGHT_IN = 3.375
+
+    def __init__(self, images: ImagePipeline = image_pipeline, template_path: Optional[str] = None):
+        self.images = images
         self.LAYOUT_TITLE = 0
         self.LAYOUT_CONTENT = 1
         self.LAYOUT_TITLE_AND_CONTENT = 1
         self.LAYOUT_TWO_COLUMN = 3 # Typically 3 in default template
+        self.template_path = template_path
+        self._prototype = self._build_prototype(template_path)
 
-    def generate(self, structure: PresentationStructure) -> io.BytesIO:
+    def _build_prototype(self, template_path: Optional[str]) -> bytes:
         """
-        Converts the structured JSON into a .pptx file in memory.
+        Loads the template once and pre-builds the title + closing slides.
+        Stored as an uncompressed package so per-request loads skip inflating it.
         """
-        prs = Presentation()
+        prs = Presentation(template_path)
+
+        # Branded templates often ship sample slides - start from the layouts only
+        sld_ids = prs.slides._sldIdLst
+        for sld_id in list(sld_ids):
+            prs.part.drop_rel(sld_id.rId)
+            sld_ids.remove(sld_id)
+
+        self._add_title_and_closing(prs)
+
+        packed = io.BytesIO()
+        prs.save(packed)
+        stored = io.BytesIO()
+        with zipfile.ZipFile(packed) as zin, zipfile.ZipFile(stored, "w", zipfile.ZIP_STORED) as zout:
+            for item in zin.infolist():
+                zout.writestr(item.filename, zin.read(item.filename))
+        return stored.getvalue()
 
-        # 1. Main Title Slide
+    def _add_title_and_closing(self, prs) -> None:
+        # 1. Main Title Slide (title text is filled in per request)
         title_slide_layout = prs.slide_layouts[self.LAYOUT_TITLE]
         slide = prs.slides.add_slide(title_slide_layout)
         
-        # Set Title
-        title = slide.shapes.title
-        title.text = structure.topic
-        
         # Set Subtitle
         subtitle = slide.placeholders[1]
         subtitle.text = "Generated by SlideGenie AI"
 
-        # 2. Content Slides
-        for slide_data in structure.slides:
-            # Use two-column layout if image is present, else standard content
-            if slide_data.image_url:
-                # We'll use a standard layout and manually position image
-                slide_layout = prs.slide_layouts[self.LAYOUT_TITLE_AND_CONTENT]
-            else:
-                slide_layout = prs.slide_layouts[self.LAYOUT_CONTENT]
-                
-            slide = prs.slides.add_slide(slide_layout)
-
-            # Title
-            title_shape = slide.shapes.title
-            title_shape.text = slide_data.title
-
-            # Content (Bullets)
-            body_shape = slide.placeholders[1]
-            
-            # If image, resize the body placeholder to the left half
-            if slide_data.image_url:
-                body_shape.width = Inches(4.5)
-                body_shape.left = Inches(0.5)
-            
-            tf = body_shape.text_frame
-            tf.word_wrap = True
-            tf.clear() 
-
-            for point in slide_data.points:
-                p = tf.add_paragraph()
-                p.text = point
-                p.level = 0
-                p.font.size = Pt(18)
-                p.space_after = Pt(10)
-
-            # Add Image if present
-            if slide_data.image_url:
-                try:
-                    response = requests.get(slide_data.image_url)
-                    if response.status_code == 200:
-                        image_stream = io.BytesIO(response.content)
-                        # Position image on the right
-                        # left, top, width, height
-                        slide.shapes.add_picture(
-                            image_stream, 
-                            left=Inches(5.5), 
-                            top=Inches(1.5), 
-                            width=Inches(3.5)
-                        )
-                except Exception as e:
-                    logger.error(f"Failed to add image to PPT: {e}")
-
-        # 3. Final Thank You Slide
+        # 3. Final Thank You Slide (moved behind the content slides in generate)
         end_layout = prs.slide_layouts[self.LAYOUT_TITLE]
         end_slide = prs.slides.add_slide(end_layout)
         end_title = end_slide.shapes.title
@@ -92,6 +67,37 @@ class PPTGenerator:
         end_subtitle = end_slide.placeholders[1]
         end_subtitle.text = "Created with SlideGenie AI\nInnovating Presentations with AI"
 
+    def _new_presentation(self):
+        """Cheap per-request copy of the prototype: [title slide, closing slide]."""
+        return Presentation(io.BytesIO(self._prototype))
+
+    def generate(self, structure: PresentationStructure) -> io.BytesIO:
+        """
+        Converts the structured JSON into a .pptx file in memory.
+        """
+        # Download every slide image up front, in parallel, already sized to its box
+        images = self.images.prepare(
+            (slide_data.image_url for slide_data in structure.slides if slide_data.diagram is None),
+            self.IMAGE_WIDTH_IN,
+            self.IMAGE_HEIGHT_IN
+        )
+
+        prs = self._new_presentation()
+
+        # 1. Main Title Slide (pre-built, only the title varies)
+        title = prs.slides[0].shapes.title
+        title.text = structure.topic
+
+        # 2. Content Slides
+        for slide_data in structure.slides:
+            # Slides whose image failed or timed out fall back to text-only
+            image_bytes = images.get(slide_data.image_url) if slide_data.image_url else None
+            self._add_content_slide(prs, slide_data, image_bytes)
+
+        # 3. Final Thank You Slide (pre-built second, move it to the end)
+        sld_ids = prs.slides._sldIdLst
+        sld_ids.append(sld_ids[1])
+
         # 4. Save to memory
         output = io.BytesIO()
         prs.save(output)
@@ -99,4 +105,94 @@ class PPTGenerator:
         
         return output
 
-ppt_generator = PPTGenerator()
+    def _add_content_slide(self, prs, slide_data: Slide, image_bytes: Optional[bytes]):
+        """Appends one content slide: title, bullets and (optionally) the diagram, else the image, on the right."""
+        # Use two-column layout if image is present, else standard content
+        if image_bytes or slide_data.diagram:
+            # We'll use a standard layout and manually position image
+            slide_layout = prs.slide_layouts[self.LAYOUT_TITLE_AND_CONTENT]
+        else:
+            slide_layout = prs.slide_layouts[self.LAYOUT_CONTENT]
+            
+        slide = prs.slides.add_slide(slide_layout)
+
+        # Title
+        title_shape = slide.shapes.title
+        title_shape.text = slide_data.title
+
+        # Content (Bullets)
+        body_shape = slide.placeholders[1]
+        
+        # If image, resize the body placeholder to the left half
+        if image_bytes or slide_data.diagram:
+            body_shape.width = Inches(4.5)
+            body_shape.left = Inches(0.5)
+        
+        tf = body_shape.text_frame
+        tf.word_wrap = True
+        tf.clear() 
+
+        for point in slide_data.points:
+            p = tf.add_paragraph()
+            p.text = point
+            p.level = 0
+            p.font.size = Pt(18)
+            p.space_after = Pt(10)
+
+        # Add Diagram if present: native chart / shapes, drawn in place of the photo
+        if slide_data.diagram:
+            try:
+                add_diagram(
+                    slide,
+                    slide_data.diagram,
+                    left=Inches(5.0),
+                    top=Inches(1.5),
+                    width=Inches(self.DIAGRAM_WIDTH_IN),
+                    height=Inches(self.DIAGRAM_HEIGHT_IN)
+                )
+            except Exception as e:
+                logger.error(f"Failed to add diagram to PPT: {e}")
+            return slide
+
+        # Add Image if present
+        if image_bytes:
+            try:
+                image_stream = io.BytesIO(image_bytes)
+                # Position image on the right
+                # left, top, width, height
+                slide.shapes.add_picture(
+                    image_stream, 
+                    left=Inches(5.5), 
+                    top=Inches(1.5), 
+                    width=Inches(self.IMAGE_WIDTH_IN),
+                    height=Inches(self.IMAGE_HEIGHT_IN)
+                )
+            except Exception as e:
+                logger.error(f"Failed to add image to PPT: {e}")
+        return slide
+
+    def replace_slide(self, pptx: bytes, index: int, slide_data: Slide) -> io.BytesIO:
+        """
+        Rebuilds content slide `index` (0-based) of an already rendered deck and leaves
+        every other slide - and its already embedded image - untouched.
+        """
+        images = self.images.prepare([slide_data.image_url if slide_data.diagram is None else None], self.IMAGE_WIDTH_IN, self.IMAGE_HEIGHT_IN)
+        prs = Presentation(io.BytesIO(pptx))
+        sld_ids = prs.slides._sldIdLst
+        # Slide 0 is the title slide and the last one the closing slide
+        if not 0 <= index < len(sld_ids) - 2:
+            raise IndexError(f"Slide index {index} out of range")
+
+        old_id = sld_ids[index + 1]
+        image_bytes = images.get(slide_data.image_url) if slide_data.image_url else None
+        self._add_content_slide(prs, slide_data, image_bytes)
+        old_id.addprevious(sld_ids[-1])
+        prs.part.drop_rel(old_id.rId)
+        sld_ids.remove(old_id)
+
+        output = io.BytesIO()
+        prs.save(output)
+        output.seek(0)
+        return output
+
+ppt_generator = PPTGenerator(template_path=settings.PPT_TEMPLATE_PATH)
@@ -0,0 +1,157 @@
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION, XL_LEGEND_POSITION
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.util import Emu, Pt
+from app.schemas.presentation import DIAGRAM_PALETTE, Diagram
+
+_CHART_TYPES = {
+    "bar_chart": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "line_chart": XL_CHART_TYPE.LINE_MARKERS,
+    "pie_chart": XL_CHART_TYPE.PIE,
+}
+_TITLE_HEIGHT = Pt(28)
+_LINE_COLOR = RGBColor.from_string("64748B")
+
+
+def _color(i: int) -> RGBColor:
+    return RGBColor.from_string(DIAGRAM_PALETTE[i % len(DIAGRAM_PALETTE)].lstrip("#"))
+
+
+def add_diagram(slide, diagram: Diagram, left: int, top: int, width: int, height: int):
+    """
+    Draws a diagram as native PowerPoint objects inside the box (EMU): bar/line/pie as
+    editable charts, timeline and flowchart as shapes. Vector, so no raster step at all.
+    """
+    if diagram.type in _CHART_TYPES:
+        return _add_chart(slide, diagram, left, top, width, height)
+    if diagram.title:
+        _add_text(slide, diagram.title, left, top, width, _TITLE_HEIGHT, Pt(14), bold=True)
+        top, height = top + _TITLE_HEIGHT, height - _TITLE_HEIGHT
+    if diagram.type == "timeline":
+        _add_timeline(slide, diagram, left, top, width, height)
+    else:
+        _add_flowchart(slide, diagram, left, top, width, height)
+
+
+def _add_chart(slide, diagram: Diagram, left: int, top: int, width: int, height: int):
+    data = CategoryChartData()
+    data.categories = diagram.labels
+    data.add_series(diagram.title or "Values", diagram.values)
+    chart = slide.shapes.add_chart(_CHART_TYPES[diagram.type], left, top, width, height, data).chart
+
+    chart.has_title = bool(diagram.title)
+    if diagram.title:
+        chart.chart_title.text_frame.text = diagram.title
+        chart.chart_title.text_frame.paragraphs[0].font.size = Pt(14)
+    chart.font.size = Pt(10)
+
+    plot = chart.plots[0]
+    plot.has_data_labels = True
+    labels = plot.data_labels
+    labels.font.size = Pt(9)
+    if diagram.type == "pie_chart":
+        labels.number_format = "0%"
+        labels.number_format_is_linked = False
+        labels.show_percentage = True
+        labels.show_value = False
+        labels.position = XL_LABEL_POSITION.OUTSIDE_END
+        chart.has_legend = True
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+        for i, point in enumerate(plot.series[0].points):
+            point.format.fill.solid()
+            point.format.fill.fore_color.rgb = _color(i)
+    else:
+        chart.has_legend = False
+        series = plot.series[0]
+        if diagram.type == "bar_chart":
+            series.format.fill.solid()
+            series.format.fill.fore_color.rgb = _color(0)
+        else:
+            series.format.line.color.rgb = _color(0)
+            series.smooth = False
+    return chart
+
+
+def _add_text(slide, text: str, left: int, top: int, width: int, height: int, size, bold: bool = False, color=None):
+    box = slide.shapes.add_textbox(left, top, width, height)
+    tf = box.text_frame
+    tf.word_wrap = True
+    tf.vertical_anchor = MSO_ANCHOR.MIDDLE
+    p = tf.paragraphs[0]
+    p.text = text
+    p.alignment = PP_ALIGN.CENTER
+    p.font.size = size
+    p.font.bold = bold
+    if color is not None:
+        p.font.color.rgb = color
+    return box
+
+
+def _add_timeline(slide, diagram: Diagram, left: int, top: int, width: int, height: int) -> None:
+    """Axis line, one marker per event (spaced by value when given), labels alternating above/below."""
+    n = len(diagram.labels)
+    axis_y = top + height // 2
+    margin = width // (2 * n)
+    line = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, left, axis_y, left + width, axis_y)
+    line.line.color.rgb = _LINE_COLOR
+    line.line.width = Pt(2)
+
+    if diagram.values and max(diagram.values) > min(diagram.values):
+        low, span = min(diagram.values), max(diagram.values) - min(diagram.values)
+        fractions = [(value - low) / span for value in diagram.values]
+    else:
+        fractions = [i / (n - 1) for i in range(n)]
+
+    marker = Pt(10)
+    label_width, label_height = width // n + margin // 2, height // 2 - marker
+    for i, (fraction, label) in enumerate(zip(fractions, diagram.labels)):
+        x = left + margin + int(fraction * (width - 2 * margin))
+        dot = slide.shapes.add_shape(MSO_SHAPE.OVAL, x - marker // 2, axis_y - marker // 2, marker, marker)
+        dot.fill.solid()
+        dot.fill.fore_color.rgb = _color(0)
+        dot.line.fill.background()
+
+        text = f"{diagram.values[i]:g}\n{label}" if diagram.values else label
+        label_top = top if i % 2 == 0 else axis_y + marker
+        _add_text(slide, text, x - label_width // 2, label_top, label_width, label_height, Pt(10))
+
+
+def _add_flowchart(slide, diagram: Diagram, left: int, top: int, width: int, height: int) -> None:
+    """Rounded boxes joined by arrows: left to right for up to 4 steps, top to bottom beyond."""
+    n = len(diagram.labels)
+    horizontal = n <= 4
+    length = width if horizontal else height
+    arrow = length // (4 * n)
+    step = (length - arrow * (n - 1)) // n
+
+    for i, label in enumerate(diagram.labels):
+        offset = i * (step + arrow)
+        if horizontal:
+            box_left, box_top, box_width, box_height = left + offset, top + height // 4, step, height // 2
+        else:
+            box_left, box_top, box_width, box_height = left + width // 8, top + offset, width * 3 // 4, step
+        box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, box_left, box_top, box_width, box_height)
+        box.fill.solid()
+        box.fill.fore_color.rgb = _color(i)
+        box.line.fill.background()
+        tf = box.text_frame
+        tf.word_wrap = True
+        tf.text = label
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        tf.paragraphs[0].font.size = Pt(11 if horizontal else 10)
+        tf.paragraphs[0].font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+
+        if i < n - 1:
+            if horizontal:
+                shape = MSO_SHAPE.RIGHT_ARROW
+                arrow_box = (box_left + step, top + height // 2 - arrow // 2, arrow, arrow)
+            else:
+                shape = MSO_SHAPE.DOWN_ARROW
+                arrow_box = (left + width // 2 - arrow // 2, box_top + step, arrow, arrow)
+            connector = slide.shapes.add_shape(shape, *(Emu(v) for v in arrow_box))
+            connector.fill.solid()
+            connector.fill.fore_color.rgb = _LINE_COLOR
+            connector.line.fill.background()
@@ -1,9 +1,12 @@
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING
 from app.core.config import settings
 from app.core.prompts import PROMPT_IMPROVER_PROMPT
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 class PromptImprover:
-    def __init__(self, client: AsyncOpenAI):
+    def __init__(self, client: "AsyncOpenAI"):
         self.client = client
 
     async def improve_prompt(self, raw_input: str) -> str:
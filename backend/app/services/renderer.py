@@ -0,0 +1,217 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Literal, Optional, Tuple
+from app.core.config import settings
+from app.core.metrics import STAGE_LATENCY
+from app.core.single_flight import SingleFlight
+from app.services.deck_store import deck_id, deck_store
+from app.services.image_processor import image_failures
+from app.schemas.presentation import PresentationStructure
+
+logger = logging.getLogger(__name__)
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+PDF_CONTENT_TYPE = "application/pdf"
+
+OutputType = Literal["pptx", "pdf"]
+
+
+def file_info(output_type: OutputType) -> Tuple[str, str]:
+    """Returns the (filename, content_type) pair for an output type."""
+    if output_type == "pdf":
+        return "presentation.pdf", PDF_CONTENT_TYPE
+    return "presentation.pptx", PPTX_CONTENT_TYPE
+
+
+def _builder(output_type: OutputType):
+    """
+    The PPTX / PDF builder singleton, imported on first use so python-pptx, ReportLab
+    and matplotlib stay out of the API's cold start.
+    """
+    if output_type == "pdf":
+        from app.services.pdf_builder import pdf_generator
+        return pdf_generator
+    from app.services.ppt_builder import ppt_generator
+    return ppt_generator
+
+
+def _build(build, *args) -> Tuple[io.BytesIO, bool]:
+    """
+    Runs a builder call and reports whether the file is complete: False when a slide image
+    could not be fetched and fell back to text-only, so the file is not worth storing.
+    """
+    failures: List[str] = []
+    token = image_failures.set(failures)
+    try:
+        buffer = build(*args)
+    finally:
+        image_failures.reset(token)
+    return buffer, not failures
+
+
+def _render_sync(structure: PresentationStructure, output_type: OutputType) -> Tuple[io.BytesIO, bool]:
+    return _build(_builder(output_type).generate, structure)
+
+
+def warm_up_builders() -> None:
+    """Loads both builders (and their template / styles) plus matplotlib ahead of the first render."""
+    _builder("pptx")
+    _builder("pdf")
+    from app.services.diagram_renderer import diagram_renderer
+    diagram_renderer.warm_up()
+
+
+def _warm_up_worker() -> None:
+    """Process-pool initializer: pay the heavy imports once per worker, not per deck."""
+    warm_up_builders()
+
+
+def _render_in_worker(structure_json: str, output_type: OutputType) -> Tuple[bytes, bool]:
+    structure = PresentationStructure.model_validate_json(structure_json)
+    buffer, complete = _render_sync(structure, output_type)
+    return buffer.getvalue(), complete
+
+
+def _noop() -> None:
+    return None
+
+
+class ProcessRenderer:
+    """
+    Renders decks in a pool of worker processes so python-pptx / ReportLab work
+    runs outside the API process's GIL. Structures cross the process boundary as JSON,
+    files come back as bytes.
+    """
+
+    def __init__(self, workers: int = 2, max_tasks_per_child: Optional[int] = 50):
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # spawn: required for max_tasks_per_child, and safe with the event loop's threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up_worker,
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._executor
+
+    def warm_up(self) -> None:
+        """Starts every worker process (and runs its initializer) ahead of the first request."""
+        executor = self._get_executor()
+        for future in [executor.submit(_noop) for _ in range(self.workers)]:
+            future.result()
+
+    async def render(self, structure: PresentationStructure, output_type: OutputType) -> Tuple[io.BytesIO, bool]:
+        """Returns (file, complete) like the in-process render."""
+        loop = asyncio.get_running_loop()
+        data, complete = await loop.run_in_executor(
+            self._get_executor(), _render_in_worker, structure.model_dump_json(), output_type
+        )
+        return io.BytesIO(data), complete
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the pool; a later render starts a fresh one. wait=False returns without joining the workers."""
+        # Detached first, so a render that arrives meanwhile gets a new pool rather than this one
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+process_renderer: Optional[ProcessRenderer] = None
+if settings.RENDER_BACKEND == "process":
+    process_renderer = ProcessRenderer(settings.RENDER_WORKERS, settings.RENDER_MAX_TASKS_PER_CHILD)
+
+
+_render_flights = SingleFlight()
+
+
+async def render_presentation(structure: PresentationStructure, output_type: OutputType = "pptx") -> io.BytesIO:
+    """Renders a structure to an in-memory file (see render_deck)."""
+    buffer, _ = await render_deck(structure, output_type)
+    return buffer
+
+
+async def render_deck(structure: PresentationStructure, output_type: OutputType = "pptx") -> Tuple[io.BytesIO, Optional[str]]:
+    """
+    Renders a structure to an in-memory file; returns (file, deck id). The id is None unless
+    the deck store actually holds the file. Decks already in the store are served from it;
+    concurrent renders of an identical structure + type share one build.
+    """
+    key = deck_id(structure, output_type)
+    if deck_store is not None:
+        data = await asyncio.to_thread(deck_store.get_file, key)
+        if data is not None:
+            return io.BytesIO(data), key
+
+    if settings.SINGLE_FLIGHT_ENABLED:
+        data, stored_id = await _render_flights.do(key, lambda: _render_and_store(structure, output_type))
+    else:
+        data, stored_id = await _render_and_store(structure, output_type)
+    # Each caller gets its own stream over the shared (immutable) bytes
+    return io.BytesIO(data), stored_id
+
+
+async def _store(structure: PresentationStructure, output_type: OutputType, data: bytes, complete: bool) -> Optional[str]:
+    """Keeps a rendered file in the deck store; renders missing an image are not kept, so a retry can do better."""
+    if deck_store is None:
+        return None
+    if not complete:
+        logger.info("Render fell back to text-only for some slide images, not stored")
+        return None
+    return await asyncio.to_thread(deck_store.put, structure, output_type, data)
+
+
+async def _render_and_store(structure: PresentationStructure, output_type: OutputType) -> Tuple[bytes, Optional[str]]:
+    buffer, complete = await _render(structure, output_type)
+    data = buffer.getvalue()
+    return data, await _store(structure, output_type, data, complete)
+
+
+async def render_slide_update(
+    base: PresentationStructure,
+    structure: PresentationStructure,
+    index: int,
+    output_type: OutputType = "pptx",
+    base_file: Optional[bytes] = None
+) -> Tuple[io.BytesIO, Optional[str]]:
+    """
+    Renders `structure`, which differs from `base` only in slide `index`; returns (file, deck id)
+    like render_deck. PPTX: when the base file is known (passed in or in the deck store) only
+    that slide is rebuilt. PDF pages reflow, so PDFs are always rebuilt (images still come
+    from the image cache).
+    """
+    if output_type == "pptx":
+        if base_file is None and deck_store is not None:
+            base_file = await asyncio.to_thread(deck_store.get_file, deck_id(base, output_type))
+        if base_file is not None:
+            with STAGE_LATENCY.time(stage="render_pptx_patch"):
+                buffer, complete = await asyncio.to_thread(
+                    _build, _builder("pptx").replace_slide, base_file, index, structure.slides[index]
+                )
+            data = buffer.getvalue()
+            return io.BytesIO(data), await _store(structure, output_type, data, complete)
+    return await render_deck(structure, output_type)
+
+
+async def _render(structure: PresentationStructure, output_type: OutputType) -> Tuple[io.BytesIO, bool]:
+    """
+    Uses the process pool when RENDER_BACKEND=process, otherwise (or if the pool breaks)
+    offloads CPU-bound builder work to the threadpool to avoid blocking the event loop.
+    """
+    with STAGE_LATENCY.time(stage=f"render_{output_type}"):
+        if process_renderer is not None:
+            try:
+                return await process_renderer.render(structure, output_type)
+            except BrokenProcessPool as e:
+                logger.error(f"Render process pool broken, falling back to threads: {e}")
+                # Don't join the surviving workers here: that would block the event loop
+                process_renderer.shutdown(wait=False)
+        return await asyncio.to_thread(_render_sync, structure, output_type)
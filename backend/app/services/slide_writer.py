@@ -1,12 +1,15 @@
 import json
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING, List
 from app.core.prompts import SLIDE_CONTENT_PROMPT
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 class SlideWriter:
-    def __init__(self, client: AsyncOpenAI):
+    def __init__(self, client: "AsyncOpenAI"):
         self.client = client
 
-    async def generate_slide(self, slide_title: str, slide_focus: str, is_retry: bool = False):
+    def _messages(self, slide_title: str, slide_focus: str, is_retry: bool) -> List[dict]:
         prompt = SLIDE_CONTENT_PROMPT.format(
             slide_title=slide_title,
             slide_focus=slide_focus
@@ -15,14 +18,30 @@ class SlideWriter:
         if is_retry:
             prompt += "\n\n!! CRITICAL: Your previous output was too generic. You MUST use hard facts, specific data, and unique insights. AVOID ALL FILTER WORDS like 'Key Aspect', 'Overview', etc."
 
+        return [
+            {"role": "system", "content": "You are a professional presentation architect. Output valid JSON only."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def generate_slide(self, slide_title: str, slide_focus: str, is_retry: bool = False):
         response = await self.client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a professional presentation architect. Output valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=self._messages(slide_title, slide_focus, is_retry),
             response_format={"type": "json_object"},
             temperature=0.4 if is_retry else 0.3,
         )
 
         return response.choices[0].message.content
+
+    async def generate_candidates(self, slide_title: str, slide_focus: str, count: int, is_retry: bool = False) -> List[str]:
+        """Several independent drafts of the same slide from one request (n=count)."""
+        response = await self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=self._messages(slide_title, slide_focus, is_retry),
+            response_format={"type": "json_object"},
+            # Candidates only help if they differ, so sample a little hotter than a single draft
+            temperature=0.6 if is_retry else 0.5,
+            n=count,
+        )
+
+        return [choice.message.content for choice in response.choices]
@@ -1,11 +1,29 @@
-from typing import List
-from openai import AsyncOpenAI
-from app.core.prompts import SLIDE_SCORER_PROMPT
+import re
+from itertools import combinations
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from app.core.config import settings
+from app.core.prompts import SLIDE_SCORER_PROMPT, SLIDE_BATCH_SCORER_PROMPT
 import json
 import logging
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
+# Words too common to say anything about relevance or repetition
+STOPWORDS = frozenset("""
+a an and are as at be been by can for from has have how in into is it its of on or
+that the their this to was were what when which while with within without your you
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _content_words(text: str) -> set:
+    return {word for word in _WORD_RE.findall(text.lower()) if len(word) > 2 and word not in STOPWORDS}
+
+
 class Validator:
     FORBIDDEN_WORDS = [
         "phase",
@@ -15,15 +33,84 @@ class Validator:
         "optimization",
         "critical success"
     ]
+    # Generic filler the writer prompt asks to avoid
+    FILLER_PHRASES = [
+        "key aspect",
+        "various",
+        "important to note",
+        "plays a crucial role",
+        "in conclusion",
+        "and more",
+        "etc",
+        "many benefits",
+        "it is essential"
+    ]
+    _FORBIDDEN_RE = re.compile("|".join(re.escape(word) for word in FORBIDDEN_WORDS))
+    _FILLER_RE = re.compile(r"\b(?:" + "|".join(re.escape(phrase) for phrase in FILLER_PHRASES) + r")\b")
+
+    @classmethod
+    def score_threshold(cls, domain: str = "general") -> int:
+        """Minimum confidence score for a slide to pass the quality gate in this domain"""
+        return settings.DOMAIN_SCORE_THRESHOLDS.get(domain, settings.SCORE_THRESHOLD)
 
     @classmethod
     def is_valid_slide_text(cls, title: str, points: List[str]) -> bool:
         """Stage 3a: Basic keyword filtering"""
         text = (title + " " + " ".join(points)).lower()
-        return not any(word in text for word in cls.FORBIDDEN_WORDS)
+        return cls._FORBIDDEN_RE.search(text) is None
+
+    @classmethod
+    def local_score(cls, title: str, points: List[str], focus: str = "") -> int:
+        """
+        Stage 3b (local): 0-100 estimate from the writer prompt's rules - 3 to 5 bullets,
+        max 12 words each, no repetition, no filler, and overlap with the slide title/focus.
+        """
+        if not points:
+            return 0
+        score = 100
+
+        if len(points) > 5:
+            score -= 60  # the Slide schema can't hold more than 5 bullets
+        elif len(points) < 3:
+            score -= 25
+
+        word_counts = [len(point.split()) for point in points]
+        score -= min(30, 8 * sum(1 for count in word_counts if count > 12))
+        score -= min(15, 5 * sum(1 for count in word_counts if count < 3))
+
+        bullet_words = [_content_words(point) for point in points]
+        repeated = sum(
+            1 for a, b in combinations(bullet_words, 2)
+            if a and b and len(a & b) / len(a | b) >= 0.6
+        )
+        score -= min(45, 15 * repeated)
+
+        text = " ".join(points).lower()
+        score -= min(30, 10 * len(cls._FILLER_RE.findall(text)))
+
+        topic_words = _content_words(title + " " + focus)
+        if topic_words:
+            covered = len(topic_words & set().union(*bullet_words)) / len(topic_words)
+            if covered == 0:
+                score -= 30
+            elif covered < 0.2:
+                score -= 15
+
+        return max(0, min(100, score))
 
     @classmethod
-    async def get_confidence_score(cls, client: AsyncOpenAI, title: str, points: List[str]) -> int:
+    def prescore(cls, title: str, points: List[str], focus: str, threshold: int) -> Optional[int]:
+        """
+        Local score when it is decisive (confident pass or fail), None for borderline
+        slides that still need the remote scorer.
+        """
+        score = cls.local_score(title, points, focus)
+        if score >= max(settings.PRESCORE_PASS, threshold) or score <= settings.PRESCORE_FAIL:
+            return score
+        return None
+
+    @classmethod
+    async def get_confidence_score(cls, client: "AsyncOpenAI", title: str, points: List[str]) -> int:
         """Stage 3b: AI-based quality scoring"""
         try:
             prompt = SLIDE_SCORER_PROMPT.format(
@@ -43,3 +130,31 @@ class Validator:
         except Exception as e:
             logger.error(f"Scoring error: {e}")
             return 100 # Default to pass on failure to not block
+
+    @classmethod
+    async def get_confidence_scores(cls, client: "AsyncOpenAI", slides: List[Tuple[str, List[str]]]) -> List[int]:
+        """Stage 3b (batched): scores many (title, points) slides in a single request"""
+        if not slides:
+            return []
+        try:
+            prompt = SLIDE_BATCH_SCORER_PROMPT.format(
+                slides="\n\n".join(
+                    f"[id {i}]\nTitle: {title}\nContent: {', '.join(points)}"
+                    for i, (title, points) in enumerate(slides)
+                )
+            )
+
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                temperature=0.1
+            )
+
+            data = json.loads(response.choices[0].message.content)
+            by_id = {int(item["id"]): int(item.get("confidence_score", 0)) for item in data.get("scores", [])}
+            # Slides the scorer skipped count as failed rather than silently passing
+            return [by_id.get(i, 0) for i in range(len(slides))]
+        except Exception as e:
+            logger.error(f"Batch scoring error: {e}")
+            return [100] * len(slides) # Default to pass on failure to not block
@@ -14,7 +14,10 @@ logging.basicConfig(
 logger = logging.getLogger("slidegenie")
 
 def log_request(endpoint: str, status: str, duration_ms: float = 0):
-    """Log API request details"""
+    """Log API request details (and record them in the /metrics registry)"""
+    from app.core.metrics import HTTP_REQUESTS, HTTP_LATENCY
+    HTTP_REQUESTS.inc(endpoint=endpoint, status=status)
+    HTTP_LATENCY.observe(duration_ms / 1000, endpoint=endpoint)
     logger.info(f"API Request: {endpoint} | Status: {status} | Duration: {duration_ms:.2f}ms")
 
 def log_error(error: Exception, context: str = ""):
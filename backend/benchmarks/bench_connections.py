@@ -0,0 +1,81 @@
+"""
+Connection-reuse load test against the local fake OpenAI server: the same burst of chat
+completions sent (a) with a fresh HTTP client per request, as code without a shared
+client ends up doing, and (b) through the shared, pooled client from app.core.http_clients.
+Reports throughput, p50/p95 latency and how many TCP connections the server saw.
+
+Usage (from backend/):
+    python -m benchmarks.bench_connections [--requests 200] [--concurrency 16,64] [--latency 0.05]
+
+Over loopback a new connection costs a TCP handshake only; against the real API each one
+also pays a TLS handshake, so the gap is larger in production.
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+from benchmarks.bench_pipeline import _free_port, _int_list, percentile, start_server
+from benchmarks.fake_openai_server import FakeServerConfig
+
+MESSAGES = [{"role": "user", "content": "Create content for ONE PowerPoint slide.\n\nSLIDE TITLE:\nPooling\n"}]
+
+
+async def burst(make_client, base_url: str, requests: int, concurrency: int) -> List[float]:
+    """Sends `requests` completions, at most `concurrency` at once; returns per-request latencies."""
+    from openai import AsyncOpenAI
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            http_client, owned = make_client()
+            client = AsyncOpenAI(api_key="offline-benchmark", base_url=base_url, max_retries=0, http_client=http_client)
+            start = time.perf_counter()
+            await client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+            latencies.append(time.perf_counter() - start)
+            if owned:
+                await http_client.aclose()
+
+    await asyncio.gather(*[one() for _ in range(requests)])
+    return latencies
+
+
+async def run(args, server_app, base_url: str) -> None:
+    import httpx
+    from app.core.http_clients import HTTPClientRegistry
+
+    stats = server_app.state.stats
+    print(f"{'client':>11} | {'conc':>4} | {'req/s':>7} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'connections':>11}")
+    for concurrency in args.concurrency:
+        registry = HTTPClientRegistry(max_keepalive_connections=concurrency)
+        modes = {
+            "per-request": lambda: (httpx.AsyncClient(), True),
+            "shared": lambda: (registry.get("openai"), False),
+        }
+        for label, make_client in modes.items():
+            stats.reset()
+            start = time.perf_counter()
+            latencies = await burst(make_client, base_url, args.requests, concurrency)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:>11} | {concurrency:>4} | {args.requests / elapsed:>7.1f} | {percentile(latencies, 50) * 1000:>8.1f} | "
+                f"{percentile(latencies, 95) * 1000:>8.1f} | {len(stats.connections):>11}"
+            )
+        await registry.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=_int_list, default=[16, 64])
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake completion latency, seconds")
+    args = parser.parse_args()
+
+    port = _free_port()
+    server_app = start_server(FakeServerConfig(latency=args.latency, jitter=0, low_score_rate=0, seed=1), port)
+    asyncio.run(run(args, server_app, f"http://127.0.0.1:{port}/v1"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+End-to-end pipeline benchmark, fully offline: the real ContentEngine, image pipeline
+and builders run against the local fake OpenAI server (benchmarks/fake_openai_server.py).
+Reports decks/sec, p50/p95/p99 deck latency and upstream calls per deck for each
+slide count x concurrency level.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pipeline [--slides 3,5,10] [--concurrency 1,4,16] [--decks 16]
+        [--latency 0.3] [--failure-rate 0.02] [--low-score-rate 0.1] [--output pptx|pdf|none]
+        [--mode quality|fast]
+
+App settings can still be overridden through the environment (e.g. SCORING_MODE=batched).
+LLM, image, deck-store and single-flight caches are disabled unless --caches is given, so every deck
+pays the full pipeline cost.
+"""
+import argparse
+import asyncio
+import math
+import os
+import socket
+import tempfile
+import threading
+import time
+from typing import List
+from benchmarks.fake_openai_server import FakeServerConfig, create_app
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(config: FakeServerConfig, port: int):
+    """Runs the fake server in a background thread; returns its FastAPI app (for stats)."""
+    import uvicorn
+
+    app = create_app(config)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return app
+
+
+def configure_environment(port: int, caches: bool) -> None:
+    """Must run before any app module is imported: settings and singletons read it at import time."""
+    os.environ["OPENAI_API_KEY"] = "offline-benchmark"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    os.environ["IMAGE_SOURCE_URL"] = f"http://127.0.0.1:{port}/img/{{query}}"
+    os.environ["MOCK_AI"] = "false"
+    os.environ.setdefault("OPENAI_REQUESTS_PER_MINUTE", "0")
+    os.environ.setdefault("OPENAI_TOKENS_PER_MINUTE", "0")
+    os.environ.setdefault("OPENAI_BACKOFF_BASE", "0.1")
+    cache_dir = tempfile.mkdtemp(prefix="slidegenie-bench-")
+    os.environ.setdefault("IMAGE_CACHE_DIR", cache_dir)
+    os.environ.setdefault("DECK_STORE_PATH", os.path.join(cache_dir, "decks.sqlite3"))
+    if not caches:
+        for name in ("LLM_CACHE_ENABLED", "IMAGE_CACHE_ENABLED", "SINGLE_FLIGHT_ENABLED", "DECK_STORE_ENABLED"):
+            os.environ[name] = "false"
+
+
+async def run_level(engine, render, slide_count: int, concurrency: int, decks: int, output: str, mode: str) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one_deck(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            topic = f"Benchmark deck {i} ({slide_count} slides, concurrency {concurrency}): the water cycle"
+            structure = await engine.generate_structure(topic, slide_count, mode=mode)
+            if output != "none":
+                await render(structure, output)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[one_deck(i) for i in range(decks)])
+    return latencies
+
+
+async def run(args, server_app) -> None:
+    from app.services.content_engine import ContentEngine
+    from app.services.renderer import render_presentation
+
+    engine = ContentEngine()
+    stats = server_app.state.stats
+
+    print(f"{'slides':>6} | {'conc':>4} | {'decks/s':>7} | {'p50 (s)':>7} | {'p95 (s)':>7} | {'p99 (s)':>7} | {'calls/deck':>10} | {'fails':>5}")
+    for slide_count in args.slides:
+        for concurrency in args.concurrency:
+            decks = args.decks or max(4, concurrency * 2)
+            stats.reset()
+            start = time.perf_counter()
+            latencies = await run_level(engine, render_presentation, slide_count, concurrency, decks, args.output, args.mode)
+            elapsed = time.perf_counter() - start
+            calls = sum(stats.calls.values()) / decks
+            print(
+                f"{slide_count:>6} | {concurrency:>4} | {decks / elapsed:>7.2f} | {percentile(latencies, 50):>7.2f} | "
+                f"{percentile(latencies, 95):>7.2f} | {percentile(latencies, 99):>7.2f} | {calls:>10.1f} | {stats.failures:>5}"
+            )
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slides", type=_int_list, default=[3, 5, 10])
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4, 16])
+    parser.add_argument("--decks", type=int, default=0, help="Decks per level (default: 2x concurrency, min 4)")
+    parser.add_argument("--latency", type=float, default=0.3, help="Mean fake completion latency, seconds")
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of completions failing with 429/500")
+    parser.add_argument("--low-score-rate", type=float, default=0.1, help="Share of slides scored below the gate")
+    parser.add_argument("--output", choices=["pptx", "pdf", "none"], default="pptx")
+    parser.add_argument("--mode", choices=["quality", "fast"], default="quality", help="Pipeline mode per deck")
+    parser.add_argument("--caches", action="store_true", help="Keep LLM / image / deck-store / single-flight caches enabled")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    port = _free_port()
+    configure_environment(port, args.caches)
+    config = FakeServerConfig(args.latency, args.jitter, args.failure_rate, args.low_score_rate, seed=args.seed)
+    server_app = start_server(config, port)
+    asyncio.run(run(args, server_app))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Micro-benchmark: per-deck PPTX build time, fresh Presentation() per request (before)
+vs. cloning the pre-built template prototype (after).
+
+Usage (from backend/):
+    python -m benchmarks.bench_ppt_template [--runs 50] [--template branded.pptx]
+"""
+import argparse
+import statistics
+import time
+from pptx import Presentation
+from app.schemas.presentation import PresentationStructure
+from app.services.ppt_builder import PPTGenerator
+
+
+class FreshPPTGenerator(PPTGenerator):
+    """The previous behaviour: parse the template and build title/closing slides on every request."""
+
+    def _new_presentation(self):
+        prs = Presentation(self.template_path)
+        self._add_title_and_closing(prs)
+        return prs
+
+
+def make_structure(slide_count: int) -> PresentationStructure:
+    return PresentationStructure(
+        topic="Benchmark Deck",
+        slides=[
+            {"title": f"Slide {i + 1}", "points": [f"Bullet {j + 1} with a realistic amount of text" for j in range(5)]}
+            for i in range(slide_count)
+        ]
+    )
+
+
+def time_builds(generator: PPTGenerator, structure: PresentationStructure, runs: int) -> float:
+    generator.generate(structure)  # warm-up
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        generator.generate(structure)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--template", default=None, help="Optional custom .pptx template")
+    args = parser.parse_args()
+
+    before = FreshPPTGenerator(template_path=args.template)
+    after = PPTGenerator(template_path=args.template)
+
+    print(f"{'slides':>6} | {'before (ms)':>11} | {'after (ms)':>10} | {'speedup':>7}")
+    for slide_count in (1, 5, 15):
+        structure = make_structure(slide_count)
+        t_before = time_builds(before, structure, args.runs)
+        t_after = time_builds(after, structure, args.runs)
+        print(f"{slide_count:>6} | {t_before:>11.2f} | {t_after:>10.2f} | {t_before / t_after:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
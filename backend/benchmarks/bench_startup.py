@@ -0,0 +1,90 @@
+"""
+Cold-start benchmark: each run starts a fresh interpreter, imports app.main, runs the
+app's startup and answers GET /health in-process. Reports the median import and
+ready-to-serve times, which heavy libraries were loaded by then, and the slowest
+imports (from python -X importtime).
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup [--runs 5] [--warmup] [--top 10]
+
+--warmup sets STARTUP_WARMUP=true, i.e. measures the eager alternative.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+HEAVY_MODULES = ("openai", "pptx", "reportlab", "matplotlib", "PIL", "requests")
+
+_CHILD = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from httpx import ASGITransport, AsyncClient
+
+async def first_request():
+    async with app.main.app.router.lifespan_context(app.main.app):
+        async with AsyncClient(transport=ASGITransport(app=app.main.app), base_url="http://bench") as client:
+            assert (await client.get("/api/v1/health")).status_code == 200
+
+asyncio.run(first_request())
+ready = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "ready": ready - started,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def _env(warmup: bool) -> dict:
+    env = dict(os.environ)
+    env["STARTUP_WARMUP"] = "true" if warmup else "false"
+    env.setdefault("OPENAI_API_KEY", "offline-benchmark")
+    return env
+
+
+def run_once(warmup: bool) -> dict:
+    out = subprocess.run([sys.executable, "-c", _CHILD], env=_env(warmup), capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(warmup: bool, top: int) -> List[Tuple[float, str]]:
+    """App modules and top-level packages by cumulative import time (ms)."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD], env=_env(warmup), capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        # App modules and top-level packages only, not library internals
+        if "." not in name or name.startswith("app."):
+            entries.append((int(cumulative) / 1000, name))
+    return sorted(entries, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true", help="Measure with STARTUP_WARMUP=true")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    results = [run_once(args.warmup) for _ in range(args.runs)]
+    print(f"startup warm-up: {'on' if args.warmup else 'off'} ({args.runs} runs)")
+    print(f"import app.main : {statistics.median(r['import'] for r in results) * 1000:8.1f} ms (median)")
+    print(f"first /health   : {statistics.median(r['ready'] for r in results) * 1000:8.1f} ms (median)")
+    print(f"heavy modules   : {', '.join(results[-1]['loaded']) or 'none'}")
+    print("\nslowest imports (cumulative ms):")
+    for ms, name in slowest_imports(args.warmup, args.top):
+        print(f"  {ms:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Local OpenAI-compatible stand-in for offline benchmarks.
+
+Serves POST /v1/chat/completions with scripted answers for every pipeline prompt
+(improve, plan, write, score, batch score, fast-mode deck) and GET /img/{name} placeholder images,
+with configurable latency, failure and low-score rates.
+
+Usage (from backend/):
+    python -m benchmarks.fake_openai_server [--port 8900] [--latency 0.3] [--failure-rate 0.02]
+then point the app at it with OPENAI_BASE_URL=http://127.0.0.1:8900/v1
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, List
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from PIL import Image
+
+
+def classify(prompt: str) -> str:
+    """Which pipeline stage a prompt belongs to, based on the templates in app/core/prompts.py"""
+    if "PowerPoint slide outline" in prompt:
+        return "plan"
+    if "complete PowerPoint deck" in prompt:
+        return "deck"
+    if "Create content for ONE PowerPoint slide" in prompt:
+        return "write"
+    if "Evaluate EACH of the following slides" in prompt:
+        return "score_batch"
+    if "presentation quality evaluator" in prompt:
+        return "score"
+    if "presentation strategist" in prompt:
+        return "diagram"
+    return "improve"
+
+
+def scripted_contents(
+    stage: str,
+    prompt: str,
+    n: int = 1,
+    score_for: Callable[[str], int] = lambda title: 90,
+    bullets_for: Callable[[str], List[str]] = lambda title: [f"Specific fact {j} about {title}" for j in range(3)],
+    diagrams: list = (),
+    deck_topic: str = "Fast deck",
+) -> List[str]:
+    """
+    Message contents answering one pipeline prompt (n of them for writer drafts); shared by
+    this server and the in-process fake client in tests/fake_openai.py.
+    """
+    if stage == "plan":
+        count = int(re.search(r"EXACTLY (\d+)", prompt).group(1))
+        return [json.dumps({"slides": [
+            {"slide_number": i + 1, "title": f"Concept {i + 1}", "focus": f"Explain concept {i + 1}"}
+            for i in range(count)
+        ]})]
+    if stage == "deck":
+        count = int(re.search(r"EXACTLY (\d+)", prompt).group(1))
+        return [json.dumps({"topic": deck_topic, "slides": [
+            {"title": f"Concept {i + 1}", "focus": f"Explain concept {i + 1}", "bullet_points": bullets_for(f"Concept {i + 1}")}
+            for i in range(count)
+        ]})]
+    if stage == "write":
+        title = re.search(r"SLIDE TITLE:\n(.*)\n", prompt).group(1)
+        return [json.dumps({"title": title, "bullet_points": bullets_for(title), "draft": k}) for k in range(n)]
+    if stage == "score":
+        title = re.search(r"Title: (.*)\n", prompt).group(1)
+        return [json.dumps({"confidence_score": score_for(title)})]
+    if stage == "score_batch":
+        titles = re.findall(r"\[id (\d+)\]\nTitle: (.*)\n", prompt)
+        return [json.dumps({"scores": [
+            {"id": int(i), "confidence_score": score_for(title)} for i, title in titles
+        ]})]
+    if stage == "diagram":
+        return [json.dumps({"diagrams": list(diagrams)})]
+    return ["An improved, well-scoped presentation request"]
+
+
+@dataclass
+class FakeServerConfig:
+    latency: float = 0.3  # mean seconds per completion
+    jitter: float = 0.1  # +/- uniform jitter around the mean
+    failure_rate: float = 0.0  # share of completions answered with 500 / 429
+    low_score_rate: float = 0.1  # share of slides scored below the quality gate
+    image_size: tuple = (1200, 800)
+    seed: int | None = None
+
+
+@dataclass
+class FakeServerStats:
+    calls: Counter = field(default_factory=Counter)
+    failures: int = 0
+    images: int = 0
+    connections: set = field(default_factory=set)  # (host, port) of every client connection seen
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.connections.clear()
+        self.failures = 0
+        self.images = 0
+
+
+def _placeholder_image(size: tuple) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", size, (70, 110, 160)).save(out, format="JPEG", quality=80)
+    return out.getvalue()
+
+
+def create_app(config: FakeServerConfig | None = None) -> FastAPI:
+    config = config or FakeServerConfig()
+    app = FastAPI(title="Fake OpenAI")
+    app.state.config = config
+    app.state.stats = FakeServerStats()
+    rng = random.Random(config.seed)
+    image = _placeholder_image(config.image_size)
+
+    def score() -> int:
+        return rng.randint(40, 70) if rng.random() < config.low_score_rate else rng.randint(80, 95)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = body["messages"][-1]["content"]
+        stage = classify(prompt)
+        app.state.stats.calls[stage] += 1
+        if request.client is not None:
+            app.state.stats.connections.add((request.client.host, request.client.port))
+
+        delay = max(0.0, config.latency + rng.uniform(-config.jitter, config.jitter))
+        await asyncio.sleep(delay)
+        if rng.random() < config.failure_rate:
+            app.state.stats.failures += 1
+            status = rng.choice((429, 500))
+            error = {"message": "Simulated upstream failure", "type": "server_error", "code": None}
+            return JSONResponse({"error": error}, status_code=status, headers={"retry-after": "0"})
+
+        diagrams = []
+        if stage == "diagram":
+            diagrams = [{
+                "slide_number": 1,
+                "type": "bar_chart",
+                "title": "Benchmark figures (%)",
+                "labels": ["North", "South", "East", "West"],
+                "values": [rng.randint(10, 90) for _ in range(4)],
+            }]
+        contents = scripted_contents(
+            stage,
+            prompt,
+            body.get("n", 1),
+            score_for=lambda title: score(),
+            bullets_for=lambda title: [f"Specific fact {j} about {title}" for j in range(4)],
+            diagrams=diagrams,
+            deck_topic="Benchmark deck",
+        )
+
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in body["messages"]) // 4
+        completion_tokens = sum(len(c) for c in contents) // 4
+        return {
+            "id": f"fake-{sum(app.state.stats.calls.values())}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {"index": i, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}
+                for i, content in enumerate(contents)
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.get("/img/{name}")
+    async def placeholder(name: str):
+        app.state.stats.images += 1
+        return Response(image, media_type="image/jpeg")
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--low-score-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    config = FakeServerConfig(args.latency, args.jitter, args.failure_rate, args.low_score_rate)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import io
+import os
+import tempfile
+import threading
+import time
+import pytest
+
+# Keep the test run's rendered decks out of the working tree (read by Settings at app import)
+os.environ.setdefault("DECK_STORE_PATH", os.path.join(tempfile.mkdtemp(prefix="slidegenie-tests-"), "decks.sqlite3"))
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+
+
+def make_png(width: int = 64, height: int = 48, color=(239, 13, 80)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    """Local stand-in for an image host: /img/* serves a PNG, /slow/* stalls, anything else 404s."""
+    png = make_png()
+
+    def do_GET(self):
+        self.server.hits.append(self.path)
+        if self.path.startswith("/slow/"):
+            time.sleep(2)
+        if self.path.startswith(("/img/", "/slow/")):
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(self.png)))
+            self.end_headers()
+            self.wfile.write(self.png)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def image_server():
+    """Yields (base_url, server); server.hits records every requested path."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+    server.hits = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def empty_deck_store():
+    """Each test renders from scratch instead of hitting decks stored by earlier tests."""
+    from app.services.deck_store import deck_store
+    if deck_store is not None:
+        deck_store.clear()
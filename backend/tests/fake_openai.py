@@ -0,0 +1,75 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from openai.types.chat import ChatCompletion
+from benchmarks.fake_openai_server import classify, scripted_contents
+
+
+class FakeCompletions:
+    """
+    Scripted stand-in for AsyncOpenAI().chat.completions.
+    score_for(title) decides each slide's confidence score, bullets_for(title) its drafted
+    bullets, diagrams the planner's suggestions; stage_latency overrides latency per stage.
+    Calls are counted per stage.
+    """
+
+    def __init__(self, score_for=lambda title: 90, latency: float = 0.0, bullets_for=None, diagrams=None, stage_latency=None):
+        self.score_for = score_for
+        self.diagrams = diagrams or []
+        self.bullets_for = bullets_for or (lambda title: [f"Specific fact {j} about {title}" for j in range(3)])
+        self.latency = latency
+        self.stage_latency = stage_latency or {}
+        self.calls = Counter()
+
+    async def create(self, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        stage = classify(prompt)
+        self.calls[stage] += 1
+        latency = self.stage_latency.get(stage, self.latency)
+        if latency:
+            await asyncio.sleep(latency)
+
+        contents = scripted_contents(
+            stage,
+            prompt,
+            kwargs.get("n", 1),
+            score_for=self.score_for,
+            bullets_for=self.bullets_for,
+            diagrams=self.diagrams
+        )
+
+        return ChatCompletion.model_validate({
+            "id": f"fake-{sum(self.calls.values())}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": kwargs["model"],
+            "choices": [
+                {"index": i, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}
+                for i, content in enumerate(contents)
+            ],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": 50, "total_tokens": len(prompt) // 4 + 50},
+        })
+
+
+class FakeOpenAI:
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=FakeCompletions(**kwargs))
+
+
+def make_engine(client):
+    """A ContentEngine wired to the given client, bypassing the API-key check."""
+    from app.services.content_engine import ContentEngine
+    from app.services.planner import Planner
+    from app.services.slide_writer import SlideWriter
+    from app.services.prompt_improver import PromptImprover
+    from app.services.diagram_planner import DiagramPlanner
+    from app.services.deck_writer import DeckWriter
+
+    engine = ContentEngine()
+    engine.client = client
+    engine.planner = Planner(client)
+    engine.writer = SlideWriter(client)
+    engine.improver = PromptImprover(client)
+    engine.diag_planner = DiagramPlanner(client)
+    engine.deck_writer = DeckWriter(client)
+    return engine
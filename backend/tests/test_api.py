@@ -59,3 +59,73 @@ async def test_generate_valid_request():
             # If 500, it should be due to missing API key
             data = response.json()
             assert "detail" in data
+
+@pytest.mark.asyncio
+async def test_generate_stream_emits_outline_slides_then_file():
+    """Test that the streaming endpoint emits NDJSON events in pipeline order"""
+    import json
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/generate/stream",
+            json={"text": "Photosynthesis in plants", "slideCount": 3, "type": "pptx"}
+        )
+        assert response.status_code in [200, 429]
+        if response.status_code == 200:
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            events = [json.loads(line) for line in response.text.splitlines() if line]
+            names = [event["event"] for event in events]
+            assert names[0] == "outline"
+            assert names.count("slide") == len(events[0]["data"]["slides"])
+            assert names[-1] == "file"
+            assert events[-1]["data"]["fileBase64"]
+
+@pytest.mark.asyncio
+async def test_generate_binary_download():
+    """Test that ?download=true returns raw file bytes with the structure in a header"""
+    import base64
+    import json
+    from app.core.limiter import limiter
+    limiter.reset()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/generate?download=true",
+            json={"text": "Plate tectonics", "slideCount": 2, "type": "pdf"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert "attachment" in response.headers["content-disposition"]
+        assert response.content.startswith(b"%PDF")
+        structure = json.loads(base64.urlsafe_b64decode(response.headers["x-presentation-structure"]))
+        assert len(structure["slides"]) == 2
+
+        deck = await client.get(f"/api/v1/decks/{response.headers['x-deck-id']}")
+        assert deck.json()["data"]["structure"] == structure
+
+@pytest.mark.asyncio
+async def test_regenerate_single_slide():
+    """Test that one slide is regenerated and the rest of the deck is kept"""
+    structure = {
+        "topic": "Plate tectonics",
+        "slides": [
+            {"title": "Plates", "points": ["Earth's crust is split into plates"]},
+            {"title": "Boundaries", "points": ["Plates meet at boundaries"]}
+        ]
+    }
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/generate/slide", json={"structure": structure, "slideIndex": 1})
+        assert response.status_code == 200
+        slides = response.json()["data"]["structure"]["slides"]
+        assert slides[0] == {**structure["slides"][0], "image_url": None, "diagram": None}
+        assert slides[1]["title"] == "Boundaries"
+        assert slides[1]["points"] != structure["slides"][1]["points"]
+
+        # A stored deck can be edited by id; the patched deck is stored under its own id
+        deck_id = response.json()["data"]["deckId"]
+        response = await client.post("/api/v1/generate/slide", json={"deckId": deck_id, "slideIndex": 0})
+        assert response.status_code == 200
+        assert response.json()["data"]["deckId"] != deck_id
+
+        response = await client.post("/api/v1/generate/slide", json={"structure": structure, "slideIndex": 5})
+        assert response.status_code == 400
+        response = await client.post("/api/v1/generate/slide", json={"slideIndex": 0})
+        assert response.status_code == 422
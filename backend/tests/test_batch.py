@@ -0,0 +1,47 @@
+import io
+import json
+import zipfile
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.core.limiter import limiter
+from app.main import app
+
+ITEMS = [
+    {"text": "Photosynthesis", "slideCount": 2},
+    {"text": "The French Revolution", "slideCount": 3, "type": "pdf"},
+]
+
+@pytest.mark.asyncio
+async def test_batch_streams_a_zip_with_manifest():
+    limiter.reset()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/generate/batch", json={"items": ITEMS})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert sorted(archive.namelist()) == ["01-photosynthesis.pptx", "02-the-french-revolution.pdf", "manifest.json"]
+    assert archive.read("02-the-french-revolution.pdf").startswith(b"%PDF")
+    manifest = json.loads(archive.read("manifest.json"))
+    assert [item["status"] for item in manifest] == ["succeeded", "succeeded"]
+    assert all(item["deckId"] for item in manifest)
+
+@pytest.mark.asyncio
+async def test_batch_json_results_per_item():
+    limiter.reset()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/generate/batch", json={"items": ITEMS, "format": "json"})
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert [item["index"] for item in items] == [0, 1]
+    assert [len(item["structure"]["slides"]) for item in items] == [2, 3]
+    assert all(item["fileBase64"] for item in items)
+
+@pytest.mark.asyncio
+async def test_batch_validates_items():
+    limiter.reset()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        too_long = await client.post("/api/v1/generate/batch", json={"items": [{"text": "x" * 2001}]})
+        empty = await client.post("/api/v1/generate/batch", json={"items": []})
+    assert too_long.status_code == 400
+    assert empty.status_code == 422
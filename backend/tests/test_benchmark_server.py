@@ -0,0 +1,27 @@
+import httpx
+import pytest
+from openai import AsyncOpenAI
+from benchmarks.bench_pipeline import percentile
+from benchmarks.fake_openai_server import FakeServerConfig, create_app
+from tests.fake_openai import make_engine
+
+TOPIC = "The history of the printing press and its effect on literacy"
+
+@pytest.mark.asyncio
+async def test_engine_runs_against_fake_openai_server():
+    app = create_app(FakeServerConfig(latency=0, jitter=0, low_score_rate=0, seed=1))
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    client = AsyncOpenAI(api_key="test", base_url="http://fake/v1", http_client=http_client)
+
+    structure = await make_engine(client).generate_structure(TOPIC, 3)
+
+    assert [slide.title for slide in structure.slides] == ["Concept 1", "Concept 2", "Concept 3"]
+    calls = app.state.stats.calls
+    assert (calls["plan"], calls["write"], calls["score"]) == (1, 3, 3)
+    await http_client.aclose()
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 99) == 99
+    assert percentile([2.0], 95) == 2.0
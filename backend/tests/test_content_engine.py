@@ -0,0 +1,245 @@
+import json
+import time
+import pytest
+from app.core.config import settings
+from tests.fake_openai import FakeOpenAI, make_engine
+
+TOPIC = "How vaccines train the adaptive immune system to recognise pathogens"
+
+@pytest.mark.asyncio
+async def test_per_slide_pipeline_scores_each_slide():
+    client = FakeOpenAI()
+    engine = make_engine(client)
+    structure = await engine.generate_structure(TOPIC, 4)
+
+    assert [slide.title for slide in structure.slides] == [f"Concept {i}" for i in range(1, 5)]
+    calls = client.chat.completions.calls
+    assert calls["plan"] == 1
+    assert calls["write"] == 4
+    assert calls["score"] == 4
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bad_bullets", [[1, 2, 3], [f"Specific fact {j} about Concept 2" for j in range(6)]])
+async def test_batched_mode_survives_a_malformed_draft(monkeypatch, bad_bullets):
+    monkeypatch.setattr(settings, "SCORING_MODE", "batched")
+    monkeypatch.setattr(settings, "LOCAL_PRESCORE_ENABLED", False)
+    default = lambda title: [f"Specific fact {j} about {title}" for j in range(3)]
+    client = FakeOpenAI(bullets_for=lambda title: bad_bullets if title == "Concept 2" else default(title))
+    structure = await make_engine(client).generate_structure(TOPIC, 3)
+
+    assert [slide.title for slide in structure.slides] == ["Concept 1", "Concept 2", "Concept 3"]
+    assert structure.slides[0].points == default("Concept 1")
+    assert structure.slides[1].points != bad_bullets
+
+@pytest.mark.asyncio
+async def test_stream_emits_outline_before_slides():
+    engine = make_engine(FakeOpenAI())
+    events = [event async for event, _ in engine.stream_structure(TOPIC, 3)]
+    assert events == ["outline", "slide", "slide", "slide"]
+
+@pytest.mark.asyncio
+async def test_batched_scoring_uses_one_call_per_round(monkeypatch):
+    monkeypatch.setattr(settings, "SCORING_MODE", "batched")
+    # Concept 2 fails its first round, so a second (smaller) round is needed
+    attempts = {}
+    def score_for(title):
+        attempts[title] = attempts.get(title, 0) + 1
+        return 50 if title == "Concept 2" and attempts[title] == 1 else 90
+
+    client = FakeOpenAI(score_for=score_for)
+    structure = await make_engine(client).generate_structure(TOPIC, 5)
+
+    calls = client.chat.completions.calls
+    assert calls["score_batch"] == 2
+    assert calls["score"] == 0
+    assert calls["write"] == 6
+    assert structure.slides[1].title == "Concept 2"
+    assert structure.slides[1].image_url is not None  # passed on retry, not a fallback
+
+@pytest.mark.asyncio
+async def test_writer_candidates_keep_best_passing(monkeypatch):
+    monkeypatch.setattr(settings, "WRITER_CANDIDATES", 3)
+    client = FakeOpenAI()
+    structure = await make_engine(client).generate_structure(TOPIC, 2)
+
+    calls = client.chat.completions.calls
+    assert calls["write"] == 2        # one request per slide, three drafts each
+    assert calls["score_batch"] == 2  # drafts of a slide are scored together
+    assert all(slide.image_url for slide in structure.slides)
+
+@pytest.mark.asyncio
+async def test_failing_slides_fall_back_after_retries(monkeypatch):
+    monkeypatch.setattr(settings, "SCORING_MODE", "batched")
+    monkeypatch.setattr(settings, "DECK_RETRY_BUDGET", 2)
+    client = FakeOpenAI(score_for=lambda title: 10)
+    structure = await make_engine(client).generate_structure(TOPIC, 2)
+
+    assert client.chat.completions.calls["score_batch"] == 3
+    assert all(slide.image_url is None for slide in structure.slides)
+
+@pytest.mark.asyncio
+async def test_retries_share_one_deck_budget(monkeypatch):
+    monkeypatch.setattr(settings, "DECK_RETRY_BUDGET", 0.5)
+    client = FakeOpenAI(score_for=lambda title: 10)
+    structure = await make_engine(client).generate_structure(TOPIC, 4)
+
+    # 4 first attempts + a shared pool of 2 retries, instead of 2 retries per slide
+    assert client.chat.completions.calls["write"] == 6
+    assert all(slide.image_url is None for slide in structure.slides)
+
+@pytest.mark.asyncio
+async def test_deck_deadline_bounds_slow_provider(monkeypatch):
+    monkeypatch.setattr(settings, "DECK_TIME_BUDGET_SECONDS", 0.3)
+    client = FakeOpenAI(latency=0.2)
+    started = time.monotonic()
+    structure = await make_engine(client).generate_structure(TOPIC, 3)
+
+    # plan (0.2s) + write (0.2s) overrun the deadline, so every slide falls back on time
+    assert time.monotonic() - started < 0.5
+    assert len(structure.slides) == 3
+    assert all(slide.image_url is None for slide in structure.slides)
+
+@pytest.mark.asyncio
+async def test_score_threshold_is_configurable_per_domain(monkeypatch):
+    monkeypatch.setattr(settings, "DOMAIN_SCORE_THRESHOLDS", {"medicine": 95})
+    client = FakeOpenAI(score_for=lambda title: 90)
+    engine = make_engine(client)
+
+    general = await engine.generate_structure(TOPIC, 2)
+    medicine = await engine.generate_structure(TOPIC, 2, domain="medicine")
+
+    assert all(slide.image_url for slide in general.slides)
+    assert all(slide.image_url is None for slide in medicine.slides)
+
+@pytest.mark.asyncio
+async def test_fast_mode_writes_the_deck_in_one_call():
+    client = FakeOpenAI()
+    structure = await make_engine(client).generate_structure(TOPIC, 4, mode="fast")
+
+    assert structure.topic == "Fast deck"
+    assert [slide.title for slide in structure.slides] == [f"Concept {i}" for i in range(1, 5)]
+    assert all(slide.image_url for slide in structure.slides)
+    calls = client.chat.completions.calls
+    assert sum(calls.values()) == calls["deck"] == 1
+
+@pytest.mark.asyncio
+async def test_fast_mode_rewrites_only_invalid_slides():
+    drafts = {}
+    def bullets_for(title):
+        drafts[title] = drafts.get(title, 0) + 1
+        if title == "Concept 2" and drafts[title] == 1:
+            return ["A winning strategy overview"]  # blocked by the keyword filter
+        return [f"Specific fact {j} about {title}" for j in range(3)]
+
+    client = FakeOpenAI(bullets_for=bullets_for)
+    structure = await make_engine(client).generate_structure(TOPIC, 3, mode="fast")
+
+    calls = client.chat.completions.calls
+    assert calls["deck"] == 1
+    assert calls["write"] == 1
+    assert structure.slides[1].points[0] == "Specific fact 0 about Concept 2"
+
+@pytest.mark.asyncio
+async def test_short_fast_deck_falls_back_to_the_full_pipeline():
+    client = FakeOpenAI()
+    engine = make_engine(client)
+
+    async def two_slides(text, slide_count, domain_rules):
+        return json.dumps({"topic": "Fast deck", "slides": [
+            {"title": f"Concept {i}", "bullet_points": [f"Specific fact {j} about Concept {i}" for j in range(3)]}
+            for i in range(1, 3)
+        ]})
+    engine.deck_writer.generate_deck = two_slides
+    structure = await engine.generate_structure(TOPIC, 4, mode="fast")
+
+    assert len(structure.slides) == 4
+    assert client.chat.completions.calls["plan"] == 1
+
+@pytest.mark.asyncio
+async def test_regenerate_slide_only_rewrites_that_slide():
+    from app.schemas.presentation import PresentationStructure
+    client = FakeOpenAI()
+    deck = PresentationStructure(topic="Vaccines", slides=[
+        {"title": "Antigens", "points": ["Old point"]},
+        {"title": "Memory Cells", "points": ["Old point"]}
+    ])
+    slide = await make_engine(client).regenerate_slide(deck, 1)
+
+    assert slide.title == "Memory Cells"
+    assert slide.points[0] == "Specific fact 0 about Memory Cells"
+    calls = client.chat.completions.calls
+    assert calls["plan"] == 0 and calls["write"] == 1
+
+    failing = FakeOpenAI(score_for=lambda title: 10)
+    assert await make_engine(failing).regenerate_slide(deck, 0) is None
+
+@pytest.mark.asyncio
+async def test_regenerate_slide_bypasses_the_llm_cache():
+    from app.core.llm_cache import CachedClient, LLMCache
+    from app.schemas.presentation import PresentationStructure
+    drafts = iter(range(100))
+    client = FakeOpenAI(bullets_for=lambda title: [f"Draft {next(drafts)} fact {j} about {title}" for j in range(3)])
+    engine = make_engine(CachedClient(client, LLMCache()))
+    deck = PresentationStructure(topic="Vaccines", slides=[{"title": "Antigens", "points": ["Old point"]}])
+
+    first = await engine.regenerate_slide(deck, 0)
+    second = await engine.regenerate_slide(deck, 0)
+
+    assert first.points != second.points
+    calls = client.chat.completions.calls
+    assert calls["write"] == 2 and calls["score"] == 2
+
+@pytest.mark.asyncio
+async def test_planned_diagrams_are_attached_to_their_slides():
+    client = FakeOpenAI(diagrams=[
+        {"slide_number": 2, "type": "bar_chart", "title": "Cases (millions)", "labels": ["1980", "2000"], "values": [4.2, 0.9]},
+        {"slide_number": 3, "type": "pie_chart", "labels": ["A", "B"], "values": [1]},  # invalid: dropped
+    ])
+    engine = make_engine(client)
+    structure = await engine.generate_structure(TOPIC, 3)
+
+    assert client.chat.completions.calls["diagram"] == 1
+    assert [slide.diagram is not None for slide in structure.slides] == [False, True, False]
+    assert structure.slides[1].diagram.values == [4.2, 0.9]
+
+@pytest.mark.asyncio
+async def test_slow_diagram_planner_does_not_hold_back_slides(monkeypatch):
+    monkeypatch.setattr(settings, "DECK_TIME_BUDGET_SECONDS", 0.5)
+    client = FakeOpenAI(
+        stage_latency={"diagram": 3},
+        diagrams=[{"slide_number": 1, "type": "bar_chart", "labels": ["A", "B"], "values": [1, 2]}]
+    )
+    started = time.monotonic()
+    events = [event async for event in make_engine(client).stream_structure(TOPIC, 3)]
+
+    assert time.monotonic() - started < 1.5
+    slides = [data["slide"] for event, data in events if event == "slide"]
+    assert len(slides) == 3
+    assert all(slide.diagram is None for slide in slides)
+    assert [event for event, _ in events].count("diagram") == 0
+
+@pytest.mark.asyncio
+async def test_late_diagrams_follow_the_slides():
+    client = FakeOpenAI(
+        stage_latency={"diagram": 0.5},
+        diagrams=[{"slide_number": 2, "type": "bar_chart", "labels": ["A", "B"], "values": [1, 2]}]
+    )
+    engine = make_engine(client)
+    started = time.monotonic()
+    events = []
+    async for event, data in engine.stream_structure(TOPIC, 3):
+        events.append((event, data, time.monotonic() - started))
+
+    assert [event for event, _, _ in events] == ["outline", "slide", "slide", "slide", "diagram"]
+    assert all(elapsed < 0.4 for event, _, elapsed in events if event == "slide")
+    assert events[-1][1]["index"] == 1 and events[-1][1]["diagram"].values == [1, 2]
+
+    structure = await engine.generate_structure(TOPIC, 3)
+    assert [slide.diagram is not None for slide in structure.slides] == [False, True, False]
+
+@pytest.mark.asyncio
+async def test_diagrams_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "DIAGRAMS_ENABLED", False)
+    client = FakeOpenAI()
+    await make_engine(client).generate_structure(TOPIC, 2)
+    assert client.chat.completions.calls["diagram"] == 0
@@ -0,0 +1,96 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.schemas.presentation import PresentationStructure
+from app.services import renderer
+from app.services.deck_store import DeckStore, deck_id
+
+def make_structure(topic: str) -> PresentationStructure:
+    return PresentationStructure(topic=topic, slides=[{"title": "One", "points": ["Point"]}])
+
+def test_deck_id_ignores_formatting_but_not_content():
+    a = PresentationStructure.model_validate_json('{"topic": "T", "slides": [{"title": "One", "points": ["Point"]}]}')
+    b = PresentationStructure.model_validate_json('{"slides":[{"points":["Point"],"title":"One"}],"topic":"T"}')
+    assert deck_id(a, "pptx") == deck_id(b, "pptx")
+    assert deck_id(a, "pptx") != deck_id(a, "pdf")
+    assert deck_id(a, "pptx") != deck_id(make_structure("Other"), "pptx")
+
+def test_store_deduplicates_and_evicts_least_recently_used(tmp_path):
+    store = DeckStore(str(tmp_path / "decks.sqlite3"), max_bytes=250, max_deck_bytes=200)
+    first = store.put(make_structure("First"), "pdf", b"x" * 100)
+    assert store.put(make_structure("First"), "pdf", b"x" * 100) == first
+    second = store.put(make_structure("Second"), "pdf", b"y" * 100)
+    store.get_file(first)  # touch: Second is now the least recently used
+    store.put(make_structure("Third"), "pdf", b"z" * 100)
+
+    assert store.get_file(second) is None
+    assert store.get_file(first) == b"x" * 100
+    assert store.get(first).structure.topic == "First"
+    assert store.put(make_structure("Huge"), "pdf", b"h" * 201) is None
+    assert store.stats()["entries"] == 2
+
+def test_store_opens_lazily_and_disables_itself_on_unusable_path(tmp_path):
+    path = tmp_path / "decks.sqlite3"
+    store = DeckStore(str(path))
+    assert not path.exists()  # nothing touched at construction (i.e. at app import)
+
+    broken = DeckStore(str(tmp_path / "missing" / "decks.sqlite3"))
+    assert broken.put(make_structure("Lost"), "pdf", b"x") is None
+    assert broken.get_file("anything") is None
+    assert not broken.available
+    assert broken.stats()["entries"] == 0
+
+    assert store.put(make_structure("Kept"), "pdf", b"x") is not None
+    assert path.exists()
+
+@pytest.mark.asyncio
+async def test_repeat_renders_are_served_from_the_store(monkeypatch):
+    builds = 0
+    real_render_sync = renderer._render_sync
+
+    def counting_render_sync(structure, output_type):
+        nonlocal builds
+        builds += 1
+        return real_render_sync(structure, output_type)
+
+    monkeypatch.setattr(renderer, "_render_sync", counting_render_sync)
+    structure = make_structure("Stored")
+    first = await renderer.render_presentation(structure, "pdf")
+    second = await renderer.render_presentation(structure, "pdf")
+    assert builds == 1
+    assert first.getvalue() == second.getvalue()
+
+@pytest.mark.asyncio
+async def test_only_stored_renders_get_a_deck_id(image_server, monkeypatch):
+    base_url, _ = image_server
+    broken = PresentationStructure(topic="T", slides=[{"title": "One", "points": ["Point"], "image_url": f"{base_url}/missing.png"}])
+    _, stored_id = await renderer.render_deck(broken, "pptx")
+    assert stored_id is None  # text-only fallback for the image: not kept
+    assert renderer.deck_store.get_file(deck_id(broken, "pptx")) is None
+
+    working = PresentationStructure(topic="T", slides=[{"title": "One", "points": ["Point"], "image_url": f"{base_url}/img/one.png"}])
+    _, stored_id = await renderer.render_deck(working, "pptx")
+    assert stored_id == deck_id(working, "pptx")
+
+    monkeypatch.setattr(renderer.deck_store, "max_deck_bytes", 10)
+    _, stored_id = await renderer.render_deck(make_structure("Too big"), "pdf")
+    assert stored_id is None
+
+@pytest.mark.asyncio
+async def test_generated_deck_can_be_downloaded_again():
+    from app.core.limiter import limiter
+    limiter.reset()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/generate", json={"text": "Plate tectonics", "slideCount": 2})
+        data = response.json()["data"]
+
+        meta = await client.get(f"/api/v1/decks/{data['deckId']}")
+        assert meta.status_code == 200
+        assert meta.json()["data"]["structure"] == data["structure"]
+
+        file = await client.get(f"/api/v1/decks/{data['deckId']}/file")
+        assert file.status_code == 200
+        assert file.headers["content-type"] == data["contentType"]
+        assert file.content.startswith(b"PK")
+
+        assert (await client.get("/api/v1/decks/unknown")).status_code == 404
@@ -0,0 +1,48 @@
+import threading
+from app.schemas.presentation import Diagram
+from app.services.diagram_renderer import DiagramRenderer
+
+BAR = Diagram(type="bar_chart", title="Share of energy (%)", labels=["Solar", "Wind", "Hydro"], values=[12, 21, 15])
+
+def test_renders_every_diagram_type():
+    renderer = DiagramRenderer(max_workers=2, dpi=50)
+    diagrams = [
+        BAR,
+        Diagram(type="line_chart", labels=["2020", "2021", "2022"], values=[1, 3, 2]),
+        Diagram(type="pie_chart", labels=["Yes", "No"], values=[70, 30]),
+        Diagram(type="timeline", labels=["Printing press", "Telegraph"], values=[1440, 1837]),
+        Diagram(type="flowchart", labels=["Collect", "Clean", "Train", "Deploy"]),
+    ]
+    for diagram in diagrams:
+        assert renderer.render(diagram, 4, 3).startswith(b"\x89PNG")
+    assert b"<svg" in renderer.render(BAR, 4, 3, fmt="svg")
+
+def test_renders_are_cached_by_data_and_size():
+    renderer = DiagramRenderer(max_workers=2, dpi=50)
+    first = renderer.render(BAR, 4, 3)
+    assert renderer.render(BAR, 4, 3) is first
+    assert renderer.render(BAR, 5, 3) is not first
+    assert renderer.render(BAR.model_copy(update={"values": [1, 2, 3]}), 4, 3) is not first
+    assert renderer.stats()["hits"] == 1
+
+def test_prepare_lines_up_with_slides_and_renders_duplicates_once(monkeypatch):
+    renderer = DiagramRenderer(max_workers=4, dpi=50)
+    threads = set()
+    draw = renderer.draw
+
+    def tracking_draw(*args, **kwargs):
+        threads.add(threading.current_thread().name)
+        return draw(*args, **kwargs)
+    monkeypatch.setattr(renderer, "draw", tracking_draw)
+
+    pie = Diagram(type="pie_chart", labels=["A", "B"], values=[1, 1])
+    charts = renderer.prepare([BAR, None, pie, BAR], 4, 3)
+    assert charts[1] is None
+    assert charts[0] is charts[3] and charts[2].startswith(b"\x89PNG")
+    assert len(threads) >= 1 and all(name.startswith("diagram-render") for name in threads)
+    assert renderer.stats()["entries"] == 2
+
+def test_cache_is_bounded():
+    renderer = DiagramRenderer(max_workers=1, dpi=50, max_cache_bytes=1)
+    assert renderer.render(BAR, 4, 3) is not None
+    assert renderer.stats()["entries"] == 0
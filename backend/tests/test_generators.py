@@ -1,6 +1,9 @@
 import pytest
-from app.services.ppt_generator import ppt_generator
-from app.services.pdf_generator import pdf_generator
+from pptx import Presentation
+from app.services.ppt_builder import ppt_generator, PPTGenerator
+from app.services.pdf_builder import pdf_generator
+from app.services.image_fetcher import ImageFetcher
+from app.services.image_processor import ImagePipeline
 from app.schemas.presentation import PresentationStructure
 
 @pytest.fixture
@@ -51,3 +54,115 @@ def test_pdf_with_many_slides():
     structure = PresentationStructure(topic="Large Document", slides=slides)
     result = pdf_generator.generate(structure)
     assert result.getbuffer().nbytes > 0
+
+def test_ppt_embeds_prefetched_images_and_skips_failed_ones(image_server):
+    """Test that slides get pictures from the prefetch stage and fall back to text-only"""
+    base_url, _ = image_server
+    generator = PPTGenerator(images=ImagePipeline(ImageFetcher(max_workers=2, timeout=2, deadline=2), cache=None))
+    structure = PresentationStructure(
+        topic="Images",
+        slides=[
+            {"title": "With Image", "points": ["Point"], "image_url": f"{base_url}/img/a"},
+            {"title": "Broken Image", "points": ["Point"], "image_url": f"{base_url}/missing"}
+        ]
+    )
+    prs = Presentation(generator.generate(structure))
+    pictures = [
+        [shape for shape in slide.shapes if shape.shape_type == 13]  # MSO_SHAPE_TYPE.PICTURE
+        for slide in prs.slides
+    ]
+    assert [len(p) for p in pictures] == [0, 1, 0, 0]
+
+def test_pdf_embeds_prefetched_images(image_server):
+    """Test that the PDF builder embeds image bytes from the shared fetcher"""
+    from app.services.pdf_builder import PDFGenerator
+    base_url, server = image_server
+    generator = PDFGenerator(images=ImagePipeline(ImageFetcher(max_workers=2, timeout=2, deadline=2), cache=None))
+    structure = PresentationStructure(
+        topic="Images",
+        slides=[{"title": "With Image", "points": ["Point"], "image_url": f"{base_url}/img/a"}]
+    )
+    result = generator.generate(structure)
+    assert b"/Subtype /Image" in result.getvalue()
+    assert server.hits == ["/img/a"]
+
+def test_ppt_custom_template_drops_sample_slides(tmp_path):
+    """Test that a branded template is used for layouts only and decks keep their slide order"""
+    template = Presentation()
+    sample = template.slides.add_slide(template.slide_layouts[1])
+    sample.shapes.title.text = "Sample slide shipped with the template"
+    template_path = tmp_path / "branded.pptx"
+    template.save(template_path)
+
+    generator = PPTGenerator(template_path=str(template_path))
+    structure = PresentationStructure(topic="Branded", slides=[{"title": "Only Slide", "points": ["Point"]}])
+    for _ in range(2):  # the prototype must not be mutated between requests
+        prs = Presentation(generator.generate(structure))
+        assert [slide.shapes.title.text for slide in prs.slides] == ["Branded", "Only Slide", "Thank You!"]
+
+def test_ppt_replace_slide_patches_one_slide(image_server):
+    """Test that replacing a slide keeps the other slides (and their images) as rendered"""
+    base_url, server = image_server
+    generator = PPTGenerator(images=ImagePipeline(ImageFetcher(max_workers=2, timeout=2, deadline=2), cache=None))
+    structure = PresentationStructure(
+        topic="Patch",
+        slides=[
+            {"title": "First", "points": ["Point"], "image_url": f"{base_url}/img/a"},
+            {"title": "Second", "points": ["Point"]},
+            {"title": "Third", "points": ["Point"]}
+        ]
+    )
+    deck = generator.generate(structure).getvalue()
+    deck = generator.replace_slide(deck, 1, structure.slides[1].model_copy(update={"title": "Second v2"})).getvalue()
+    # Patching twice must not clash with the previous replacement's part names
+    prs = Presentation(generator.replace_slide(deck, 1, structure.slides[1].model_copy(update={"title": "Second v3"})))
+
+    assert [slide.shapes.title.text for slide in prs.slides] == ["Patch", "First", "Second v3", "Third", "Thank You!"]
+    assert [shape.shape_type for shape in prs.slides[1].shapes].count(13) == 1
+    assert server.hits == ["/img/a"]  # the untouched slide's image was not fetched again
+
+def test_ppt_replace_slide_rejects_bad_index(sample_structure):
+    deck = ppt_generator.generate(sample_structure).getvalue()
+    with pytest.raises(IndexError):
+        ppt_generator.replace_slide(deck, 2, sample_structure.slides[0])
+
+def test_builders_embed_diagrams(monkeypatch):
+    """Test that PPTX gets a native chart (no matplotlib) and PDF the rendered chart picture"""
+    from app.services.pdf_builder import PDFGenerator
+    from app.services.diagram_renderer import diagram_renderer
+    images = ImagePipeline(ImageFetcher(max_workers=1, timeout=1, deadline=1), cache=None)
+    structure = PresentationStructure(
+        topic="Charts",
+        slides=[
+            {"title": "Growth", "points": ["Point"], "diagram": {"type": "bar_chart", "labels": ["2023", "2024"], "values": [3, 5]}},
+            {"title": "Plain", "points": ["Point"]}
+        ]
+    )
+
+    def no_raster(*args, **kwargs):
+        raise AssertionError("PPTX diagrams must not be rasterized")
+    with monkeypatch.context() as patch:
+        patch.setattr(diagram_renderer, "draw", no_raster)
+        prs = Presentation(PPTGenerator(images=images).generate(structure))
+    charts = [[shape.chart for shape in slide.shapes if shape.has_chart] for slide in prs.slides]
+    assert [len(c) for c in charts] == [0, 1, 0, 0]
+    assert list(charts[1][0].plots[0].categories) == ["2023", "2024"]
+    assert list(charts[1][0].series[0].values) == [3, 5]
+
+    assert b"/Subtype /Image" in PDFGenerator(images=images).generate(structure).getvalue()
+
+@pytest.mark.parametrize("diagram, shapes", [
+    ({"type": "pie_chart", "labels": ["A", "B", "C"], "values": [50, 30, 20]}, 1),
+    ({"type": "line_chart", "labels": ["Q1", "Q2"], "values": [1, 2]}, 1),
+    # title + axis + (marker, label) per event
+    ({"type": "timeline", "title": "Milestones", "labels": ["Draft", "Vote", "Law"], "values": [1990, 1992, 1999]}, 8),
+    # boxes + arrows, laid out vertically beyond four steps
+    ({"type": "flowchart", "labels": ["Collect", "Clean", "Train", "Test", "Deploy"]}, 9),
+])
+def test_ppt_native_diagram_types(diagram, shapes):
+    """Test that every diagram type becomes native chart / shape objects"""
+    structure = PresentationStructure(topic="Diagrams", slides=[{"title": "Visual", "points": ["Point"], "diagram": diagram}])
+    slide = Presentation(ppt_generator.generate(structure)).slides[1]
+    extra = [shape for shape in slide.shapes if not shape.is_placeholder]
+    assert len(extra) == shapes
+    assert all(shape.shape_type != 13 for shape in extra)  # no pictures
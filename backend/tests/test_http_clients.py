@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+import pytest
+from app.core.http_clients import HTTPClientRegistry
+from app.core.metrics import OUTBOUND_CONNECTIONS, OUTBOUND_REQUESTS
+from benchmarks.bench_pipeline import _free_port
+from benchmarks.fake_openai_server import FakeServerConfig, create_app
+
+
+@pytest.fixture
+def fake_server():
+    """The benchmark's fake OpenAI server on a real socket, so TCP connections can be counted."""
+    import uvicorn
+
+    port = _free_port()
+    app = create_app(FakeServerConfig(latency=0.01, jitter=0, low_score_rate=0, seed=1))
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}/v1", app.state.stats
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_one_client_per_name_until_closed():
+    registry = HTTPClientRegistry(connect_timeout=2, read_timeout=10)
+    client = registry.get("openai")
+    assert registry.get("openai") is client
+    assert registry.get("images") is not client
+    assert client.timeout.connect == 2 and client.timeout.read == 10
+
+    await registry.aclose()
+    assert client.is_closed
+    assert registry.get("openai") is not client
+    await registry.aclose()
+
+@pytest.mark.asyncio
+async def test_burst_reuses_pooled_connections(fake_server):
+    from openai import AsyncOpenAI
+
+    base_url, stats = fake_server
+    registry = HTTPClientRegistry(max_connections=4, max_keepalive_connections=4)
+    client = AsyncOpenAI(api_key="test", base_url=base_url, max_retries=0, http_client=registry.get("reuse-test"))
+    messages = [{"role": "user", "content": "Create content for ONE PowerPoint slide.\n\nSLIDE TITLE:\nPools\n"}]
+
+    await asyncio.gather(*[client.chat.completions.create(model="gpt-4o-mini", messages=messages) for _ in range(20)])
+    await registry.aclose()
+
+    assert OUTBOUND_REQUESTS.value(client="reuse-test") == 20
+    assert len(stats.connections) <= 4
+    assert OUTBOUND_CONNECTIONS.value(client="reuse-test") == len(stats.connections)
+
+@pytest.mark.asyncio
+async def test_app_shutdown_closes_shared_clients():
+    from app.core.http_clients import http_clients
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        client = http_clients.get("openai")
+    assert client.is_closed
+    assert http_clients.stats()["clients"] == 0
@@ -0,0 +1,61 @@
+from app.services.image_cache import ImageCache
+from app.services.image_fetcher import ImageFetcher
+
+def test_memory_and_disk_tiers(tmp_path):
+    cache = ImageCache(str(tmp_path), max_disk_bytes=1000, max_memory_bytes=1000)
+    cache.put("http://img/a", b"a" * 10)
+    assert cache.get("http://img/a") == b"a" * 10
+    assert cache.get("http://img/missing") is None
+
+    # A fresh instance has an empty hot tier but finds the entry on disk
+    reloaded = ImageCache(str(tmp_path), max_disk_bytes=1000, max_memory_bytes=1000)
+    assert reloaded.get("http://img/a") == b"a" * 10
+    stats = reloaded.stats()
+    assert stats["disk_hits"] == 1
+    assert stats["disk_bytes"] == 10
+
+def test_disk_lru_eviction(tmp_path):
+    cache = ImageCache(str(tmp_path), max_disk_bytes=250, max_memory_bytes=0)
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"x" * 100)
+    assert cache.get("a") is not None  # "a" is now most recently used
+    cache.put("c", b"x" * 100)         # over budget: "b" goes
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["disk_bytes"] == 200
+    assert len(list(tmp_path.iterdir())) == 2
+
+def test_disk_tier_is_created_on_first_write_and_falls_back_to_memory(tmp_path):
+    directory = tmp_path / "images"
+    cache = ImageCache(str(directory))
+    assert cache.get("a") is None
+    assert not directory.exists()
+    cache.put("a", b"x" * 10)
+    assert len(list(directory.iterdir())) == 1
+
+    (tmp_path / "taken").write_bytes(b"")  # a file where the directory should go
+    unusable = ImageCache(str(tmp_path / "taken" / "images"))
+    unusable.put("a", b"x" * 10)
+    assert unusable.directory is None
+    assert unusable.get("a") == b"x" * 10
+
+def test_memory_tier_is_byte_bounded():
+    cache = ImageCache(None, max_memory_bytes=150)
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"x" * 100)
+    assert cache.get("a") is None
+    assert cache.stats()["memory_bytes"] == 100
+
+def test_repeat_prefetch_skips_network(image_server, tmp_path):
+    base_url, server = image_server
+    fetcher = ImageFetcher(max_workers=2, timeout=2, deadline=2, cache=ImageCache(str(tmp_path)))
+    urls = [f"{base_url}/img/a", f"{base_url}/img/b"]
+
+    first = fetcher.prefetch(urls)
+    second = fetcher.prefetch(urls)
+
+    assert first == second
+    assert len(server.hits) == 2
+    assert fetcher.cache.stats()["hit_rate"] == 0.5
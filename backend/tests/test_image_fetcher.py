@@ -0,0 +1,31 @@
+import time
+from app.services.image_fetcher import ImageFetcher
+from tests.conftest import make_png
+
+def test_prefetch_downloads_distinct_urls_concurrently(image_server):
+    base_url, server = image_server
+    fetcher = ImageFetcher(max_workers=4, timeout=5, deadline=5)
+    urls = [f"{base_url}/img/{i}" for i in range(4)] + [f"{base_url}/img/0", None]
+
+    images = fetcher.prefetch(urls)
+
+    assert len(images) == 4
+    assert all(data == make_png() for data in images.values())
+    assert sorted(server.hits) == sorted(f"/img/{i}" for i in range(4))
+
+def test_prefetch_reports_failures_as_none(image_server):
+    base_url, _ = image_server
+    fetcher = ImageFetcher(max_workers=2, timeout=5, deadline=5)
+    images = fetcher.prefetch([f"{base_url}/missing.png", "http://127.0.0.1:1/unreachable.png"])
+    assert images == {f"{base_url}/missing.png": None, "http://127.0.0.1:1/unreachable.png": None}
+
+def test_prefetch_respects_overall_deadline(image_server):
+    base_url, _ = image_server
+    fetcher = ImageFetcher(max_workers=4, timeout=5, deadline=0.5)
+
+    start = time.time()
+    images = fetcher.prefetch([f"{base_url}/img/fast", f"{base_url}/slow/1"])
+
+    assert time.time() - start < 1.5
+    assert images[f"{base_url}/img/fast"] is not None
+    assert images[f"{base_url}/slow/1"] is None
@@ -0,0 +1,39 @@
+import io
+from PIL import Image
+from app.services.image_cache import ImageCache
+from app.services.image_fetcher import ImageFetcher
+from app.services.image_processor import ImagePipeline, normalize_image
+from tests.conftest import make_png
+
+def test_normalize_downsamples_to_exact_box():
+    original = make_png(3000, 2000)
+    data = normalize_image(original, 4, 2.5, dpi=100)
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.size == (400, 250)
+        assert img.format == "JPEG"
+    assert len(data) < len(original)
+
+def test_normalize_keeps_transparency_as_png():
+    buffer = io.BytesIO()
+    Image.new("RGBA", (50, 50), (0, 0, 0, 0)).save(buffer, format="PNG")
+    data = normalize_image(buffer.getvalue(), 1, 1, dpi=20)
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.format == "PNG"
+        assert img.size == (20, 20)
+
+def test_normalize_rejects_garbage():
+    assert normalize_image(b"not an image", 1, 1) is None
+
+def test_pipeline_caches_per_target_size(image_server, tmp_path):
+    base_url, server = image_server
+    pipeline = ImagePipeline(ImageFetcher(max_workers=2, timeout=2, deadline=2), ImageCache(str(tmp_path)), dpi=50)
+    url = f"{base_url}/img/a"
+
+    small = pipeline.prepare([url], 1, 1)[url]
+    assert pipeline.prepare([url], 1, 1)[url] == small
+    assert len(server.hits) == 1
+
+    large = pipeline.prepare([url], 2, 1)[url]
+    with Image.open(io.BytesIO(large)) as img:
+        assert img.size == (100, 50)
+    assert len(server.hits) == 2
@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+import time
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.schemas.job import Job
+from app.services.job_queue import SQLiteJobStore, InMemoryJobStore
+
+@pytest.mark.asyncio
+async def test_job_lifecycle():
+    """Test that a job is accepted immediately and its file can be downloaded once done"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/jobs",
+            json={"text": "The water cycle", "slideCount": 2, "type": "pdf"}
+        )
+        assert response.status_code == 202
+        job_id = response.json()["data"]["jobId"]
+
+        early = await client.get(f"/api/v1/jobs/{job_id}/file")
+        assert early.status_code in [200, 409]
+
+        for _ in range(50):
+            status = (await client.get(f"/api/v1/jobs/{job_id}")).json()["data"]["status"]
+            if status in ("succeeded", "failed"):
+                break
+            await asyncio.sleep(0.1)
+        assert status == "succeeded"
+
+        download = await client.get(f"/api/v1/jobs/{job_id}/file")
+        assert download.status_code == 200
+        assert download.headers["content-type"] == "application/pdf"
+        assert download.content.startswith(b"%PDF")
+
+@pytest.mark.asyncio
+async def test_unknown_job_returns_404():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/jobs/does-not-exist")
+        assert response.status_code == 404
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path: InMemoryJobStore(max_jobs=2),
+    lambda tmp_path: SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), max_jobs=2),
+])
+def test_job_store_roundtrip_and_retention(tmp_path, make_store):
+    store = make_store(tmp_path)
+    for i in range(3):
+        store.create(Job(id=f"job-{i}", request={"text": "t"}, created_at=time.time() + i, updated_at=0))
+    assert store.get("job-0") is None  # oldest evicted
+
+    store.update("job-2", status="succeeded", filename="presentation.pptx")
+    store.save_file("job-2", b"deck")
+    job = store.get("job-2")
+    assert job.status == "succeeded"
+    assert job.filename == "presentation.pptx"
+    assert store.get_file("job-2") == b"deck"
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path: InMemoryJobStore(),
+    lambda tmp_path: SQLiteJobStore(str(tmp_path / "jobs.sqlite3")),
+])
+def test_job_store_claims_oldest_queued_once_and_fails_stale(tmp_path, make_store):
+    store = make_store(tmp_path)
+    now = time.time()
+    for i in range(2):
+        store.create(Job(id=f"job-{i}", request={"text": "t"}, created_at=now + i, updated_at=now))
+
+    assert store.claim_next().id == "job-0"
+    assert store.claim_next().id == "job-1"
+    assert store.claim_next() is None
+
+    time.sleep(0.01)
+    cutoff = time.time()
+    time.sleep(0.01)
+    store.update("job-1")  # heartbeat
+    assert store.fail_stale(before=cutoff) == 1
+    assert store.get("job-0").status == "failed"
+    assert store.get("job-1").status == "running"
+
+@pytest.mark.asyncio
+async def test_workers_run_jobs_queued_by_another_process(tmp_path):
+    from app.services.job_queue import JobQueue
+    path = str(tmp_path / "jobs.sqlite3")
+    submitting_process = SQLiteJobStore(path)
+    worker_process = SQLiteJobStore(path)
+    now = time.time()
+    submitting_process.create(Job(
+        id="job-x", request={"text": "The water cycle", "slideCount": 2, "type": "pdf"}, created_at=now, updated_at=now
+    ))
+
+    queue = JobQueue(worker_process, max_workers=1, poll_interval=0.05)
+    queue.start()
+    try:
+        for _ in range(100):
+            job = submitting_process.get("job-x")
+            if job.status in ("succeeded", "failed"):
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        await queue.stop()
+    assert job.status == "succeeded"
+    assert submitting_process.get_file("job-x").startswith(b"%PDF")
+
+@pytest.mark.asyncio
+async def test_worker_survives_a_store_error():
+    from app.services.job_queue import JobQueue
+
+    class FlakyStore(InMemoryJobStore):
+        failures = 2
+
+        def claim_next(self):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("database is locked")
+            return super().claim_next()
+
+    store = FlakyStore()
+    queue = JobQueue(store, max_workers=1, poll_interval=0.05)
+    job = await queue.submit({"text": "The water cycle", "slideCount": 2, "type": "pdf"})
+    try:
+        for _ in range(100):
+            if store.get(job.id).status in ("succeeded", "failed"):
+                break
+            await asyncio.sleep(0.05)
+        assert store.get(job.id).status == "succeeded"
+
+        # A worker task that died is replaced on the next start()
+        dead = queue._workers[0]
+        dead.cancel()
+        await asyncio.gather(dead, return_exceptions=True)
+        queue.start()
+        assert queue._workers[0] is not dead and not queue._workers[0].done()
+    finally:
+        await queue.stop()
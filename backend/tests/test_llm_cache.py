@@ -0,0 +1,109 @@
+import pytest
+from types import SimpleNamespace
+from openai.types.chat import ChatCompletion
+from app.core.llm_cache import LLMCache, CachedClient
+
+
+class CountingCompletions:
+    """Stands in for client.chat.completions and counts upstream calls"""
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return ChatCompletion.model_validate({
+            "id": f"cmpl-{self.calls}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": kwargs["model"],
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": f"answer {self.calls}"}
+            }]
+        })
+
+
+def make_client(cache):
+    completions = CountingCompletions()
+    raw = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return CachedClient(raw, cache), completions
+
+
+def test_make_key_is_stable_and_sensitive():
+    messages = [{"role": "user", "content": "Explain photosynthesis"}]
+    key = LLMCache.make_key("gpt-4o-mini", messages, 0.2, {"type": "json_object"})
+    assert key == LLMCache.make_key("gpt-4o-mini", list(messages), 0.2, {"type": "json_object"})
+    assert key != LLMCache.make_key("gpt-4o-mini", messages, 0.3, {"type": "json_object"})
+    assert key != LLMCache.make_key("gpt-4o", messages, 0.2, {"type": "json_object"})
+
+
+def test_lru_eviction_and_counters():
+    cache = LLMCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "a" becomes most recent
+    cache.set("c", "3")           # evicts "b"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 2
+
+
+def test_ttl_expiry():
+    cache = LLMCache(max_entries=10, ttl_seconds=-1)
+    cache.set("a", "1")
+    assert cache.get("a") is None
+
+
+def test_sqlite_tier_survives_new_memory_tier(tmp_path):
+    db_path = str(tmp_path / "llm_cache.sqlite3")
+    LLMCache(db_path=db_path).set("key", "value")
+    fresh = LLMCache(db_path=db_path)
+    assert fresh.get("key") == "value"
+    assert fresh.stats()["disk_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_opens_lazily_and_off_the_event_loop(tmp_path):
+    import threading
+    db_path = tmp_path / "llm_cache.sqlite3"
+    cache = LLMCache(db_path=str(db_path))
+    assert not db_path.exists()
+
+    threads = []
+    get = cache.get
+    cache.get = lambda key: threads.append(threading.get_ident()) or get(key)
+    client, completions = make_client(cache)
+    await client.chat.completions.create(model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}], temperature=0.2)
+
+    assert db_path.exists()
+    assert threads and threading.get_ident() not in threads
+
+
+def test_unusable_sqlite_path_falls_back_to_memory(tmp_path):
+    cache = LLMCache(db_path=str(tmp_path / "missing" / "llm_cache.sqlite3"))
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert not cache.available
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_hit_cache():
+    client, completions = make_client(LLMCache())
+    kwargs = dict(model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}], temperature=0.2)
+    first = await client.chat.completions.create(**kwargs)
+    second = await client.chat.completions.create(**kwargs)
+    assert completions.calls == 1
+    assert second.choices[0].message.content == first.choices[0].message.content
+
+
+@pytest.mark.asyncio
+async def test_hot_temperature_bypasses_cache():
+    client, completions = make_client(LLMCache())
+    kwargs = dict(model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}], temperature=0.4)
+    await client.chat.completions.create(**kwargs)
+    await client.chat.completions.create(**kwargs)
+    assert completions.calls == 2
@@ -0,0 +1,46 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.core.metrics import Registry, InstrumentedClient, STAGE_LATENCY, LLM_REQUESTS, SLIDE_FALLBACKS
+from app.core.config import settings
+from app.main import app
+from tests.fake_openai import FakeOpenAI, make_engine
+
+TOPIC = "How coral reefs form and why they are sensitive to ocean warming"
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    latency = registry.histogram("demo_seconds", "Demo latency", ["stage"], buckets=(0.1, 1))
+    latency.observe(0.05, stage="a")
+    latency.observe(0.5, stage="a")
+    latency.observe(5, stage="a")
+
+    text = registry.render()
+    assert 'demo_seconds_bucket{stage="a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{stage="a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="a"} 3' in text
+
+@pytest.mark.asyncio
+async def test_pipeline_records_stage_latency_and_fallbacks(monkeypatch):
+    monkeypatch.setattr(settings, "DECK_RETRY_BUDGET", 2)
+    client = InstrumentedClient(FakeOpenAI(score_for=lambda title: 10))
+    before_writes = STAGE_LATENCY.count(stage="write")
+    before_calls = LLM_REQUESTS.value(model="gpt-4o-mini", outcome="ok")
+    before_fallbacks = SLIDE_FALLBACKS.value()
+
+    await make_engine(client).generate_structure(TOPIC, 2)
+
+    # 2 slides x 3 attempts, every one rejected by the quality gate
+    assert STAGE_LATENCY.count(stage="write") - before_writes == 6
+    assert SLIDE_FALLBACKS.value() - before_fallbacks == 2
+    assert LLM_REQUESTS.value(model="gpt-4o-mini", outcome="ok") > before_calls
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_prometheus_text():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/api/v1/health")
+        response = await client.get("/api/v1/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE slidegenie_stage_duration_seconds histogram" in response.text
+    assert 'slidegenie_llm_cache{field="hit_rate"}' in response.text
@@ -0,0 +1,45 @@
+import pytest
+from pptx import Presentation
+from app.schemas.presentation import PresentationStructure
+from app.services import renderer
+from app.services.renderer import ProcessRenderer, render_presentation
+
+@pytest.fixture
+def structure():
+    return PresentationStructure(
+        topic="Rendering",
+        slides=[{"title": f"Slide {i}", "points": ["Point A", "Point B"]} for i in range(3)]
+    )
+
+@pytest.mark.asyncio
+async def test_process_renderer_returns_same_deck_as_threads(structure):
+    pool = ProcessRenderer(workers=1, max_tasks_per_child=2)
+    try:
+        pool.warm_up()
+        pptx_file, complete = await pool.render(structure, "pptx")
+        pdf_file, _ = await pool.render(structure, "pdf")
+    finally:
+        pool.shutdown()
+
+    assert complete
+    titles = [slide.shapes.title.text for slide in Presentation(pptx_file).slides]
+    assert titles == ["Rendering", "Slide 0", "Slide 1", "Slide 2", "Thank You!"]
+    assert pdf_file.getvalue().startswith(b"%PDF")
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_threads(structure, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    class BrokenRenderer(ProcessRenderer):
+        shutdowns = []
+
+        async def render(self, structure, output_type):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True):
+            self.shutdowns.append(wait)
+
+    monkeypatch.setattr(renderer, "process_renderer", BrokenRenderer())
+    result = await render_presentation(structure, "pdf")
+    assert result.getvalue().startswith(b"%PDF")
+    assert BrokenRenderer.shutdowns == [False]  # the event loop never waits on the dying pool
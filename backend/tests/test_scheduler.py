@@ -0,0 +1,104 @@
+import asyncio
+import httpx
+import openai
+import pytest
+from app.core.scheduler import OutboundScheduler, TokenBucket
+
+def rate_limit_error(code=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request, headers={"retry-after": "0"})
+    body = {"code": code, "type": code, "message": code} if code else None
+    return openai.RateLimitError(code or "rate_limit_exceeded", response=response, body=body)
+
+@pytest.mark.asyncio
+async def test_max_in_flight_is_enforced():
+    scheduler = OutboundScheduler(max_in_flight=3)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        peak = max(peak, scheduler.in_flight)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    results = await asyncio.gather(*[scheduler.run(call) for _ in range(20)])
+    assert results == ["ok"] * 20
+    assert peak == 3
+    assert scheduler.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_queued_calls_are_served_round_robin_across_decks():
+    scheduler = OutboundScheduler(max_in_flight=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def blocker():
+        await gate.wait()
+
+    def call_for(deck):
+        async def call():
+            order.append(deck)
+        return call
+
+    first = asyncio.create_task(scheduler.run(blocker, key="busy"))
+    await asyncio.sleep(0)
+    # Deck "a" floods the queue before deck "b" submits anything
+    tasks = [asyncio.create_task(scheduler.run(call_for("a"), key="a")) for _ in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(scheduler.run(call_for("b"), key="b")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    gate.set()
+    await asyncio.gather(first, *tasks)
+    assert order == ["a", "b", "a", "b", "a"]
+
+@pytest.mark.asyncio
+async def test_rate_limit_errors_are_retried_with_backoff():
+    scheduler = OutboundScheduler(max_in_flight=2, max_retries=3, backoff_base=0.001)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise rate_limit_error()
+        return "ok"
+
+    assert await scheduler.run(flaky) == "ok"
+    assert attempts == 3
+    assert scheduler.stats() == {"in_flight": 0, "queued": 0, "retries": 2}
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded():
+    scheduler = OutboundScheduler(max_retries=1, backoff_base=0.001)
+
+    async def always_limited():
+        raise rate_limit_error()
+
+    with pytest.raises(openai.RateLimitError):
+        await scheduler.run(always_limited)
+    assert scheduler.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_insufficient_quota_is_not_retried():
+    scheduler = OutboundScheduler(max_retries=3, backoff_base=0.001)
+    attempts = 0
+
+    async def out_of_quota():
+        nonlocal attempts
+        attempts += 1
+        raise rate_limit_error("insufficient_quota")
+
+    with pytest.raises(openai.RateLimitError):
+        await scheduler.run(out_of_quota)
+    assert attempts == 1
+    assert scheduler.stats()["retries"] == 0
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_once_empty():
+    bucket = TokenBucket(rate_per_minute=600)  # 10 per second
+    await bucket.consume(600)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await bucket.consume(2)
+    assert loop.time() - start >= 0.15
@@ -30,3 +30,14 @@ def test_empty_slides_allowed():
     """Test that empty slides list is technically allowed by schema (validation happens at API level)"""
     presentation = PresentationStructure(topic="Test", slides=[])
     assert len(presentation.slides) == 0
+
+def test_diagram_values_must_match_labels():
+    """Test that charts need one value per label, while flowcharts may have none"""
+    from pydantic import ValidationError
+    from app.schemas.presentation import Diagram
+
+    assert Diagram(type="flowchart", labels=["Collect", "Clean", "Train"]).values == []
+    with pytest.raises(ValidationError):
+        Diagram(type="bar_chart", labels=["A", "B"], values=[1.0])
+    with pytest.raises(ValidationError):
+        Diagram(type="pie_chart", labels=["A", "B"], values=[-1.0, 2.0])
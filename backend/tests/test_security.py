@@ -149,6 +149,11 @@ async def test_cors_headers():
         # Just ensure the endpoint works - CORS headers are added by middleware
         assert response.status_code == 200
 
+        # The frontend's origin can read the download headers
+        response = await client.get("/api/v1/health", headers={"Origin": "https://slidegenie.vercel.app"})
+        exposed = response.headers["access-control-expose-headers"]
+        assert "X-Presentation-Structure" in exposed and "Content-Disposition" in exposed
+
 @pytest.mark.asyncio
 async def test_null_values():
     """Test that null values are handled properly"""
@@ -158,3 +163,23 @@ async def test_null_values():
             json={"text": None, "slideCount": 3, "type": "pptx"}
         )
         assert response.status_code == 422  # Validation error
+
+@pytest.mark.asyncio
+async def test_regenerate_ignores_client_image_urls(image_server, monkeypatch):
+    """Test that an inline structure cannot make the server fetch arbitrary URLs (SSRF)"""
+    from app.core.config import settings
+    base_url, server = image_server
+    monkeypatch.setattr(settings, "IMAGE_SOURCE_URL", f"{base_url}/img/{{query}}")
+    structure = {
+        "topic": "Plate tectonics",
+        "slides": [
+            {"title": "Plates", "points": ["Earth's crust is split into plates"]},
+            {"title": "Boundaries", "points": ["Plates meet"], "image_url": f"{base_url}/internal/admin?secret"}
+        ]
+    }
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/generate/slide", json={"structure": structure, "slideIndex": 0})
+        assert response.status_code == 200
+        slides = response.json()["data"]["structure"]["slides"]
+        assert slides[1]["image_url"] == f"{base_url}/img/Boundaries"
+    assert server.hits == ["/img/Boundaries"]
@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from app.core.single_flight import SingleFlight
+from app.schemas.presentation import PresentationStructure
+from app.services import renderer
+from tests.fake_openai import FakeOpenAI, make_engine
+
+TOPIC = "Introduction to plate tectonics and the forces that move continents"
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_computation():
+    flights = SingleFlight()
+    runs = 0
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*[flights.do("key", work) for _ in range(5)])
+    assert results == ["result"] * 5
+    assert runs == 1
+    assert flights.stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+
+    # Once finished, the next call starts fresh work
+    await flights.do("key", work)
+    assert runs == 2
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    flights = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ValueError("pipeline failed")
+
+    results = await asyncio.gather(*[flights.do("key", boom) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+
+@pytest.mark.asyncio
+async def test_identical_generations_coalesce():
+    client = FakeOpenAI(latency=0.01)
+    engine = make_engine(client)
+
+    same = await asyncio.gather(*[engine.generate_structure(TOPIC, 3) for _ in range(4)])
+    assert client.chat.completions.calls["plan"] == 1
+    assert all(s == same[0] for s in same)
+    assert same[0] is not same[1]  # callers get independent copies
+
+    await asyncio.gather(engine.generate_structure(TOPIC, 3), engine.generate_structure(TOPIC, 4))
+    assert client.chat.completions.calls["plan"] == 3
+
+@pytest.mark.asyncio
+async def test_identical_renders_coalesce(monkeypatch):
+    builds = 0
+    real_render_sync = renderer._render_sync
+
+    def counting_render_sync(structure, output_type):
+        nonlocal builds
+        builds += 1
+        return real_render_sync(structure, output_type)
+
+    monkeypatch.setattr(renderer, "_render_sync", counting_render_sync)
+    structure = PresentationStructure(topic="Shared", slides=[{"title": "One", "points": ["Point"]}])
+    files = await asyncio.gather(*[renderer.render_presentation(structure, "pdf") for _ in range(3)])
+
+    assert builds == 1
+    assert len({f.getvalue() for f in files}) == 1
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from app.core.config import settings
+
+
+def test_app_import_defers_heavy_libraries():
+    """Test that importing the app (what a cold start pays) loads no AI / rendering library"""
+    heavy = ("openai", "pptx", "reportlab", "matplotlib")
+    code = f"import sys, app.main; print([m for m in {heavy!r} if m in sys.modules])"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "[]"
+
+def test_app_import_opens_no_databases(tmp_path):
+    """Test that the SQLite-backed stores open their files on first use, not at import"""
+    env = {
+        **os.environ,
+        "JOB_STORE": "sqlite",
+        "JOB_DB_PATH": str(tmp_path / "jobs.sqlite3"),
+        "LLM_CACHE_DB_PATH": str(tmp_path / "llm_cache.sqlite3"),
+        "DECK_STORE_PATH": str(tmp_path / "decks.sqlite3"),
+    }
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", "import app.main"], cwd=backend, env=env, check=True)
+    assert list(tmp_path.iterdir()) == []
+
+def test_engine_builds_client_on_first_use(monkeypatch):
+    from app.services.content_engine import ContentEngine
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    engine = ContentEngine()
+    assert engine.client is None
+
+    engine.warm_up()
+    client = engine.client
+    assert client is not None and engine.planner.client is client
+    engine.warm_up()
+    assert engine.client is client
+
+def test_warm_up_builders_loads_renderers():
+    from app.services.renderer import warm_up_builders
+    warm_up_builders()
+    assert {"pptx", "reportlab", "matplotlib"} <= set(sys.modules)
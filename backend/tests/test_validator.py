@@ -0,0 +1,42 @@
+import pytest
+from app.core.config import settings
+from app.services.validator import Validator
+from tests.fake_openai import FakeOpenAI, make_engine
+
+GOOD_POINTS = [
+    "Chlorophyll absorbs red and blue light",
+    "Water splits, releasing oxygen as a byproduct",
+    "ATP and NADPH store the captured energy",
+]
+
+def test_forbidden_words_are_blocked():
+    assert not Validator.is_valid_slide_text("Growth Strategy", ["Plan ahead"])
+    assert not Validator.is_valid_slide_text("Results", ["Critical success factors"])
+    assert Validator.is_valid_slide_text("Light Reactions", GOOD_POINTS)
+
+def test_local_score_rewards_rule_following_slides():
+    assert Validator.local_score("Light Reactions", GOOD_POINTS, "How light reactions capture energy") == 100
+
+def test_local_score_penalises_filler_repetition_and_length():
+    repetitive = ["Various key aspect of the topic", "Various key aspect of the topic too", "Etc"]
+    assert Validator.local_score("Light Reactions", repetitive, "How light reactions capture energy") <= 40
+    assert Validator.local_score("Title", [f"Point {i} about title" for i in range(7)]) <= 40
+    assert Validator.local_score("Title", []) == 0
+
+def test_prescore_escalates_borderline_slides():
+    borderline = [f"Specific fact {j} about light reactions" for j in range(3)]
+    assert Validator.prescore("Light Reactions", borderline, "Explain light reactions", 75) is None
+    assert Validator.prescore("Light Reactions", GOOD_POINTS, "How light reactions capture energy", 75) == 100
+    # A stricter domain threshold than the local pass mark still goes to the remote scorer
+    assert Validator.prescore("Light Reactions", GOOD_POINTS, "How light reactions capture energy", 101) is None
+
+@pytest.mark.asyncio
+async def test_confident_slides_skip_remote_scoring(monkeypatch):
+    client = FakeOpenAI(bullets_for=lambda title: [f"{title} {fact}" for fact in GOOD_POINTS])
+    await make_engine(client).generate_structure("How plants turn sunlight into chemical energy", 3)
+    assert client.chat.completions.calls["score"] == 0
+
+    monkeypatch.setattr(settings, "LOCAL_PRESCORE_ENABLED", False)
+    client = FakeOpenAI(bullets_for=lambda title: [f"{title} {fact}" for fact in GOOD_POINTS])
+    await make_engine(client).generate_structure("How plants turn sunlight into chemical energy", 3)
+    assert client.chat.completions.calls["score"] == 3